@@ -0,0 +1,8 @@
+"""
+mongodb_evaluation_system 성능 벤치마크
+
+저장소 루트에서 모듈로 실행합니다:
+    python -m benchmarks.parallel_scaling
+    python -m benchmarks.hot_paths
+    python -m benchmarks.import_time
+"""
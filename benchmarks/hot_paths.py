@@ -0,0 +1,180 @@
+"""
+평가기 핫 패스 벤치마크
+
+합성 코퍼스 크기별로 evaluate(), _create_comparison_table(), _has_semantic_error(),
+_values_match(), 두 리포트 생성기의 호출당 지연(p50/p99), 처리량, 최대 메모리를 측정합니다.
+결과는 JSON으로 기록되어 버전 간 비교에 사용할 수 있습니다.
+
+    python -m benchmarks.hot_paths --sizes small medium -o bench.json
+    python -m benchmarks.hot_paths --sizes small --baseline bench.json
+
+시간 측정과 메모리 측정은 분리된 반복으로 수행합니다 (tracemalloc이 실행 속도를 떨어뜨리므로).
+각 대상 측정 전에 쿼리 파싱 캐시를 비웁니다.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Any, Callable, Iterable, Tuple
+
+import numpy as np
+
+from mongodb_evaluation_system import EVALUATOR_VERSION, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.query_ast import clear_parse_cache
+
+from .synthetic import CorpusConfig, make_corpus
+
+
+SIZES = {
+    "small": CorpusConfig(records=500, queries=2, keys=10, list_size=0, logs=2, mismatch_ratio=0.05),
+    "medium": CorpusConfig(records=300, queries=5, keys=50, list_size=20, logs=5, mismatch_ratio=0.1),
+    "large": CorpusConfig(records=100, queries=10, keys=200, list_size=200, logs=20, mismatch_ratio=0.2),
+}
+
+TARGETS = ("evaluate", "create_comparison_table", "has_semantic_error", "values_match",
+           "comprehensive_report", "simple_report")
+
+
+def _calls(target: str, evaluator: UniversalMongoDBEvaluator, corpus, metrics) -> List[Tuple[Callable, tuple]]:
+    """대상별 (함수, 인자) 호출 목록"""
+    if target == "evaluate":
+        return [(evaluator.evaluate, (result,)) for result in corpus]
+    if target == "create_comparison_table":
+        return [(evaluator._create_comparison_table, (result,)) for result in corpus]
+    if target == "has_semantic_error":
+        return [(evaluator._has_semantic_error, (query, result))
+                for result in corpus for query in result.mongodb_queries]
+    if target == "values_match":
+        return [(evaluator._values_match, (value, result.direct_mongodb_results[key]))
+                for result in corpus for key, value in result.calculation_results.items()]
+    if target == "comprehensive_report":
+        return [(evaluator.generate_comprehensive_report, (m, result)) for m, result in zip(metrics, corpus)]
+    if target == "simple_report":
+        return [(evaluator.generate_simple_report, (m, result)) for m, result in zip(metrics, corpus)]
+    raise ValueError(f"알 수 없는 벤치마크 대상: {target}")
+
+
+def _time_calls(calls: List[Tuple[Callable, tuple]], warmup: int) -> np.ndarray:
+    for func, args in calls[:warmup]:
+        func(*args)
+    clear_parse_cache()
+    timings = np.empty(len(calls), dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i, (func, args) in enumerate(calls):
+        start = clock()
+        func(*args)
+        timings[i] = clock() - start
+    return timings
+
+
+def _peak_memory(calls: List[Tuple[Callable, tuple]]) -> int:
+    """호출 목록 전체 실행 중 증가한 최대 메모리 (바이트, 반환값은 즉시 버림)"""
+    clear_parse_cache()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for func, args in calls:
+            func(*args)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: Iterable[str], targets: Iterable[str] = TARGETS, warmup: int = 20,
+        measure_memory: bool = True, seed: int = 0) -> Dict[str, Any]:
+    evaluator = UniversalMongoDBEvaluator()
+    rows = []
+    for size in sizes:
+        config = CorpusConfig(**{**SIZES[size].to_dict(), "seed": seed})
+        corpus = make_corpus(config)
+        metrics = [evaluator.evaluate(result) for result in corpus]
+        for m in metrics:
+            m.comparison_table   # 리포트 측정에서 지연 테이블 생성 비용 제외
+
+        for target in targets:
+            calls = _calls(target, evaluator, corpus, metrics)
+            timings = _time_calls(calls, warmup)
+            seconds = timings.sum() / 1e9
+            row = {
+                "size": size,
+                "target": target,
+                "calls": len(calls),
+                "seconds": round(float(seconds), 6),
+                "calls_per_second": round(len(calls) / seconds, 1) if seconds else None,
+                "p50_us": round(float(np.percentile(timings, 50)) / 1e3, 3),
+                "p99_us": round(float(np.percentile(timings, 99)) / 1e3, 3),
+                "peak_memory_kb": round(_peak_memory(calls) / 1024, 1) if measure_memory else None,
+                "config": config.to_dict(),
+            }
+            rows.append(row)
+
+    return {
+        "meta": {
+            "evaluator_version": EVALUATOR_VERSION,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": rows,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """이전 실행 결과 대비 변화율 (p50, 처리량, 메모리 - 1.0 초과면 느려지거나 늘어남)"""
+    previous = {(row["size"], row["target"]): row for row in baseline["results"]}
+    changes = []
+    for row in current["results"]:
+        base = previous.get((row["size"], row["target"]))
+        if base is None:
+            continue
+        change = {"size": row["size"], "target": row["target"]}
+        change["p50_ratio"] = round(row["p50_us"] / base["p50_us"], 3) if base["p50_us"] else None
+        change["p99_ratio"] = round(row["p99_us"] / base["p99_us"], 3) if base["p99_us"] else None
+        change["throughput_ratio"] = (round(base["calls_per_second"] / row["calls_per_second"], 3)
+                                      if row["calls_per_second"] and base["calls_per_second"] else None)
+        change["memory_ratio"] = (round(row["peak_memory_kb"] / base["peak_memory_kb"], 3)
+                                  if row["peak_memory_kb"] and base["peak_memory_kb"] else None)
+        changes.append(change)
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="평가기 핫 패스 벤치마크")
+    parser.add_argument("--sizes", nargs="+", choices=sorted(SIZES), default=["small", "medium"],
+                        help="코퍼스 크기 프리셋")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS), help="측정 대상")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 호출 수")
+    parser.add_argument("--seed", type=int, default=0, help="코퍼스 생성 seed")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정 생략")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 경로 (기본: 표 출력)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.targets, warmup=args.warmup,
+                 measure_memory=not args.no_memory, seed=args.seed)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{'size':<8} {'target':<24} {'calls':>7} {'calls/s':>11} {'p50 µs':>9} {'p99 µs':>9} {'peak KB':>9}")
+    for row in report["results"]:
+        peak = f"{row['peak_memory_kb']:>9.1f}" if row["peak_memory_kb"] is not None else f"{'-':>9}"
+        print(f"{row['size']:<8} {row['target']:<24} {row['calls']:>7} {row['calls_per_second']:>11.1f} "
+              f"{row['p50_us']:>9.1f} {row['p99_us']:>9.1f} {peak}")
+
+    for change in report.get("comparison", []):
+        print(f"{change['size']:<8} {change['target']:<24} p50 x{change['p50_ratio']} "
+              f"p99 x{change['p99_ratio']} memory x{change['memory_ratio']}")
+
+
+if __name__ == "__main__":
+    main()
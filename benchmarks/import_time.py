@@ -0,0 +1,82 @@
+"""
+패키지 import 시간 예산 검사
+
+새 인터프리터에서 `import mongodb_evaluation_system`과 quick_evaluate() 한 번에 걸리는 시간을
+반복 측정하고, 중앙값이 예산을 넘거나 지연 로드 대상 모듈(pandas, NumPy 등)이
+기본 평가 경로에서 로드되면 종료 코드 1을 반환합니다. CI 회귀 검사로 사용합니다.
+
+    python -m benchmarks.import_time --budget-ms 150
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# 지표만 계산하는 기본 경로에서 로드되면 안 되는 모듈
+HEAVY_MODULES = ("pandas", "numpy", "sqlite3", "multiprocessing")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import mongodb_evaluation_system as package
+imported = time.perf_counter()
+metrics = package.quick_evaluate(
+    "사용자별 세션 비율 분석",
+    ["db.sessions.aggregate([{$group: {_id: '$user_id', total: {$sum: 1}}}])"],
+    {"session_rate": 0.42, "total_sessions": 1200},
+    [{"status": "success", "query_index": 0}],
+    {"session_rate": 0.42, "total_sessions": 1200},
+)
+evaluated = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1e3,
+    "first_evaluate_ms": (evaluated - imported) * 1e3,
+    "overall_pass": bool(metrics.overall_pass),
+    "heavy_modules": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure(repeat: int = 7):
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", _PROBE], check=True,
+                                capture_output=True, text=True).stdout
+        runs.append(json.loads(output))
+    return runs
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="패키지 import 시간 예산 검사")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="import + 첫 quick_evaluate() 중앙값 예산 (밀리초)")
+    parser.add_argument("--repeat", type=int, default=7, help="측정 반복 횟수 (새 인터프리터)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args(argv)
+
+    runs = measure(args.repeat)
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    total_ms = statistics.median(run["import_ms"] + run["first_evaluate_ms"] for run in runs)
+    heavy = sorted({name for run in runs for name in run["heavy_modules"]})
+    result = {
+        "import_ms": round(import_ms, 2),
+        "import_and_evaluate_ms": round(total_ms, 2),
+        "budget_ms": args.budget_ms,
+        "heavy_modules": heavy,
+        "passed": total_ms <= args.budget_ms and not heavy,
+    }
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"import: {import_ms:.1f} ms, import + 첫 평가: {total_ms:.1f} ms (예산 {args.budget_ms:.0f} ms)")
+        if heavy:
+            print(f"기본 평가 경로에서 로드된 무거운 모듈: {', '.join(heavy)}")
+        print("✅ 통과" if result["passed"] else "❌ 예산 초과")
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+병렬 평가 확장성 벤치마크
+
+워커 수별 evaluate_many() 처리 시간과 순차 실행 대비 속도 향상을 측정합니다.
+
+    python -m benchmarks.parallel_scaling --records 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+
+
+def make_results(n_records: int, n_keys: int = 40, seed: int = 0):
+    """재현 가능한 합성 분석 결과 생성"""
+    rng = random.Random(seed)
+    queries = [
+        "db.sessions.aggregate([{$group: {_id: '$user_id', total: {$sum: 1}}}])",
+        "db.orders.find({'status': 'paid', 'amount': {'$gt': 100}})",
+        "db.events.aggregate([{'$match': {'type': 'login'}}, {'$count': 'logins'}])",
+    ]
+
+    results = []
+    for _ in range(n_records):
+        calculation_results = {f"metric_{k}_rate" if k % 5 == 0 else f"metric_{k}": rng.uniform(0, 120)
+                               for k in range(n_keys)}
+        direct_mongodb_results = {key: value + rng.choice([0.0, 0.0, 0.5])
+                                  for key, value in calculation_results.items()}
+        results.append(UniversalAnalysisResult(
+            analysis_query="사용자별 세션 비율 분석",
+            mongodb_queries=queries,
+            calculation_results=calculation_results,
+            execution_logs=[{"status": "success", "query_index": i, "execution_time": 0.1}
+                            for i in range(len(queries))],
+            direct_mongodb_results=direct_mongodb_results
+        ))
+    return results
+
+
+def run(n_records: int, worker_counts, chunk_size=None, n_keys: int = 40):
+    evaluator = UniversalMongoDBEvaluator()
+    results = make_results(n_records, n_keys=n_keys)
+
+    rows = []
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        evaluated = evaluator.evaluate_many(results, workers=workers, chunk_size=chunk_size)
+        seconds = time.perf_counter() - start
+        assert len(evaluated) == n_records
+
+        baseline = baseline or seconds
+        rows.append({
+            "workers": workers,
+            "records": n_records,
+            "seconds": round(seconds, 4),
+            "records_per_second": round(n_records / seconds, 1),
+            "speedup": round(baseline / seconds, 2),
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="evaluate_many 워커 수별 확장성 벤치마크")
+    parser.add_argument("--records", type=int, default=5000, help="평가할 분석 결과 수")
+    parser.add_argument("--keys", type=int, default=40, help="분석 결과당 계산 결과 키 수")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}), help="측정할 워커 수 목록")
+    parser.add_argument("--chunk-size", type=int, default=None, help="청크 크기 (기본 자동)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args(argv)
+
+    rows = run(args.records, args.workers, chunk_size=args.chunk_size, n_keys=args.keys)
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'workers':>8} {'seconds':>10} {'records/s':>12} {'speedup':>8}")
+    for row in rows:
+        print(f"{row['workers']:>8} {row['seconds']:>10.3f} {row['records_per_second']:>12.1f} {row['speedup']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
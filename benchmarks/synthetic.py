@@ -0,0 +1,116 @@
+"""
+재현 가능한 합성 분석 결과 생성기
+
+쿼리 수, 결과 키 수, 중첩 리스트 크기, 로그 수, 불일치 비율을 조절해
+UniversalAnalysisResult 코퍼스를 만듭니다. 같은 설정과 seed는 항상 같은 코퍼스를 생성합니다.
+"""
+
+import random
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Any
+
+from mongodb_evaluation_system import UniversalAnalysisResult
+
+
+# 실행마다 리터럴만 바뀌는 쿼리 템플릿 (일부는 의미 오류 규칙에 걸림)
+_QUERY_TEMPLATES = [
+    "db.sessions.aggregate([{{$match: {{duration: {{$gt: {n}}}}}}}, {{$group: {{_id: '$user_id', total: {{$sum: 1}}}}}}])",
+    "db.orders.find({{'status': 'paid', 'amount': {{'$gt': {n}}}}}).sort({{amount: -1}}).limit(10)",
+    "db.events.aggregate([{{'$match': {{'type': 'login', 'day': {n}}}}}, {{'$count': 'logins'}}])",
+    "db.users.aggregate([{{$unwind: '$tags'}}, {{$group: {{_id: '$tags', avg_age: {{$avg: '$age'}}}}}}, {{$limit: {n}}}])",
+    "db.products.find({{price: {{$gte: {n}, $lt: {m}}}}}, {{name: 1, price: 1}})",
+    "db.logs.aggregate([{{$match: {{$expr: {{$eq: ['$start', '$start']}}}}}}, {{$count: 'n'}}])",
+    "db.metrics.find({{value: {{$gt: 999999999{n}}}}}).count()",
+]
+
+
+@dataclass(frozen=True)
+class CorpusConfig:
+    """합성 코퍼스 설정"""
+    records: int = 200            # 분석 결과 수
+    queries: int = 3              # 분석 결과당 쿼리 수
+    keys: int = 20                # 분석 결과당 계산 결과 키 수
+    list_size: int = 0            # 중첩 리스트 결과 크기 (0이면 스칼라만)
+    logs: int = 3                 # 분석 결과당 실행 로그 수
+    mismatch_ratio: float = 0.1   # LLM 값과 MongoDB 값이 다른 키 비율
+    seed: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _scalar(rng: random.Random, k: int) -> Any:
+    kind = k % 4
+    if kind == 0:
+        return rng.uniform(0, 1)                 # *_rate
+    if kind == 1:
+        return rng.randint(0, 100000)            # count
+    if kind == 2:
+        return round(rng.uniform(0, 5000), 2)    # 금액
+    return rng.choice(["서울", "부산", "대구", "인천", "광주"])
+
+
+def _key_name(k: int) -> str:
+    return f"metric_{k}_rate" if k % 4 == 0 else f"metric_{k}"
+
+
+def _group_output(rng: random.Random, size: int) -> List[Dict[str, Any]]:
+    return [{"_id": f"group_{i}", "count": rng.randint(0, 1000), "avg": rng.uniform(0, 100)}
+            for i in range(size)]
+
+
+def _perturb(rng: random.Random, value: Any) -> Any:
+    """불일치 값 생성 - 허용 오차를 넘는 차이"""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + rng.choice([-1, 1]) * max(1.0, abs(value) * 0.1)
+    if isinstance(value, str):
+        return value + "_x"
+    if isinstance(value, list) and value:
+        changed = [dict(doc) for doc in value]
+        doc = changed[rng.randrange(len(changed))]
+        doc["count"] = doc["count"] + 10
+        return changed
+    return value
+
+
+def make_record(rng: random.Random, config: CorpusConfig) -> UniversalAnalysisResult:
+    """분석 결과 하나 생성"""
+    queries = []
+    for _ in range(config.queries):
+        template = rng.choice(_QUERY_TEMPLATES)
+        n = rng.randint(1, 500)
+        queries.append(template.format(n=n, m=n + rng.randint(1, 500)))
+
+    calculation_results = {_key_name(k): _scalar(rng, k) for k in range(config.keys)}
+    if config.list_size:
+        calculation_results["group_results"] = _group_output(rng, config.list_size)
+
+    direct_mongodb_results = {}
+    for key, value in calculation_results.items():
+        direct_mongodb_results[key] = _perturb(rng, value) if rng.random() < config.mismatch_ratio else value
+
+    execution_logs = []
+    for i in range(config.logs):
+        status = "success" if rng.random() < 0.95 else "error"
+        log = {"status": status, "query_index": i % max(config.queries, 1),
+               "execution_time": round(rng.uniform(0.01, 2.0), 4)}
+        if status == "error":
+            log["error"] = "MongoServerError: exceeded time limit"
+        execution_logs.append(log)
+
+    return UniversalAnalysisResult(
+        analysis_query="사용자별 세션 비율 분석",
+        mongodb_queries=queries,
+        calculation_results=calculation_results,
+        execution_logs=execution_logs,
+        direct_mongodb_results=direct_mongodb_results,
+        timestamp="2024-01-01T00:00:00",
+    )
+
+
+def make_corpus(config: CorpusConfig) -> List[UniversalAnalysisResult]:
+    """설정에 따른 합성 코퍼스 생성"""
+    rng = random.Random(config.seed)
+    return [make_record(rng, config) for _ in range(config.records)]
@@ -0,0 +1,159 @@
+"""
+범용 MongoDB 분석 자동 평가 시스템
+Evidently 라이브러리를 활용한 4개 핵심 지표 자동 산출 및 Pass/Fail 판정
+
+참고한 Evidently 코드:
+1. evidently.test_suite.TestSuite - 커스텀 테스트 실행 프레임워크
+2. evidently.tests.base_test.Test - 커스텀 테스트 구현을 위한 베이스 클래스
+3. evidently.metrics.base_metric.Metric - 커스텀 메트릭 구현을 위한 베이스 클래스
+"""
+
+import sys
+
+if sys.version_info < (3, 10):
+    # 결과 데이터클래스가 @dataclass(slots=True)를 사용 (Python 3.10 이상)
+    raise ImportError("mongodb_evaluation_system은 Python 3.10 이상이 필요합니다")
+
+from .core import (
+    UniversalAnalysisResult,
+    EvaluationMetrics,
+    ComparisonRows,
+    QueryComparisonResult,
+    UniversalMongoDBEvaluator,
+    quick_evaluate,
+    example_usage,
+    example_with_mcp_integration,
+    quality_assured_analysis_example,
+    EVALUATOR_VERSION,
+)
+from .cache import EvaluationCache, CacheStats
+from .latency import LatencySketch, LatencyStats
+from .plugins import MetricPlugin, MetricInputs, MetricRegistry, key_coverage_metric, execution_time_metric
+from .profiling import Profiler, ProfileSpan, StageTiming, PrometheusSink, SpanFileSink
+from .query_ast import QueryAST, PipelineStage, parse_query, normalize_query
+from .report import ReportWriter, relative_difference
+from .rolling import RollingMetrics, WindowSnapshot
+from .sampling import AccuracySampling, AccuracyEstimate
+from .rules import SemanticRule, AstRule, SemanticRuleRegistry, RuleMatch, DEFAULT_SEMANTIC_RULES
+from .shell import (SHELL_NOW, ShellNow, ShellQuery, ShellSyntaxError, parse_shell_query, parse_shell_value,
+                    resolve_now)
+
+# pandas/NumPy, multiprocessing 또는 asyncio를 불러오는 모듈은 처음 접근할 때 import (시작 시간 단축)
+_LAZY_ATTRIBUTES = {
+    "aquick_evaluate": "aio",
+    "EvaluationExecutor": "aio",
+    "EvaluationQueueFull": "aio",
+    "StructuralComparison": "compare",
+    "compare_values": "compare",
+    "DriftBins": "drift",
+    "DriftMonitor": "drift",
+    "DriftReport": "drift",
+    "DriftWindow": "drift",
+    "compare_windows": "drift",
+    "AggregationExecutor": "executor",
+    "ExecutionRun": "executor",
+    "UnsupportedQueryError": "executor",
+    "load_collection": "executor",
+    "GroupedComparison": "grouped",
+    "compare_grouped": "grouped",
+    "EvaluationHistory": "history",
+    "SegmentInfo": "history",
+    "EvaluationFailure": "parallel",
+    "EvaluationClient": "server",
+    "EvaluationServer": "server",
+    "MicroBatcher": "server",
+    "ResultsStore": "store",
+    "ThresholdSweep": "sweep",
+    "sweep_thresholds": "sweep",
+    "RESULTS_DTYPE": "store",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+__all__ = [
+    "UniversalAnalysisResult",
+    "EvaluationMetrics",
+    "ComparisonRows",
+    "QueryComparisonResult",
+    "UniversalMongoDBEvaluator",
+    "quick_evaluate",
+    "aquick_evaluate",
+    "EvaluationExecutor",
+    "EvaluationQueueFull",
+    "EVALUATOR_VERSION",
+    "EvaluationCache",
+    "CacheStats",
+    "LatencySketch",
+    "LatencyStats",
+    "MetricPlugin",
+    "MetricInputs",
+    "MetricRegistry",
+    "key_coverage_metric",
+    "execution_time_metric",
+    "EvaluationFailure",
+    "EvaluationServer",
+    "EvaluationClient",
+    "MicroBatcher",
+    "Profiler",
+    "ProfileSpan",
+    "StageTiming",
+    "PrometheusSink",
+    "SpanFileSink",
+    "StructuralComparison",
+    "compare_values",
+    "GroupedComparison",
+    "compare_grouped",
+    "DriftWindow",
+    "DriftMonitor",
+    "DriftReport",
+    "DriftBins",
+    "compare_windows",
+    "AggregationExecutor",
+    "ExecutionRun",
+    "UnsupportedQueryError",
+    "load_collection",
+    "ResultsStore",
+    "EvaluationHistory",
+    "SegmentInfo",
+    "RESULTS_DTYPE",
+    "ThresholdSweep",
+    "sweep_thresholds",
+    "ShellQuery",
+    "ShellSyntaxError",
+    "parse_shell_query",
+    "parse_shell_value",
+    "ShellNow",
+    "SHELL_NOW",
+    "resolve_now",
+    "QueryAST",
+    "PipelineStage",
+    "parse_query",
+    "normalize_query",
+    "ReportWriter",
+    "relative_difference",
+    "RollingMetrics",
+    "AccuracySampling",
+    "AccuracyEstimate",
+    "WindowSnapshot",
+    "SemanticRule",
+    "AstRule",
+    "SemanticRuleRegistry",
+    "RuleMatch",
+    "DEFAULT_SEMANTIC_RULES",
+    "example_usage",
+    "example_with_mcp_integration",
+    "quality_assured_analysis_example",
+]
@@ -0,0 +1,266 @@
+"""
+asyncio 기반 서비스용 비동기 평가 API
+
+이벤트 루프 안에서 동기 quick_evaluate()를 호출하면 평가가 끝날 때까지 루프가 멈춰
+다른 요청의 지연 시간까지 늘어납니다. 이 모듈은 평가를 크기가 제한된 실행기(기본 스레드 풀)에서
+실행하고 결과를 기다리는 코루틴을 제공합니다.
+- 실행 중 + 대기 중 작업 수 상한(max_pending): 가득 차면 슬롯이 빌 때까지 대기하거나
+  queue_timeout 후 EvaluationQueueFull (배압)
+- timeout: 슬롯 대기와 실행을 합친 제한 시간 (초과 시 TimeoutError)
+- 취소: 아직 시작하지 않은 작업은 실행기에서 제거, 이미 실행 중인 작업은 끝날 때까지 슬롯을 점유
+- 평가는 동기 evaluate()를 그대로 호출하므로 결과가 동일
+
+    metrics = await aquick_evaluate(analysis_query, queries, results, logs, direct_results, timeout=2.0)
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Any, Callable, Optional
+
+from .core import EvaluationMetrics, UniversalAnalysisResult, UniversalMongoDBEvaluator
+from .plugins import MetricRegistry
+
+
+class EvaluationQueueFull(RuntimeError):
+    """실행기 대기열이 가득 차 queue_timeout 안에 슬롯을 얻지 못함"""
+
+
+class EvaluationExecutor:
+    """
+    크기가 제한된 평가 실행기
+
+    여러 이벤트 루프와 스레드에서 공유할 수 있습니다.
+
+    Args:
+        max_workers: 스레드 풀 크기 (기본 min(4, CPU 수)). executor를 주면 무시
+        max_pending: 실행 중 + 대기 중 작업 상한 (기본 max_workers × 4)
+        queue_timeout: 슬롯 대기 최대 시간 (초). None이면 무기한 대기, 0이면 즉시 EvaluationQueueFull
+        executor: 사용할 concurrent.futures 실행기 (선택적). ProcessPoolExecutor를 주면
+            호출마다 평가기와 분석 결과가 직렬화되어 전달됩니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 queue_timeout: Optional[float] = None, executor: Optional[Executor] = None):
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        if max_workers < 1:
+            raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+        if max_pending is None:
+            max_pending = max_workers * 4
+        if max_pending < 1:
+            raise ValueError(f"max_pending은 1 이상이어야 합니다: {max_pending}")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers,
+                                                        thread_name_prefix="mongodb-evaluation")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._waiters: deque = deque()   # (루프, 대기 future)
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """실행 중 + 실행기 대기 중 작업 수"""
+        return self._pending
+
+    @property
+    def waiting(self) -> int:
+        """슬롯을 기다리는 호출 수"""
+        return len(self._waiters)
+
+    # ------------------------------------------------------------------ 슬롯 관리
+
+    def _try_acquire(self) -> bool:
+        with self._lock:
+            if self._pending < self.max_pending:
+                self._pending += 1
+                return True
+            return False
+
+    def _wake_one(self) -> None:
+        """슬롯을 기다리는 호출 하나를 깨움 (어느 스레드에서든 호출 가능)"""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if not waiter.done():
+                    break
+            else:
+                return
+        try:
+            loop.call_soon_threadsafe(_set_waiter, waiter)
+        except RuntimeError:
+            # 대기하던 루프가 이미 닫힘 - 다음 대기자에게 넘김
+            self._wake_one()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._wake_one()
+
+    async def _acquire(self) -> None:
+        if self._try_acquire():
+            return
+        if self.queue_timeout is not None and self.queue_timeout <= 0:
+            raise EvaluationQueueFull(f"평가 대기열이 가득 찼습니다 (max_pending={self.max_pending})")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if self.queue_timeout is None else loop.time() + self.queue_timeout
+        while True:
+            waiter = loop.create_future()
+            with self._lock:
+                if self._pending < self.max_pending:
+                    self._pending += 1
+                    return
+                self._waiters.append((loop, waiter))
+            try:
+                remaining = None if deadline is None else deadline - loop.time()
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                raise EvaluationQueueFull(
+                    f"{self.queue_timeout}초 안에 평가 슬롯을 얻지 못했습니다 (max_pending={self.max_pending})"
+                ) from None
+            except BaseException:
+                # 깨워진 직후 취소되었으면 받은 신호를 다음 대기자에게 넘김
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_one()
+                raise
+            finally:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        pass
+            if self._try_acquire():
+                return
+
+    # ------------------------------------------------------------------ 실행
+
+    async def _run(self, fn: Callable, args: tuple) -> Any:
+        await self._acquire()
+        try:
+            if self._closed:
+                raise RuntimeError("이미 종료된 평가 실행기입니다")
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # 슬롯은 호출자가 아니라 실제 작업이 끝날 때 반환 (실행 중 취소된 작업도 자리 차지)
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()   # 아직 시작 전이면 실행기에서 제거
+            raise
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """
+        fn(*args)를 실행기에서 실행하고 결과 반환
+
+        Args:
+            timeout: 슬롯 대기 + 실행 제한 시간 (초, 초과 시 TimeoutError)
+
+        Raises:
+            EvaluationQueueFull: queue_timeout 안에 슬롯을 얻지 못함
+        """
+        if timeout is None:
+            return await self._run(fn, args)
+        return await asyncio.wait_for(self._run(fn, args), timeout)
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """실행기 종료 (직접 만든 스레드 풀만 종료하며, 전달받은 executor는 그대로 둠)"""
+        self._closed = True
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=cancel_pending)
+
+    async def __aenter__(self) -> "EvaluationExecutor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # 실행 중 작업을 기다리는 동안 루프를 막지 않도록 종료는 별도 스레드에서 대기
+        await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+    def __repr__(self) -> str:
+        return (f"EvaluationExecutor(max_workers={self.max_workers}, max_pending={self.max_pending}, "
+                f"pending={self._pending}, waiting={self.waiting})")
+
+
+def _set_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# 프로세스 공용 기본 실행기 (처음 사용할 때 생성)
+_default_executor: Optional[EvaluationExecutor] = None
+_default_lock = threading.Lock()
+
+
+def default_executor() -> EvaluationExecutor:
+    """aevaluate()/aquick_evaluate()가 executor 인자 없이 호출될 때 사용하는 실행기"""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None or _default_executor._closed:
+            _default_executor = EvaluationExecutor()
+        return _default_executor
+
+
+def set_default_executor(executor: Optional[EvaluationExecutor]) -> None:
+    """기본 실행기 교체 (None이면 다음 사용 시 기본 설정으로 다시 생성)"""
+    global _default_executor
+    with _default_lock:
+        _default_executor = executor
+
+
+async def aevaluate(evaluator: UniversalMongoDBEvaluator, analysis_result: UniversalAnalysisResult,
+                    ground_truth: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None,
+                    executor: Optional[EvaluationExecutor] = None) -> EvaluationMetrics:
+    """
+    evaluator.evaluate()를 이벤트 루프 밖에서 실행
+
+    Args:
+        evaluator: 평가기
+        analysis_result: 분석 결과
+        ground_truth: 정답 데이터 (선택적)
+        timeout: 슬롯 대기 + 평가 제한 시간 (초)
+        executor: 평가 실행기 (기본: 프로세스 공용 실행기)
+
+    Returns:
+        EvaluationMetrics: evaluate()와 동일한 결과
+    """
+    executor = executor or default_executor()
+    return await executor.run(evaluator.evaluate, analysis_result, ground_truth, timeout=timeout)
+
+
+async def aquick_evaluate(analysis_query: str,
+                          mongodb_queries: List[str],
+                          calculation_results: Dict[str, Any],
+                          execution_logs: List[Dict[str, Any]] = None,
+                          direct_mongodb_results: Dict[str, Any] = None,
+                          ground_truth: Dict[str, Any] = None,
+                          custom_thresholds: Dict[str, float] = None,
+                          comparison_mode: str = "lazy",
+                          latency_slo: Optional[Dict[str, Any]] = None,
+                          metric_plugins: Optional[MetricRegistry] = None,
+                          timeout: Optional[float] = None,
+                          executor: Optional[EvaluationExecutor] = None) -> EvaluationMetrics:
+    """
+    quick_evaluate()의 비동기 버전 (인자와 결과 동일, timeout/executor 추가)
+
+    평가기와 분석 결과 객체 생성은 루프에서 하고 평가만 실행기에서 수행합니다.
+    """
+    analysis_result = UniversalAnalysisResult(
+        analysis_query=analysis_query,
+        mongodb_queries=mongodb_queries,
+        calculation_results=calculation_results,
+        execution_logs=execution_logs or [],
+        direct_mongodb_results=direct_mongodb_results
+    )
+    evaluator = UniversalMongoDBEvaluator(thresholds=custom_thresholds,
+                                          comparison_mode=comparison_mode,
+                                          latency_slo=latency_slo,
+                                          metric_plugins=metric_plugins)
+    return await aevaluate(evaluator, analysis_result, ground_truth, timeout=timeout, executor=executor)
@@ -0,0 +1,353 @@
+"""
+대량 분석 결과 일괄 평가 (컬럼형 벡터 연산)
+
+여러 UniversalAnalysisResult를 한 번에 평탄화하여 컬럼 배열로 만든 뒤
+NumPy 그룹 집계(bincount)로 4개 핵심 지표를 계산합니다.
+실행별 결과는 UniversalMongoDBEvaluator.evaluate()와 동일합니다.
+"""
+
+import math
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .core import _RATE_KEY_WORDS, _RATE_QUERY_WORDS
+from .latency import LatencyStats
+
+
+# _values_match 기본 허용 오차
+NUMERIC_TOLERANCE = 0.01
+
+# float64로 손실 없이 표현 가능한 정수 범위 (초과 시 파이썬 비교로 처리)
+_EXACT_INT_LIMIT = 2 ** 53
+
+# 정확도 계산 방식
+_ACCURACY_MONGODB = 0      # MongoDB 직접 실행 결과 비교
+_ACCURACY_CONSISTENCY = 1  # 일관성 기반 점수
+_ACCURACY_GROUND_TRUTH = 2 # 정답 데이터 비교
+
+METRIC_COLUMNS = [
+    "semantic_error_rate",
+    "execution_success_rate",
+    "empty_result_rate",
+    "accuracy_rate",
+    "overall_pass",
+]
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _to_float(value: Any) -> float:
+    """숫자를 float64로 변환 (범위를 넘는 정수는 ±inf)"""
+    try:
+        return float(value)
+    except OverflowError:
+        return float("inf") if value > 0 else float("-inf")
+
+
+def _group_rate(run_ids: np.ndarray, flags: np.ndarray, n_runs: int,
+                default: float) -> np.ndarray:
+    """실행별 flags 비율 계산 (항목이 없는 실행은 default)"""
+    totals = np.bincount(run_ids, minlength=n_runs)
+    hits = np.bincount(run_ids, weights=flags, minlength=n_runs)
+    rates = np.full(n_runs, default, dtype=np.float64)
+    has_items = totals > 0
+    rates[has_items] = hits[has_items] / totals[has_items]
+    return rates
+
+
+class _ColumnBuilder:
+    """분석 결과 리스트를 컬럼 배열로 평탄화"""
+
+    def __init__(self, evaluator, n_runs: int):
+        self.evaluator = evaluator
+        self.n_runs = n_runs
+
+        # 실행 단위 플래그
+        self.run_has_negative = np.zeros(n_runs, dtype=bool)
+        self.run_has_over_100 = np.zeros(n_runs, dtype=bool)
+        self.run_rate_query = np.zeros(n_runs, dtype=bool)
+        self.run_accuracy_mode = np.zeros(n_runs, dtype=np.int8)
+        # 표본 추정한 실행의 정답 일치율 (accuracy_sampling 적용 시)
+        self.sampled_accuracy: Dict[int, float] = {}
+
+        # 쿼리 컬럼
+        self.query_run: List[int] = []
+        self.query_pattern: List[bool] = []
+        self.query_count: List[bool] = []
+
+        # 로그 컬럼
+        self.log_run: List[int] = []
+        self.log_success: List[bool] = []
+
+        # 계산 결과 값 컬럼 (수치 / 비수치 분리)
+        self.numeric_run: List[int] = []
+        self.numeric_empty: List[bool] = []   # float NaN/inf만 무응답 (범위를 넘는 int는 유효한 값)
+        self.other_run: List[int] = []
+        self.other_empty: List[bool] = []
+
+        # 비교 쌍 컬럼 (수치 / 비수치 분리)
+        self.pair_numeric_run: List[int] = []
+        self.pair_calculated: List[float] = []
+        self.pair_expected: List[float] = []
+        self.pair_other_run: List[int] = []
+        self.pair_other_match: List[bool] = []
+
+        # 일관성 점수 감점 컬럼 (실행 내 순서 유지)
+        self.penalty_run: List[int] = []
+        self.penalty_position: List[int] = []
+        self.penalty_value: List[float] = []
+
+    def add(self, run: int, analysis_result, ground_truth: Optional[Dict[str, Any]]) -> None:
+        evaluator = self.evaluator
+        calculation_results = analysis_result.calculation_results
+
+        for query in analysis_result.mongodb_queries:
+            self.query_run.append(run)
+            self.query_pattern.append(evaluator._matches_logical_error_pattern(query))
+            self.query_count.append(evaluator._is_count_query(query))
+
+        analysis_query = analysis_result.analysis_query.lower()
+        self.run_rate_query[run] = any(word in analysis_query for word in _RATE_QUERY_WORDS)
+
+        for log in analysis_result.execution_logs:
+            self.log_run.append(run)
+            self.log_success.append(log.get("status") == "success" or log.get("error") is None)
+
+        for value in calculation_results.values():
+            if _is_number(value):
+                number = _to_float(value)
+                self.numeric_run.append(run)
+                self.numeric_empty.append(isinstance(value, float) and not math.isfinite(value))
+                if number < 0:
+                    self.run_has_negative[run] = True
+                if number > 100:
+                    self.run_has_over_100[run] = True
+            else:
+                self.other_run.append(run)
+                self.other_empty.append(evaluator._is_empty_or_invalid_result(value))
+
+        if analysis_result.direct_mongodb_results:
+            self.run_accuracy_mode[run] = _ACCURACY_MONGODB
+            estimate = None
+            if evaluator.accuracy_sampling is not None:
+                estimate = evaluator.estimate_accuracy(analysis_result)
+            if estimate is not None:
+                self.sampled_accuracy[run] = estimate.estimate
+            else:
+                self._add_pairs(run, calculation_results, analysis_result.direct_mongodb_results)
+        elif ground_truth is None:
+            self.run_accuracy_mode[run] = _ACCURACY_CONSISTENCY
+            self._add_penalties(run, calculation_results)
+        else:
+            self.run_accuracy_mode[run] = _ACCURACY_GROUND_TRUTH
+            self._add_pairs(run, calculation_results, ground_truth)
+
+    def _add_pairs(self, run: int, calculation_results: Dict[str, Any],
+                   expected_results: Dict[str, Any]) -> None:
+        for key, calculated in calculation_results.items():
+            if key not in expected_results:
+                continue
+            expected = expected_results[key]
+            if (_is_number(calculated) and _is_number(expected)
+                    and not _is_large_int(calculated) and not _is_large_int(expected)):
+                self.pair_numeric_run.append(run)
+                self.pair_calculated.append(float(calculated))
+                self.pair_expected.append(float(expected))
+            else:
+                self.pair_other_run.append(run)
+                self.pair_other_match.append(self.evaluator._values_match(calculated, expected))
+
+    def _add_penalties(self, run: int, calculation_results: Dict[str, Any]) -> None:
+        # evaluate() 일관성 점수(_profile_results)와 같은 순서로 감점 기록
+        penalties = []
+        numeric_values = [_to_float(v) for v in calculation_results.values() if _is_number(v)]
+        if numeric_values:
+            mentions_count = "count" in str(calculation_results)
+            for value in numeric_values:
+                if value < 0 and mentions_count:
+                    penalties.append(0.2)
+                if value > 10000000:
+                    penalties.append(0.1)
+
+        for key, value in calculation_results.items():
+            if any(word in key.lower() for word in _RATE_KEY_WORDS):
+                if _is_number(value):
+                    number = _to_float(value)
+                    if number < 0 or number > 100:
+                        penalties.append(0.3)
+
+        for position, penalty in enumerate(penalties):
+            self.penalty_run.append(run)
+            self.penalty_position.append(position)
+            self.penalty_value.append(penalty)
+
+
+def _is_large_int(value: Any) -> bool:
+    return isinstance(value, int) and abs(value) > _EXACT_INT_LIMIT
+
+
+def _semantic_error_rates(columns: _ColumnBuilder) -> np.ndarray:
+    query_run = np.asarray(columns.query_run, dtype=np.intp)
+    pattern = np.asarray(columns.query_pattern, dtype=bool)
+    count_query = np.asarray(columns.query_count, dtype=bool)
+
+    # _has_semantic_error: 패턴 | (count 쿼리 & 음수 결과) | (비율 질의 & 100 초과 결과)
+    errors = (pattern
+              | (count_query & columns.run_has_negative[query_run])
+              | (columns.run_rate_query[query_run] & columns.run_has_over_100[query_run]))
+    return _group_rate(query_run, errors, columns.n_runs, default=0.0)
+
+
+def _execution_success_rates(columns: _ColumnBuilder) -> np.ndarray:
+    log_run = np.asarray(columns.log_run, dtype=np.intp)
+    success = np.asarray(columns.log_success, dtype=bool)
+    return _group_rate(log_run, success, columns.n_runs, default=1.0)
+
+
+def _empty_result_rates(columns: _ColumnBuilder) -> np.ndarray:
+    value_run = np.concatenate([
+        np.asarray(columns.numeric_run, dtype=np.intp),
+        np.asarray(columns.other_run, dtype=np.intp),
+    ])
+    empty = np.concatenate([
+        np.asarray(columns.numeric_empty, dtype=bool),
+        np.asarray(columns.other_empty, dtype=bool),
+    ])
+    return _group_rate(value_run, empty, columns.n_runs, default=1.0)
+
+
+def _accuracy_rates(columns: _ColumnBuilder) -> np.ndarray:
+    n_runs = columns.n_runs
+    mode = columns.run_accuracy_mode
+
+    calculated = np.asarray(columns.pair_calculated, dtype=np.float64)
+    expected = np.asarray(columns.pair_expected, dtype=np.float64)
+    pair_run = np.concatenate([
+        np.asarray(columns.pair_numeric_run, dtype=np.intp),
+        np.asarray(columns.pair_other_run, dtype=np.intp),
+    ])
+    # inf - inf(NaN), 매우 큰 값의 차이(inf)는 불일치로 판정되며 경고를 내지 않음
+    with np.errstate(invalid="ignore", over="ignore"):
+        numeric_match = np.abs(calculated - expected) <= NUMERIC_TOLERANCE
+    match = np.concatenate([
+        numeric_match,
+        np.asarray(columns.pair_other_match, dtype=bool),
+    ])
+
+    # 비교 항목이 없을 때: MongoDB 비교는 0.0, 정답 비교는 1.0
+    accuracy = _group_rate(pair_run, match, n_runs, default=1.0)
+    has_pairs = np.bincount(pair_run, minlength=n_runs) > 0
+    accuracy[(mode == _ACCURACY_MONGODB) & ~has_pairs] = 0.0
+
+    # 일관성 점수: 원본과 같은 부동소수점 결과를 위해 위치별로 순차 감점
+    consistency = np.ones(n_runs, dtype=np.float64)
+    penalty_run = np.asarray(columns.penalty_run, dtype=np.intp)
+    penalty_position = np.asarray(columns.penalty_position, dtype=np.intp)
+    penalty_value = np.asarray(columns.penalty_value, dtype=np.float64)
+    max_position = int(penalty_position.max()) + 1 if penalty_position.size else 0
+    for position in range(max_position):
+        at_position = penalty_position == position
+        consistency[penalty_run[at_position]] -= penalty_value[at_position]
+    consistency = np.maximum(0.0, consistency)
+
+    is_consistency = mode == _ACCURACY_CONSISTENCY
+    accuracy[is_consistency] = consistency[is_consistency]
+    for run, estimate in columns.sampled_accuracy.items():
+        accuracy[run] = estimate
+    return accuracy
+
+
+def evaluate_batch(evaluator, results: Sequence,
+                   ground_truths: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> pd.DataFrame:
+    """
+    분석 결과 리스트 일괄 평가
+
+    Args:
+        evaluator: 임계값과 검사 규칙을 제공하는 UniversalMongoDBEvaluator
+        results: 분석 결과 리스트
+        ground_truths: results와 같은 순서의 정답 데이터 리스트 (선택적)
+
+    Returns:
+        pd.DataFrame: 실행당 1행 (입력 순서 유지)
+    """
+    results = list(results)
+    n_runs = len(results)
+
+    if ground_truths is None:
+        ground_truths = [None] * n_runs
+    else:
+        ground_truths = list(ground_truths)
+        if len(ground_truths) != n_runs:
+            raise ValueError(
+                f"ground_truths 길이({len(ground_truths)})가 results 길이({n_runs})와 다릅니다"
+            )
+
+    columns = _ColumnBuilder(evaluator, n_runs)
+    for run, (analysis_result, ground_truth) in enumerate(zip(results, ground_truths)):
+        columns.add(run, analysis_result, ground_truth)
+
+    semantic_error_rate = _semantic_error_rates(columns)
+    execution_success_rate = _execution_success_rates(columns)
+    empty_result_rate = _empty_result_rates(columns)
+    accuracy_rate = _accuracy_rates(columns)
+
+    thresholds = evaluator.thresholds
+    overall_pass = ((semantic_error_rate <= thresholds["semantic_error"])
+                    & (execution_success_rate >= thresholds["execution_success"])
+                    & (empty_result_rate <= thresholds["empty_result"])
+                    & (accuracy_rate >= thresholds["accuracy"]))
+    plugins = evaluator.metric_plugins
+    latencies = None
+    if evaluator._latency_slo or "latency" in plugins.inputs:
+        latencies = [LatencyStats.from_logs(result.execution_logs) for result in results]
+    if evaluator._latency_slo:
+        # 지연 시간 SLO는 실행별 분위수 스케치로 판정 (evaluate()와 동일)
+        latency_pass = np.fromiter(
+            (not evaluator.latency_slo_violations(latency) for latency in latencies),
+            dtype=bool, count=n_runs)
+        overall_pass &= latency_pass
+
+    data = {
+        "semantic_error_rate": semantic_error_rate,
+        "execution_success_rate": execution_success_rate,
+        "empty_result_rate": empty_result_rate,
+        "accuracy_rate": accuracy_rate,
+        "overall_pass": overall_pass,
+    }
+    if plugins:
+        custom_metrics = _custom_metric_columns(evaluator, results, ground_truths, latencies)
+        for plugin in plugins:
+            values = custom_metrics[plugin.name]
+            data[plugin.name] = values
+            if plugin.gate:
+                overall_pass &= _plugin_passes(plugin, values, thresholds.get(plugin.name))
+    return pd.DataFrame(data, columns=METRIC_COLUMNS + [plugin.name for plugin in plugins])
+
+
+def _custom_metric_columns(evaluator, results: List, ground_truths: List,
+                           latencies: Optional[List[LatencyStats]]) -> Dict[str, np.ndarray]:
+    """사용자 정의 지표 일괄 계산 (프로파일은 "profile"을 선언한 지표가 있을 때만 생성)"""
+    plugins = evaluator.metric_plugins
+    needs_profile = "profile" in plugins.inputs
+    inputs = [
+        plugins.make_inputs(
+            result, ground_truth,
+            evaluator._profile_results(result, ground_truth, collect_rows=False) if needs_profile else None,
+            latencies[run] if latencies is not None else None)
+        for run, (result, ground_truth) in enumerate(zip(results, ground_truths))
+    ]
+    return {name: np.asarray(values, dtype=np.float64)
+            for name, values in plugins.compute_batch(inputs).items()}
+
+
+def _plugin_passes(plugin, values: np.ndarray, threshold: Optional[float]) -> np.ndarray:
+    """MetricPlugin.passes()의 벡터 버전 (NaN은 미달)"""
+    if threshold is None:
+        threshold = plugin.threshold
+    if threshold is None:
+        return np.ones(len(values), dtype=bool)
+    return values >= threshold if plugin.higher_is_better else values <= threshold
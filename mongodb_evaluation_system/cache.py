@@ -0,0 +1,242 @@
+"""
+내용 주소 기반 평가 캐시
+
+동일한 (쿼리, LLM 결과, MongoDB 직접 실행 결과, 임계값) 조합의 재평가를 피하기 위해
+평가 결과를 내용 해시로 캐싱합니다.
+- 키: timestamp를 제외한 분석 결과 + 정답 데이터 + 평가기 설정(임계값, 규칙, 버전)의 SHA-256
+- 메모리 계층: 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 디스크 계층 (선택): SQLite 파일에 저장하여 재시작 후에도 유지 (최대 항목 수를 넘으면 오래된 항목부터 삭제)
+
+신뢰 경계: 디스크 계층은 값을 pickle로 저장하고 읽을 때 그대로 복원합니다. 캐시 파일을 쓸 수 있는
+사람은 평가 프로세스에서 임의 코드를 실행할 수 있으므로, 평가를 실행하는 사용자만 쓸 수 있는
+경로를 사용하고 다른 사용자/시스템이 만든 캐시 파일을 열지 마세요. 새로 만드는 캐시 파일은 소유자
+전용 권한(0600)으로 생성합니다.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int = 0           # 메모리 또는 디스크 적중
+    disk_hits: int = 0      # 디스크 계층 적중 (hits에 포함)
+    misses: int = 0         # 미적중
+    evictions: int = 0      # LRU 제거 횟수
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+# JSON이 그대로 구분하는 스칼라 타입 (1, 1.0, true, "1"은 서로 다른 텍스트)
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+# JSON으로 표현되지 않는 값의 태그 키 접두사 (같은 접두사로 시작하는 문자열 키는 접두사를 하나 더 붙임)
+_TAG = "\x00"
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _canonical(value: Any) -> Any:
+    """
+    값을 타입이 보존되는 JSON 호환 구조로 변환
+
+    - 문자열 키 딕셔너리와 리스트는 그대로 (태그 접두사로 시작하는 키만 이스케이프)
+    - 문자열이 아닌 키가 있는 딕셔너리, 튜플, 집합, 기타 객체는 태그 키 하나짜리 객체
+      ({1: 5}와 {"1": 5}, 튜플과 리스트가 서로 다른 텍스트가 됨)
+    """
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return value
+    if value_type is list:
+        if all(type(item) in _JSON_SCALARS for item in value):
+            return value   # 스칼라 리스트는 복사하지 않음
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        if all(type(key) is str for key in value):
+            if any(key.startswith(_TAG) for key in value):
+                return {(_TAG + key if key.startswith(_TAG) else key): _canonical(item)
+                        for key, item in value.items()}
+            if all(type(item) in _JSON_SCALARS for item in value.values()):
+                return value   # 스칼라 값 딕셔너리는 복사하지 않음
+            return {key: _canonical(item) for key, item in value.items()}
+        # 키 타입이 섞여 있어도 정렬되도록 (타입 이름, repr) 순서
+        items = sorted(value.items(), key=lambda item: (type(item[0]).__name__, repr(item[0])))
+        return {_TAG + "map": [[_canonical(key), _canonical(item)] for key, item in items]}
+    if isinstance(value, tuple):
+        return {_TAG + "tuple": [_canonical(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {_TAG + "set": sorted((_canonical(item) for item in value), key=_dumps)}
+    if isinstance(value, list):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (str, int, float)):   # 스칼라 하위 클래스 (IntEnum 등)
+        return value
+    if hasattr(value, "item") and callable(value.item):  # NumPy 스칼라
+        try:
+            return _canonical(value.item())
+        except (TypeError, ValueError):
+            pass
+    return {_TAG + "repr": f"{type(value).__name__}:{value!r}"}
+
+
+def canonical_json(value: Any) -> str:
+    """키 정렬, 공백 제거된 정규화 JSON (키/컨테이너 타입 보존)"""
+    return _dumps(_canonical(value))
+
+
+def make_cache_key(analysis_result, ground_truth: Optional[Dict[str, Any]],
+                   evaluator_fingerprint: str) -> str:
+    """분석 결과(timestamp 제외), 정답 데이터, 평가기 설정의 내용 해시"""
+    payload = {
+        "analysis_query": analysis_result.analysis_query,
+        "mongodb_queries": analysis_result.mongodb_queries,
+        "calculation_results": analysis_result.calculation_results,
+        "execution_logs": analysis_result.execution_logs,
+        "direct_mongodb_results": analysis_result.direct_mongodb_results,
+        "ground_truth": ground_truth,
+        "evaluator": evaluator_fingerprint,
+    }
+    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """
+    LRU 메모리 캐시 + 선택적 SQLite 디스크 계층
+
+    Args:
+        max_entries: 메모리 계층 최대 항목 수
+        path: SQLite 파일 경로 (None이면 메모리 계층만 사용, 평가 사용자만 쓸 수 있는 경로)
+        max_disk_entries: 디스크 계층 최대 항목 수 (넘으면 오래 전에 저장한 항목부터 삭제)
+    """
+
+    def __init__(self, max_entries: int = 10000, path: Optional[str] = None,
+                 max_disk_entries: int = 100000):
+        if max_entries < 1:
+            raise ValueError(f"max_entries는 1 이상이어야 합니다: {max_entries}")
+        if max_disk_entries < 1:
+            raise ValueError(f"max_disk_entries는 1 이상이어야 합니다: {max_disk_entries}")
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional["sqlite3.Connection"] = None
+        self._disk_entries = 0   # 디스크 항목 수 상한 추정 (덮어쓰기도 1로 셈)
+        if path is not None:
+            self._connection = self._open(path)
+            self._disk_entries = self._connection.execute(
+                "SELECT COUNT(*) FROM evaluation_cache").fetchone()[0]
+
+    @staticmethod
+    def _open(path: str) -> "sqlite3.Connection":
+        import sqlite3   # 디스크 계층을 쓸 때만 로드
+
+        if path != ":memory:" and not os.path.exists(path):
+            # 새 캐시 파일은 소유자만 읽고 쓸 수 있게 생성 (pickle 복원 대상)
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS evaluation_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        return connection
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+            return self._load(key) is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+
+            value = self._load(key)
+            if value is not None:
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO evaluation_cache (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                )
+                self._disk_entries += 1
+                if self._disk_entries > self.max_disk_entries:
+                    self._trim_disk()
+
+    def clear(self) -> None:
+        """메모리/디스크 항목과 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM evaluation_cache")
+                self._disk_entries = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _trim_disk(self) -> None:
+        """디스크 항목을 상한의 90%까지 줄임 (rowid가 작을수록 오래 전에 저장한 항목)"""
+        keep = self.max_disk_entries - self.max_disk_entries // 10
+        self._connection.execute(
+            "DELETE FROM evaluation_cache WHERE rowid IN "
+            "(SELECT rowid FROM evaluation_cache ORDER BY rowid DESC LIMIT -1 OFFSET ?)", (keep,)
+        )
+        self._disk_entries = self._connection.execute("SELECT COUNT(*) FROM evaluation_cache").fetchone()[0]
+
+    def _load(self, key: str) -> Optional[Any]:
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            "SELECT value FROM evaluation_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def __getstate__(self):
+        # 워커 프로세스에는 설정만 전달 (메모리 항목과 연결은 새로 구성)
+        return {"max_entries": self.max_entries, "path": self.path, "max_disk_entries": self.max_disk_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
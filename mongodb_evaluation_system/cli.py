@@ -0,0 +1,198 @@
+"""
+명령행 진입점
+
+    python -m mongodb_evaluation_system evaluate runs.jsonl -o metrics.jsonl
+    cat runs.jsonl | python -m mongodb_evaluation_system evaluate - --format csv > metrics.csv
+    python -m mongodb_evaluation_system evaluate runs.jsonl --snapshots snapshots/
+    python -m mongodb_evaluation_system evaluate runs.jsonl -o metrics.jsonl --report nightly.html
+    python -m mongodb_evaluation_system serve --unix /tmp/mongodb-evaluation.sock
+    python -m mongodb_evaluation_system examples
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .cache import EvaluationCache
+from .core import (
+    UniversalMongoDBEvaluator,
+    example_usage,
+    example_with_mcp_integration,
+    quality_assured_analysis_example,
+)
+from .report import REPORT_FORMATS, ReportWriter
+from .streaming import WRITERS, run_pipeline
+
+
+def _load_thresholds(value: Optional[str]):
+    """임계값 인자 해석 (JSON 문자열 또는 JSON 파일 경로)"""
+    if value is None:
+        return None
+    if value.lstrip().startswith("{"):
+        return json.loads(value)
+    with open(value, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _open_input(path: str):
+    if path == "-":
+        return sys.stdin
+    return open(path, encoding="utf-8")
+
+
+def _open_output(path: Optional[str]):
+    if path is None or path == "-":
+        return sys.stdout
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _report_format(args) -> str:
+    if args.report_format:
+        return args.report_format
+    return "html" if args.report.lower().endswith((".html", ".htm")) else "markdown"
+
+
+def _command_evaluate(args) -> int:
+    # 지표만 기록하는 경우 비교 테이블은 생성하지 않음 (리포트에는 비교 원본 쌍 필요)
+    cache = EvaluationCache(path=args.cache) if args.cache else None
+    evaluator = UniversalMongoDBEvaluator(thresholds=_load_thresholds(args.thresholds),
+                                          comparison_mode="lazy" if args.report else "none",
+                                          cache=cache,
+                                          latency_slo=_load_thresholds(args.latency_slo))
+
+    source = _open_input(args.input)
+    sink = _open_output(args.output)
+    report_stream = open(args.report, "w", encoding="utf-8") if args.report else None
+    try:
+        executor = None
+        if args.snapshots:
+            from .executor import AggregationExecutor   # pandas 로드는 스냅샷 실행 시에만
+            executor = AggregationExecutor.from_directory(args.snapshots)
+        report = None
+        if report_stream is not None:
+            report = ReportWriter(report_stream, evaluator, output_format=_report_format(args),
+                                  top_k=args.top_k, include_runs=not args.summary_only)
+        summary = run_pipeline(evaluator, source, sink, output_format=args.format,
+                               executor=executor, report=report)
+        if report is not None:
+            report.close()
+    finally:
+        if report_stream is not None:
+            report_stream.close()
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        else:
+            sink.flush()
+        if cache is not None:
+            cache.close()
+
+    print(
+        f"평가 완료: {summary['records']}건 "
+        f"(PASS {summary['passed']}, FAIL {summary['failed']}, 오류 {summary['errors']})",
+        file=sys.stderr
+    )
+    return 1 if args.fail_on_error and summary["errors"] else 0
+
+
+def _command_serve(args) -> int:
+    from . import compare  # noqa: F401  중첩 결과 비교용 pandas/NumPy를 첫 요청 전에 로드
+    from .server import EvaluationServer, MicroBatcher
+
+    evaluator = UniversalMongoDBEvaluator(thresholds=_load_thresholds(args.thresholds),
+                                          latency_slo=_load_thresholds(args.latency_slo))
+    batcher = MicroBatcher(evaluator, max_batch_size=args.max_batch_size,
+                           max_wait=args.max_wait_ms / 1000, max_queue=args.max_queue)
+    server = EvaluationServer(batcher, host=args.host, port=args.port, unix_path=args.unix,
+                              verbose=args.verbose, request_timeout=args.request_timeout)
+    print(f"평가 서버 시작: {server.address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+def _command_examples(args) -> int:
+    print("=== 기본 사용 예제 ===")
+    example_usage()
+
+    print("\n\n=== MCP 연동 예제 ===")
+    example_with_mcp_integration()
+
+    print("\n\n=== 품질 보장 분석 예제 ===")
+    quality_assured_analysis_example()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m mongodb_evaluation_system",
+        description="MongoDB 분석 결과 자동 평가"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    evaluate_parser = subparsers.add_parser(
+        "evaluate", help="JSONL 분석 결과를 스트리밍으로 평가"
+    )
+    evaluate_parser.add_argument("input", help="입력 JSONL 파일 경로 ('-'이면 stdin)")
+    evaluate_parser.add_argument("-o", "--output", default=None,
+                                 help="출력 파일 경로 (기본 stdout)")
+    evaluate_parser.add_argument("--format", choices=sorted(WRITERS), default="jsonl",
+                                 help="출력 형식 (기본 jsonl)")
+    evaluate_parser.add_argument("--thresholds", default=None,
+                                 help="임계값 JSON 문자열 또는 JSON 파일 경로")
+    evaluate_parser.add_argument("--latency-slo", default=None,
+                                 help="지연 시간 SLO JSON 문자열 또는 JSON 파일 경로 "
+                                      "(예: '{\"p95\": 1.0}', 도구별: '{\"mongodb_direct\": {\"p99\": 0.5}}')")
+    evaluate_parser.add_argument("--cache", default=None,
+                                 help="평가 결과 캐시 SQLite 파일 경로 (동일 레코드 재평가 생략)")
+    evaluate_parser.add_argument("--snapshots", default=None,
+                                 help="컬렉션 스냅샷 디렉터리 (지정 시 쿼리를 오프라인 실행하여 "
+                                      "direct_mongodb_results 계산)")
+    evaluate_parser.add_argument("--report", default=None,
+                                 help="Markdown/HTML 평가 리포트 파일 경로 (.html이면 HTML)")
+    evaluate_parser.add_argument("--report-format", choices=REPORT_FORMATS, default=None,
+                                 help="리포트 형식 (기본: 확장자로 결정)")
+    evaluate_parser.add_argument("--top-k", type=int, default=20,
+                                 help="리포트에 표시할 상대 차이 상위 불일치 수 (기본 20)")
+    evaluate_parser.add_argument("--summary-only", action="store_true",
+                                 help="리포트에 실행별 섹션 없이 코퍼스 요약만 기록")
+    evaluate_parser.add_argument("--fail-on-error", action="store_true",
+                                 help="파싱/평가 오류 레코드가 있으면 종료 코드 1 반환")
+    evaluate_parser.set_defaults(handler=_command_evaluate)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="로컬 HTTP/Unix 소켓 평가 서버 실행 (요청 마이크로 배치)"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="TCP 주소 (기본 127.0.0.1)")
+    serve_parser.add_argument("--port", type=int, default=8765, help="TCP 포트 (기본 8765)")
+    serve_parser.add_argument("--unix", default=None, help="Unix 소켓 경로 (지정 시 TCP 대신 사용)")
+    serve_parser.add_argument("--max-batch-size", type=int, default=32,
+                              help="배치 최대 레코드 수 (기본 32)")
+    serve_parser.add_argument("--max-wait-ms", type=float, default=5.0,
+                              help="첫 요청 도착 후 배치 마감까지 최대 대기 시간 (밀리초, 기본 5)")
+    serve_parser.add_argument("--max-queue", type=int, default=1024,
+                              help="대기열 상한, 초과 요청은 503 응답 (기본 1024)")
+    serve_parser.add_argument("--request-timeout", type=float, default=30.0,
+                              help="요청 하나의 평가 대기 제한 시간, 초과 요청은 504 응답 (초, 기본 30)")
+    serve_parser.add_argument("--thresholds", default=None,
+                              help="임계값 JSON 문자열 또는 JSON 파일 경로")
+    serve_parser.add_argument("--latency-slo", default=None,
+                              help="지연 시간 SLO JSON 문자열 또는 JSON 파일 경로")
+    serve_parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    serve_parser.set_defaults(handler=_command_serve)
+
+    examples_parser = subparsers.add_parser("examples", help="사용 예제 실행")
+    examples_parser.set_defaults(handler=_command_examples)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
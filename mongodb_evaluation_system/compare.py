@@ -0,0 +1,294 @@
+"""
+허용 오차 기반 구조 비교
+
+중첩된 리스트/딕셔너리 결과를 순회하며 비교합니다.
+- 동일한 형태의 수치 배열은 NumPy로 변환하여 절대/상대 허용 오차로 벡터 비교
+  (float64로 정확히 표현되지 않는 큰 정수 배열은 스칼라와 같이 정수 연산으로 원소별 비교)
+- 문자열은 정확히 일치해야 함 (최상위 문자열의 대소문자 무시 비교는 UniversalMongoDBEvaluator._values_match에서 처리)
+- 타입, 길이, 키 구성이 다른 구조적 불일치는 처음 발견한 지점에서 즉시 중단
+- 첫 불일치 경로와 요약 통계(최대 절대 차이, 차이 원소 수) 보고
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+
+# 벡터 비교가 가능한 NumPy dtype 종류 (bool, int, uint, float)
+_NUMERIC_KINDS = "biuf"
+
+# 이보다 짧은 리스트는 배열 변환 비용이 더 커서 원소별로 비교
+_VECTORIZE_MIN_LENGTH = 16
+
+# float64가 정확히 표현하는 정수 한계 (2**53)
+_FLOAT64_EXACT_INT = 2 ** 53
+
+
+@dataclass
+class StructuralComparison:
+    """구조 비교 결과"""
+    match: bool                          # 전체 일치 여부
+    mismatch_path: Optional[str] = None  # 첫 불일치 경로 (예: "$[3].avg")
+    reason: Optional[str] = None         # 불일치 사유
+    structural: bool = False             # 구조적 불일치(타입/길이/키) 여부
+    n_compared: int = 0                  # 비교한 스칼라 원소 수
+    n_different: int = 0                 # 허용 오차를 벗어난 원소 수
+    max_abs_diff: float = 0.0            # 수치 원소의 최대 절대 차이
+
+    def describe(self) -> str:
+        """비교 테이블 '차이' 컬럼용 요약"""
+        if self.match:
+            return "0"
+        if self.structural:
+            return f"{self.mismatch_path}: {self.reason}"
+        return (f"{self.n_different}/{self.n_compared}개 차이 "
+                f"(최대 {self.max_abs_diff:.2f}, 첫 위치 {self.mismatch_path})")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _child_path(path: str, key: Any) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    if isinstance(key, str) and key.isidentifier():
+        return f"{path}.{key}"
+    return f"{path}[{key!r}]"
+
+
+def _has_key(documents: list, key: str) -> bool:
+    return all(type(document) is dict and key in document for document in documents)
+
+
+def _fits_float64(array: np.ndarray) -> bool:
+    """정수 배열이 float64 변환 후에도 정확한지 (2**53 초과 정수가 있으면 False)"""
+    if array.dtype.kind not in "iu" or not array.size:
+        return True
+    return max(-int(array.min()), int(array.max())) <= _FLOAT64_EXACT_INT
+
+
+def _as_numeric_array(values: list) -> Optional[np.ndarray]:
+    """동일 형태의 수치 리스트(중첩 포함)를 배열로 변환, 불가능하면 None"""
+    if not values:
+        return None
+    try:
+        array = np.asarray(values)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    if array.dtype.kind not in _NUMERIC_KINDS or not _fits_float64(array):
+        return None
+    return array
+
+
+class _Comparator:
+    """비교 상태 누적기"""
+
+    def __init__(self, abs_tol: float, rel_tol: float, group_key: Optional[str] = None):
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+        self.group_key = group_key
+        self.n_compared = 0
+        self.n_different = 0
+        self.max_abs_diff = 0.0
+        self.mismatch_path: Optional[str] = None
+        self.reason: Optional[str] = None
+        self.structural = False
+
+    def _record_value_mismatch(self, path: str, reason: str) -> None:
+        if self.mismatch_path is None:
+            self.mismatch_path = path
+            self.reason = reason
+
+    def _record_structural_mismatch(self, path: str, reason: str) -> bool:
+        self.mismatch_path = path
+        self.reason = reason
+        self.structural = True
+        return False
+
+    def _compare_scalar_numbers(self, calculated, expected, path: str) -> None:
+        self.n_compared += 1
+        try:
+            # float 범위를 넘는 int와 float의 뺄셈은 OverflowError (무한대 차이로 간주)
+            diff = abs(calculated - expected)
+            limit = self.abs_tol + self.rel_tol * abs(expected) if self.rel_tol else self.abs_tol
+            diff_value = float(diff)
+        except OverflowError:
+            diff = diff_value = float("inf")
+            limit = 0.0
+        if diff_value > self.max_abs_diff:
+            self.max_abs_diff = diff_value
+
+        if not diff <= limit:
+            self.n_different += 1
+            self._record_value_mismatch(path, "허용 오차 초과")
+
+    def _compare_arrays(self, calculated: np.ndarray, expected: np.ndarray, path: str,
+                        element_path: Optional[Callable[[tuple], str]] = None) -> bool:
+        if calculated.shape != expected.shape:
+            return self._record_structural_mismatch(
+                path, f"형태 불일치 {calculated.shape} != {expected.shape}"
+            )
+
+        a = calculated.astype(np.float64, copy=False)
+        b = expected.astype(np.float64, copy=False)
+        diff = np.abs(a - b)
+        limit = self.abs_tol + self.rel_tol * np.abs(b) if self.rel_tol else self.abs_tol
+        # NaN 차이는 비교 결과가 False가 되어 불일치로 집계됨
+        within = diff <= limit
+
+        self.n_compared += within.size
+        comparable = ~np.isnan(diff)
+        if comparable.any():
+            self.max_abs_diff = max(self.max_abs_diff, float(diff.max(where=comparable, initial=0.0)))
+
+        n_different = int(within.size - np.count_nonzero(within))
+        if n_different:
+            self.n_different += n_different
+            first = tuple(int(i) for i in np.unravel_index(int(np.argmin(within)), within.shape))
+            if element_path is None:
+                mismatch_path = path + "".join(f"[{i}]" for i in first)
+            else:
+                mismatch_path = element_path(first)
+            self._record_value_mismatch(mismatch_path, "허용 오차 초과")
+        return True
+
+    def _compare_grouped(self, calculated: list, expected: list, path: str) -> bool:
+        """그룹 키 해시 조인 비교 (순서 무관)"""
+        from .grouped import compare_grouped
+
+        grouped = compare_grouped(calculated, expected, key=self.group_key,
+                                  abs_tol=self.abs_tol, rel_tol=self.rel_tol)
+        self.n_compared += grouped.n_compared
+        self.n_different += grouped.n_different
+        self.max_abs_diff = max(self.max_abs_diff, grouped.max_abs_diff)
+
+        if grouped.missing_groups or grouped.extra_groups or grouped.duplicate_groups:
+            return self._record_structural_mismatch(path, grouped.describe())
+        if not grouped.mismatches.empty:
+            first = grouped.mismatches.iloc[0]
+            self._record_value_mismatch(
+                _child_path(f"{path}[{self.group_key}={first['group']!r}]", first["field"]),
+                "허용 오차 초과"
+            )
+        return True
+
+    def _compare_records(self, calculated: list, expected: list, path: str) -> Optional[bool]:
+        """키 구성이 같은 문서 리스트를 컬럼 단위로 비교 (형식이 다르면 None)"""
+        keys = calculated[0].keys()
+        for calculated_item, expected_item in zip(calculated, expected):
+            if (type(calculated_item) is not dict or type(expected_item) is not dict
+                    or calculated_item.keys() != keys or expected_item.keys() != keys):
+                return None
+
+        for key in keys:
+            calculated_column = [item[key] for item in calculated]
+            expected_column = [item[key] for item in expected]
+
+            calculated_array = _as_numeric_array(calculated_column)
+            expected_array = _as_numeric_array(expected_column) if calculated_array is not None else None
+            if expected_array is not None:
+                def element_path(index, key=key):
+                    head = _child_path(_child_path(path, index[0]), key)
+                    return head + "".join(f"[{i}]" for i in index[1:])
+
+                if not self._compare_arrays(calculated_array, expected_array,
+                                            _child_path(path, key), element_path):
+                    return False
+                continue
+
+            for index, (calculated_item, expected_item) in enumerate(zip(calculated_column, expected_column)):
+                if not self.walk(calculated_item, expected_item, _child_path(_child_path(path, index), key)):
+                    return False
+        return True
+
+    def walk(self, calculated: Any, expected: Any, path: str) -> bool:
+        """비교 수행 - 구조적 불일치 발견 시 False (즉시 중단)"""
+
+        if _is_number(calculated) and _is_number(expected):
+            self._compare_scalar_numbers(calculated, expected, path)
+            return True
+
+        if type(calculated) != type(expected):
+            return self._record_structural_mismatch(
+                path, f"타입 불일치 {type(calculated).__name__} != {type(expected).__name__}"
+            )
+
+        if isinstance(calculated, list):
+            if (self.group_key is not None and calculated and expected
+                    and type(calculated[0]) is dict and type(expected[0]) is dict
+                    and _has_key(calculated, self.group_key) and _has_key(expected, self.group_key)):
+                return self._compare_grouped(calculated, expected, path)
+
+            if len(calculated) != len(expected):
+                return self._record_structural_mismatch(
+                    path, f"길이 불일치 {len(calculated)} != {len(expected)}"
+                )
+
+            if len(calculated) >= _VECTORIZE_MIN_LENGTH:
+                if type(calculated[0]) is dict:
+                    records_ok = self._compare_records(calculated, expected, path)
+                    if records_ok is not None:
+                        return records_ok
+                else:
+                    calculated_array = _as_numeric_array(calculated)
+                    if calculated_array is not None:
+                        expected_array = _as_numeric_array(expected)
+                        if expected_array is not None:
+                            return self._compare_arrays(calculated_array, expected_array, path)
+
+            for index, (calculated_item, expected_item) in enumerate(zip(calculated, expected)):
+                if not self.walk(calculated_item, expected_item, _child_path(path, index)):
+                    return False
+            return True
+
+        if isinstance(calculated, dict):
+            if calculated.keys() != expected.keys():
+                missing = [key for key in expected if key not in calculated]
+                if missing:
+                    return self._record_structural_mismatch(_child_path(path, missing[0]), "키 누락")
+                extra = next(key for key in calculated if key not in expected)
+                return self._record_structural_mismatch(_child_path(path, extra), "추가 키")
+
+            for key, calculated_item in calculated.items():
+                if not self.walk(calculated_item, expected[key], _child_path(path, key)):
+                    return False
+            return True
+
+        self.n_compared += 1
+        if calculated != expected:
+            self.n_different += 1
+            self._record_value_mismatch(path, "값 불일치")
+        return True
+
+
+def compare_values(calculated: Any, expected: Any, abs_tol: float = 0.01,
+                   rel_tol: float = 0.0, group_key: Optional[str] = None) -> StructuralComparison:
+    """
+    중첩 결과 구조 비교
+
+    수치 원소는 |calculated - expected| <= abs_tol + rel_tol * |expected| 이면 일치로 판단합니다.
+
+    Args:
+        calculated: 계산 결과 (LLM 산출)
+        expected: 기준 결과 (MongoDB 직접 실행 또는 정답)
+        abs_tol: 절대 허용 오차
+        rel_tol: 상대 허용 오차
+        group_key: 지정 시 이 키를 가진 문서 리스트는 순서와 무관하게 키로 조인하여 비교
+
+    Returns:
+        StructuralComparison: 일치 여부, 첫 불일치 경로, 요약 통계
+    """
+    comparator = _Comparator(abs_tol, rel_tol, group_key)
+    structural_ok = comparator.walk(calculated, expected, "$")
+
+    return StructuralComparison(
+        match=structural_ok and comparator.n_different == 0,
+        mismatch_path=comparator.mismatch_path,
+        reason=comparator.reason,
+        structural=comparator.structural,
+        n_compared=comparator.n_compared,
+        n_different=comparator.n_different,
+        max_abs_diff=comparator.max_abs_diff,
+    )
@@ -0,0 +1,450 @@
+"""
+LLM vs MongoDB 차이의 분포 드리프트 감지
+
+실행별 정답 일치율은 느린 드리프트(모델 업데이트 후 avg_session_time의 상대 오차가
+조금씩 커지는 현상 등)를 드러내지 못합니다. 이 모듈은 지표 키별 부호 있는 상대 차이
+((LLM 값 - MongoDB 값) / |MongoDB 값|)를 윈도우 단위로 모으고, 기준 윈도우와 현재 윈도우를
+키별 2표본 검정(KS, PSI, Wasserstein)으로 비교합니다. (Evidently 데이터 드리프트 지표와 같은 구성)
+
+- 원본 값을 정렬하지 않고 모든 윈도우가 공유하는 고정 경계 히스토그램(키 × 구간 카운트 행렬)에 누적
+- 구간은 asinh 스케일 등간격이라 0 근처는 세밀하고 큰 오차까지 한 범위에 담김
+- 검정 통계량은 모든 키에 대해 행렬 연산 한 번으로 계산 (키 수천 개, 표본 수백만 개)
+- 같은 구간 설정의 윈도우끼리는 카운트 합산으로 병합 (배치/워커 결과 결합)
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterable, Sequence
+
+import numpy as np
+
+from .core import COMPARISON_MATCH, COMPARISON_MISMATCH, EvaluationMetrics
+
+
+# 드리프트 판정 기본 임계값
+DEFAULT_PSI_THRESHOLD = 0.2        # PSI > 0.2: 유의미한 분포 변화 (업계 관행)
+DEFAULT_KS_PVALUE = 0.05           # KS 검정 p-value < 0.05
+DEFAULT_MIN_SAMPLES = 30           # 양쪽 윈도우 모두 이 표본 수 이상일 때만 판정
+
+# PSI 계산 구간 수 (기준 윈도우 분위수 기준으로 세밀한 구간을 묶음)
+PSI_BINS = 10
+
+# PSI 로그 계산 시 빈 구간 비율 하한
+_PSI_EPSILON = 1e-4
+
+
+def relative_error(llm_value: Any, mongodb_value: Any) -> Optional[float]:
+    """
+    부호 있는 상대 차이 ((LLM 값 - MongoDB 값) / |MongoDB 값|)
+
+    수치 쌍만 대상이며 불리언, 중첩 결과, MongoDB 값 0, NaN/무한대는 None입니다.
+    """
+    if isinstance(llm_value, bool) or isinstance(mongodb_value, bool):
+        return None
+    if not isinstance(llm_value, (int, float)) or not isinstance(mongodb_value, (int, float)):
+        return None
+    if mongodb_value == 0:
+        return None
+    value = (llm_value - mongodb_value) / abs(mongodb_value)
+    return value if math.isfinite(value) else None
+
+
+class DriftBins:
+    """
+    모든 윈도우가 공유하는 고정 히스토그램 구간
+
+    값 x를 asinh(x / scale) 스케일의 [-limit, limit] 범위 등간격 구간에 넣습니다.
+    범위를 벗어난 값은 양 끝 구간에 포함됩니다.
+
+    Args:
+        n_bins: 구간 수 (기본 512 - 상대 오차 1% 이상 영역에서 구간 폭이 값의 약 6%)
+        scale: 선형에 가까운 구간이 유지되는 값의 크기 (기본 0.1% 상대 오차)
+        limit: 표현 범위 (기본 ±1000배 상대 오차)
+    """
+
+    __slots__ = ("n_bins", "scale", "limit", "_low", "_width", "centers")
+
+    def __init__(self, n_bins: int = 512, scale: float = 1e-3, limit: float = 1e3):
+        if n_bins < 2:
+            raise ValueError(f"n_bins는 2 이상이어야 합니다: {n_bins}")
+        self.n_bins = n_bins
+        self.scale = scale
+        self.limit = limit
+        high = math.asinh(limit / scale)
+        self._low = -high
+        self._width = 2 * high / n_bins
+        # 구간 중심값 (원래 값 스케일) - Wasserstein 거리 계산용
+        self.centers = np.sinh(self._low + self._width * (np.arange(n_bins) + 0.5)) * scale
+
+    def index(self, values: np.ndarray) -> np.ndarray:
+        """값 배열 → 구간 번호 배열"""
+        positions = (np.arcsinh(np.asarray(values, dtype=np.float64) / self.scale) - self._low) / self._width
+        return np.clip(positions, 0, self.n_bins - 1).astype(np.intp)
+
+    def signature(self) -> tuple:
+        return (self.n_bins, self.scale, self.limit)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DriftBins) and self.signature() == other.signature()
+
+    def __hash__(self) -> int:
+        return hash(self.signature())
+
+    def __getstate__(self):
+        return self.signature()
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+class DriftWindow:
+    """
+    지표 키별 상대 차이 히스토그램 윈도우
+
+    키 순서대로 행을 배정한 (키 수 × 구간 수) 카운트 행렬과 키별 합계를 유지합니다.
+    메모리는 키 수 × 구간 수에 비례하고 표본 수와 무관합니다.
+    """
+
+    def __init__(self, bins: Optional[DriftBins] = None, name: str = ""):
+        self.bins = bins if bins is not None else DriftBins()
+        self.name = name
+        self.runs = 0
+        self._keys: Dict[str, int] = {}
+        self._counts = np.zeros((0, self.bins.n_bins), dtype=np.int64)
+        self._sums = np.zeros(0, dtype=np.float64)
+
+    # ------------------------------------------------------------------ 키 관리
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _rows(self, keys: Iterable[str]) -> np.ndarray:
+        """키 → 행 번호 (새 키는 행 추가, 용량은 2배씩 증가)"""
+        index = self._keys
+        rows = np.fromiter((index.setdefault(key, len(index)) for key in keys), dtype=np.intp)
+        if len(index) > len(self._counts):
+            capacity = max(len(index), 2 * len(self._counts), 16)
+            counts = np.zeros((capacity, self.bins.n_bins), dtype=np.int64)
+            counts[:len(self._counts)] = self._counts
+            sums = np.zeros(capacity, dtype=np.float64)
+            sums[:len(self._sums)] = self._sums
+            self._counts, self._sums = counts, sums
+        return rows
+
+    @property
+    def counts(self) -> np.ndarray:
+        """(키 수 × 구간 수) 카운트 행렬 (keys 순서)"""
+        return self._counts[:len(self._keys)]
+
+    @property
+    def totals(self) -> np.ndarray:
+        """키별 표본 수"""
+        return self.counts.sum(axis=1)
+
+    @property
+    def sample_count(self) -> int:
+        return int(self.counts.sum())
+
+    # ------------------------------------------------------------------ 누적
+
+    def add_samples(self, keys: Sequence[str], values: Sequence[float]) -> None:
+        """(키, 상대 차이) 표본 일괄 추가 - NaN/무한대 값은 건너뜀"""
+        values = np.asarray(values, dtype=np.float64)
+        if len(keys) != len(values):
+            raise ValueError(f"keys 길이({len(keys)})와 values 길이({len(values)})가 다릅니다")
+        if not len(values):
+            return
+        rows = self._rows(keys)
+        finite = np.isfinite(values)
+        if not finite.all():
+            rows, values = rows[finite], values[finite]
+        n_rows, n_bins = self._counts.shape
+        columns = self.bins.index(values)
+        if len(values) * 8 < n_rows * n_bins:
+            # 표본이 행렬보다 훨씬 작으면 (실행 단위 누적) 해당 칸만 갱신
+            np.add.at(self._counts, (rows, columns), 1)
+            np.add.at(self._sums, rows, values)
+        else:
+            flat = rows * n_bins + columns
+            self._counts += np.bincount(flat, minlength=n_rows * n_bins).reshape(n_rows, n_bins)
+            self._sums += np.bincount(rows, weights=values, minlength=n_rows)
+
+    def add(self, key: str, values: Iterable[float]) -> None:
+        """한 키의 상대 차이 배열 추가"""
+        if isinstance(values, np.ndarray):
+            values = values.astype(np.float64, copy=False)
+        else:
+            values = np.fromiter(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        row = self._rows([key])[0]
+        self._counts[row] += np.bincount(self.bins.index(values), minlength=self.bins.n_bins)
+        self._sums[row] += values.sum()
+
+    def observe(self, metrics: EvaluationMetrics) -> int:
+        """
+        평가 결과 하나의 비교 원본 쌍에서 상대 차이 추가
+
+        comparison_rows가 필요하므로 평가기의 comparison_mode가 "none"이면 추가되는 표본이 없습니다.
+
+        Returns:
+            int: 추가한 표본 수
+        """
+        self.runs += 1
+        rows = metrics.comparison_rows
+        if rows is None:
+            return 0
+        keys, values = [], []
+        for key, llm_value, mongodb_value, status in zip(rows.keys, rows.llm_values,
+                                                         rows.mongodb_values, rows.statuses):
+            if status != COMPARISON_MATCH and status != COMPARISON_MISMATCH:
+                continue
+            value = relative_error(llm_value, mongodb_value)
+            if value is not None:
+                keys.append(key)
+                values.append(value)
+        self.add_samples(keys, values)
+        return len(values)
+
+    def merge(self, other: "DriftWindow") -> "DriftWindow":
+        """다른 윈도우를 이 윈도우에 합침 (같은 구간 설정 필요). self 반환"""
+        if other.bins != self.bins:
+            raise ValueError("구간 설정이 다른 윈도우는 병합할 수 없습니다")
+        if len(other):
+            rows = self._rows(other.keys)
+            self._counts[rows] += other.counts
+            self._sums[rows] += other._sums[:len(other)]
+        self.runs += other.runs
+        return self
+
+    def aligned(self, keys: Sequence[str]) -> tuple:
+        """주어진 키 순서의 (카운트 행렬, 합계) - 없는 키는 0 행"""
+        counts = np.zeros((len(keys), self.bins.n_bins), dtype=np.int64)
+        sums = np.zeros(len(keys), dtype=np.float64)
+        index = self._keys
+        positions = [(i, index[key]) for i, key in enumerate(keys) if key in index]
+        if positions:
+            target, source = np.array(positions, dtype=np.intp).T
+            counts[target] = self._counts[source]
+            sums[target] = self._sums[source]
+        return counts, sums
+
+    def __getstate__(self):
+        n_keys = len(self._keys)
+        return (self.bins, self.name, self.runs, list(self._keys),
+                self._counts[:n_keys].copy(), self._sums[:n_keys].copy())
+
+    def __setstate__(self, state):
+        self.bins, self.name, self.runs, keys, self._counts, self._sums = state
+        self._keys = {key: i for i, key in enumerate(keys)}
+
+    def __repr__(self) -> str:
+        return f"DriftWindow(name={self.name!r}, runs={self.runs}, keys={len(self)}, samples={self.sample_count})"
+
+
+def _ks_pvalue(statistic: np.ndarray, n_reference: np.ndarray, n_current: np.ndarray) -> np.ndarray:
+    """2표본 KS 검정 점근 p-value (Stephens 보정 Kolmogorov 분포)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective = n_reference * n_current / (n_reference + n_current)
+        root = np.sqrt(effective)
+        lam = (root + 0.12 + 0.11 / root) * statistic
+    k = np.arange(1, 101, dtype=np.float64)[:, None]
+    terms = 2 * (-1) ** (k - 1) * np.exp(-2 * k ** 2 * lam[None, :] ** 2)
+    pvalue = np.clip(terms.sum(axis=0), 0.0, 1.0)
+    # λ가 매우 작으면 급수가 수렴하지 않으므로 p = 1
+    pvalue = np.where(lam < 0.2, 1.0, pvalue)
+    return np.where(effective > 0, pvalue, np.nan)
+
+
+def _psi(reference: np.ndarray, current: np.ndarray, reference_cdf: np.ndarray,
+         n_groups: int = PSI_BINS) -> np.ndarray:
+    """기준 윈도우 분위수로 세밀한 구간을 n_groups개로 묶은 PSI (행별)"""
+    n_keys, n_bins = reference.shape
+    # 각 세밀한 구간이 시작되는 지점의 기준 누적 비율로 묶음 번호 결정
+    start_cdf = reference_cdf - reference / np.maximum(reference.sum(axis=1, keepdims=True), 1)
+    groups = np.minimum((start_cdf * n_groups + 1e-9).astype(np.intp), n_groups - 1)
+    flat = (np.arange(n_keys)[:, None] * n_groups + groups).ravel()
+    size = n_keys * n_groups
+    expected = np.bincount(flat, weights=reference.ravel(), minlength=size).reshape(n_keys, n_groups)
+    actual = np.bincount(flat, weights=current.ravel(), minlength=size).reshape(n_keys, n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.maximum(expected / expected.sum(axis=1, keepdims=True), _PSI_EPSILON)
+        actual = np.maximum(actual / actual.sum(axis=1, keepdims=True), _PSI_EPSILON)
+        return ((actual - expected) * np.log(actual / expected)).sum(axis=1)
+
+
+@dataclass
+class DriftReport:
+    """기준 윈도우 vs 현재 윈도우 키별 드리프트 검정 결과 (배열은 keys 순서)"""
+    reference: str                 # 기준 윈도우 이름
+    current: str                   # 현재 윈도우 이름
+    keys: List[str]
+    n_reference: np.ndarray        # 키별 표본 수
+    n_current: np.ndarray
+    mean_reference: np.ndarray     # 키별 평균 상대 차이
+    mean_current: np.ndarray
+    ks_statistic: np.ndarray       # 누적 분포 최대 차이
+    ks_pvalue: np.ndarray
+    psi: np.ndarray                # Population Stability Index
+    wasserstein: np.ndarray        # 1차 Wasserstein 거리 (상대 차이 단위)
+    drift: np.ndarray              # 드리프트 판정 (표본 부족 시 False)
+
+    def drifted_keys(self) -> List[str]:
+        """드리프트로 판정된 키 (PSI 내림차순)"""
+        order = np.argsort(-np.nan_to_num(self.psi, nan=-1.0), kind="stable")
+        return [self.keys[i] for i in order if self.drift[i]]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """키 → 검정 결과 딕셔너리"""
+        columns = ("n_reference", "n_current", "mean_reference", "mean_current",
+                   "ks_statistic", "ks_pvalue", "psi", "wasserstein", "drift")
+        arrays = [getattr(self, column).tolist() for column in columns]
+        return {key: dict(zip(columns, values)) for key, values in zip(self.keys, zip(*arrays))}
+
+    def to_dataframe(self):
+        """키당 1행 DataFrame"""
+        import pandas as pd
+        return pd.DataFrame({
+            "key": self.keys,
+            "n_reference": self.n_reference,
+            "n_current": self.n_current,
+            "mean_reference": self.mean_reference,
+            "mean_current": self.mean_current,
+            "ks_statistic": self.ks_statistic,
+            "ks_pvalue": self.ks_pvalue,
+            "psi": self.psi,
+            "wasserstein": self.wasserstein,
+            "drift": self.drift,
+        })
+
+
+def compare_windows(reference: DriftWindow, current: DriftWindow,
+                    keys: Optional[Sequence[str]] = None,
+                    psi_threshold: float = DEFAULT_PSI_THRESHOLD,
+                    ks_pvalue: float = DEFAULT_KS_PVALUE,
+                    min_samples: int = DEFAULT_MIN_SAMPLES) -> DriftReport:
+    """
+    두 윈도우의 키별 분포 비교 (KS, PSI, Wasserstein)
+
+    Args:
+        reference: 기준 윈도우
+        current: 현재 윈도우
+        keys: 비교할 키 (기본: 두 윈도우 키의 합집합, 기준 윈도우 순서 우선)
+        psi_threshold: PSI가 이 값을 넘으면 드리프트
+        ks_pvalue: KS 검정 p-value가 이 값보다 작으면 드리프트
+        min_samples: 양쪽 표본 수가 모두 이 값 이상인 키만 드리프트로 판정
+
+    Returns:
+        DriftReport: 키별 검정 결과
+    """
+    if reference.bins != current.bins:
+        raise ValueError("구간 설정이 다른 윈도우는 비교할 수 없습니다")
+    if keys is None:
+        keys = reference.keys + [key for key in current.keys if key not in reference._keys]
+    keys = list(keys)
+    reference_counts, reference_sums = reference.aligned(keys)
+    current_counts, current_sums = current.aligned(keys)
+    n_reference = reference_counts.sum(axis=1)
+    n_current = current_counts.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reference_cdf = np.cumsum(reference_counts, axis=1) / n_reference[:, None]
+        current_cdf = np.cumsum(current_counts, axis=1) / n_current[:, None]
+        difference = np.abs(reference_cdf - current_cdf)
+        ks_statistic = difference.max(axis=1) if len(keys) else np.zeros(0)
+        # 구간 중심 사이 간격으로 적분한 누적 분포 차이
+        wasserstein = (difference[:, :-1] * np.diff(reference.bins.centers)).sum(axis=1)
+        mean_reference = reference_sums / n_reference
+        mean_current = current_sums / n_current
+    empty = (n_reference == 0) | (n_current == 0)
+    ks_statistic = np.where(empty, np.nan, ks_statistic)
+    wasserstein = np.where(empty, np.nan, wasserstein)
+    pvalue = _ks_pvalue(np.nan_to_num(ks_statistic), n_reference.astype(np.float64),
+                        n_current.astype(np.float64))
+    psi = np.where(empty, np.nan, _psi(reference_counts, current_counts, np.nan_to_num(reference_cdf)))
+
+    enough = (n_reference >= min_samples) & (n_current >= min_samples)
+    drift = enough & ((np.nan_to_num(psi) > psi_threshold) | (np.nan_to_num(pvalue, nan=1.0) < ks_pvalue))
+
+    return DriftReport(
+        reference=reference.name,
+        current=current.name,
+        keys=keys,
+        n_reference=n_reference,
+        n_current=n_current,
+        mean_reference=mean_reference,
+        mean_current=mean_current,
+        ks_statistic=ks_statistic,
+        ks_pvalue=pvalue,
+        psi=psi,
+        wasserstein=wasserstein,
+        drift=drift,
+    )
+
+
+class DriftMonitor:
+    """
+    평가 결과 스트림의 윈도우 단위 드리프트 감시
+
+    평가 결과를 observe()로 받아 window_runs회마다 현재 윈도우를 마감하고
+    기준 윈도우와 비교합니다. 기준 윈도우를 주지 않으면 첫 번째 마감 윈도우가 기준이 됩니다.
+
+    Args:
+        window_runs: 윈도우 크기 (실행 수)
+        reference: 기준 윈도우 (선택적, 예: 모델 업데이트 전 평가 결과)
+        rolling_reference: True이면 비교 후 마감 윈도우를 다음 기준으로 사용 (직전 윈도우 대비)
+        on_report: 윈도우 마감 시 DriftReport를 받는 콜백
+        bins: 히스토그램 구간 설정
+        **thresholds: compare_windows()의 psi_threshold, ks_pvalue, min_samples
+    """
+
+    def __init__(self, window_runs: int = 1000, reference: Optional[DriftWindow] = None,
+                 rolling_reference: bool = False,
+                 on_report: Optional[Callable[[DriftReport], None]] = None,
+                 bins: Optional[DriftBins] = None, **thresholds):
+        if window_runs < 1:
+            raise ValueError(f"window_runs는 1 이상이어야 합니다: {window_runs}")
+        self.window_runs = window_runs
+        self.bins = reference.bins if reference is not None else (bins or DriftBins())
+        self.reference = reference
+        self.rolling_reference = rolling_reference
+        self.on_report = on_report
+        self.thresholds = thresholds
+        self.windows = 0
+        self.reports: List[DriftReport] = []
+        self.current = self._new_window()
+
+    def _new_window(self) -> DriftWindow:
+        return DriftWindow(self.bins, name=f"window_{self.windows}")
+
+    def observe(self, metrics: EvaluationMetrics) -> Optional[DriftReport]:
+        """평가 결과 추가. 윈도우가 마감되어 비교한 경우 DriftReport 반환"""
+        self.current.observe(metrics)
+        if self.current.runs >= self.window_runs:
+            return self.close_window()
+        return None
+
+    def close_window(self) -> Optional[DriftReport]:
+        """현재 윈도우를 마감하고 기준 윈도우와 비교 (기준이 없으면 기준으로 설정)"""
+        closed = self.current
+        self.windows += 1
+        self.current = self._new_window()
+        if self.reference is None:
+            self.reference = closed
+            return None
+        report = compare_windows(self.reference, closed, **self.thresholds)
+        self.reports.append(report)
+        if self.rolling_reference:
+            self.reference = closed
+        if self.on_report is not None:
+            self.on_report(report)
+        return report
+
+    def compare(self) -> Optional[DriftReport]:
+        """마감 전 현재 윈도우를 기준 윈도우와 비교 (기준이 없으면 None)"""
+        if self.reference is None:
+            return None
+        return compare_windows(self.reference, self.current, **self.thresholds)
@@ -0,0 +1,758 @@
+"""
+인메모리 집계 파이프라인 실행기
+
+라이브 MongoDB 서버 없이 컬렉션 스냅샷(pandas DataFrame)에 대해 셸 형식 쿼리를 실행하여
+direct_mongodb_results(정답 기준값)를 오프라인으로 계산합니다.
+
+지원 범위
+- 메서드: find, findOne, aggregate, countDocuments, count, distinct
+  (체이닝: sort, skip, limit, count, toArray)
+- 스테이지: $match, $group ($sum, $avg, $min, $max, $first, $last, $push, $addToSet, $count),
+  $project, $sort, $skip, $limit, $count, $unwind
+- 식: "$필드", $size, $add, $subtract, $multiply, $divide, $round, $literal
+- 쿼리 연산자: $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $exists, $regex, $size, $not,
+  $and, $or, $nor
+
+스냅샷에서는 누락 필드와 null을 구분하지 않습니다. 필터와 그룹 집계는 NumPy/pandas
+벡터 연산으로 수행하고, 쿼리별 실행 시간은 execution_logs 형식으로 기록합니다.
+"""
+
+import json
+import operator
+import re
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .shell import ShellQuery, parse_shell_query, resolve_now
+
+
+# execution_logs의 tool 값
+EXECUTOR_TOOL = "pandas_executor"
+
+_COMPARISONS = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+_REGEX_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+
+_ARITHMETIC = {
+    "$add": np.add,
+    "$subtract": np.subtract,
+    "$multiply": np.multiply,
+    "$divide": np.divide,
+}
+
+CollectionData = Union[pd.DataFrame, Iterable[Dict[str, Any]]]
+
+
+class UnsupportedQueryError(ValueError):
+    """실행기가 지원하지 않는 메서드, 스테이지, 연산자"""
+
+
+@dataclass
+class ExecutionRun:
+    """쿼리 목록 실행 결과"""
+    outputs: List[Any]                                          # 쿼리별 결과 (실패 시 None)
+    execution_logs: List[Dict[str, Any]]                        # 쿼리별 실행 로그
+    result_keys: List[Optional[str]] = field(default_factory=list)  # 쿼리별 결과 이름 (선택적)
+
+    def direct_results(self) -> Dict[str, Any]:
+        """
+        direct_mongodb_results 형식으로 변환
+
+        - result_keys에 이름이 지정된 쿼리: 결과 전체를 해당 이름으로 저장
+        - 문서 하나를 반환한 쿼리: _id를 제외한 각 필드를 지표로 저장
+        - 그 외: "query_<인덱스>" 이름으로 결과 전체를 저장
+        """
+        results: Dict[str, Any] = {}
+        for index, (output, log) in enumerate(zip(self.outputs, self.execution_logs)):
+            if log["status"] != "success":
+                continue
+            name = self.result_keys[index] if index < len(self.result_keys) else None
+            if name is not None:
+                results[name] = output
+                continue
+            document = output[0] if isinstance(output, list) and len(output) == 1 else output
+            if isinstance(document, dict):
+                results.update((key, value) for key, value in document.items() if key != "_id")
+            else:
+                results[f"query_{index}"] = output
+        return results
+
+
+def _missing_series(df: pd.DataFrame) -> pd.Series:
+    return pd.Series(np.nan, index=df.index)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or value is pd.NaT or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+def _get_path(value: Any, parts: List[str]) -> Any:
+    for part in parts:
+        if isinstance(value, dict):
+            value = value.get(part, np.nan)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return np.nan
+    return value
+
+
+def _field(df: pd.DataFrame, path: str) -> pd.Series:
+    """필드 경로(점 표기 포함)의 값 컬럼 (누락은 NaN)"""
+    if path in df.columns:
+        return df[path]
+    head, _, rest = path.partition(".")
+    if rest and head in df.columns:
+        parts = rest.split(".")
+        return df[head].map(lambda value: _get_path(value, parts))
+    return _missing_series(df)
+
+
+def _numeric(series: pd.Series) -> np.ndarray:
+    """수치 값만 float64로 (문자열, bool, 누락은 NaN)"""
+    kind = series.dtype.kind
+    if kind in "iuf":
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    if kind != "O":
+        return np.full(len(series), np.nan)
+    values = series.to_numpy(dtype=object)
+    is_number = np.fromiter((type(value) in (int, float) for value in values), dtype=bool, count=len(values))
+    numbers = np.full(len(values), np.nan)
+    numbers[is_number] = values[is_number].astype(np.float64)
+    return numbers
+
+
+def _is_integral(series: pd.Series) -> bool:
+    """정수 값만 들어 있는 컬럼인지 ($sum 결과 타입 결정)"""
+    kind = series.dtype.kind
+    if kind in "iu":
+        return True
+    if kind != "O":
+        return False
+    return all(type(value) is int for value in series if not _is_missing(value) and type(value) in (int, float))
+
+
+def _type_mask(series: pd.Series, types) -> np.ndarray:
+    return np.fromiter((isinstance(value, types) for value in series), dtype=bool, count=len(series))
+
+
+def _has_lists(series: pd.Series) -> bool:
+    return series.dtype == object and bool(_type_mask(series, list).any())
+
+
+# ---------------------------------------------------------------------------
+# 쿼리 필터 ($match / find)
+# ---------------------------------------------------------------------------
+
+def _equals(series: pd.Series, value: Any) -> np.ndarray:
+    if value is None:
+        return series.isna().to_numpy()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        mask = _numeric(series) == value
+    else:
+        try:
+            mask = (series == value).to_numpy(dtype=bool, na_value=False)
+        except (TypeError, ValueError):
+            mask = np.fromiter((item == value for item in series), dtype=bool, count=len(series))
+    if _has_lists(series):
+        # 배열 필드는 원소 중 하나라도 같으면 일치
+        contains = series.map(lambda item: isinstance(item, list) and value in item)
+        mask = mask | contains.to_numpy(dtype=bool)
+    return mask
+
+
+def _compare(series: pd.Series, op, value: Any) -> np.ndarray:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        with np.errstate(invalid="ignore"):
+            return op(_numeric(series), value)
+    if isinstance(value, str):
+        strings = _type_mask(series, str)
+        mask = np.zeros(len(series), dtype=bool)
+        mask[strings] = [op(item, value) for item in series[strings]]
+        return mask
+    try:
+        return op(series, value).to_numpy(dtype=bool, na_value=False)
+    except TypeError:
+        return np.fromiter((_safe_compare(op, item, value) for item in series), dtype=bool, count=len(series))
+
+
+def _safe_compare(op, left: Any, right: Any) -> bool:
+    try:
+        return bool(op(left, right))
+    except TypeError:
+        return False
+
+
+def _regex(series: pd.Series, pattern: str, options: str = "") -> np.ndarray:
+    flags = 0
+    for option in options:
+        flags |= _REGEX_FLAGS.get(option, 0)
+    compiled = re.compile(pattern, flags)
+    if series.dtype.kind in "iufbM":
+        return np.zeros(len(series), dtype=bool)
+    return series.map(lambda item: isinstance(item, str) and compiled.search(item) is not None).to_numpy(dtype=bool)
+
+
+def _in(series: pd.Series, values: List[Any]) -> np.ndarray:
+    mask = series.isin([value for value in values if value is not None]).to_numpy(dtype=bool)
+    if any(value is None for value in values):
+        mask = mask | series.isna().to_numpy()
+    if _has_lists(series):
+        contains = series.map(lambda item: isinstance(item, list) and any(value in item for value in values))
+        mask = mask | contains.to_numpy(dtype=bool)
+    return mask
+
+
+def _operator_mask(series: pd.Series, conditions: Dict[str, Any]) -> np.ndarray:
+    mask = np.ones(len(series), dtype=bool)
+    for name, value in conditions.items():
+        if name == "$eq":
+            mask &= _equals(series, value)
+        elif name == "$ne":
+            mask &= ~_equals(series, value)
+        elif name in _COMPARISONS:
+            mask &= _compare(series, _COMPARISONS[name], value)
+        elif name == "$in":
+            mask &= _in(series, value)
+        elif name == "$nin":
+            mask &= ~_in(series, value)
+        elif name == "$exists":
+            present = series.notna().to_numpy()
+            mask &= present if value else ~present
+        elif name == "$regex":
+            pattern = value["$regex"] if isinstance(value, dict) else value
+            options = conditions.get("$options", value.get("$options", "") if isinstance(value, dict) else "")
+            mask &= _regex(series, pattern, options)
+        elif name == "$options":
+            continue
+        elif name == "$size":
+            mask &= series.map(lambda item: isinstance(item, list) and len(item) == value).to_numpy(dtype=bool)
+        elif name == "$not":
+            inner = value if isinstance(value, dict) else {"$regex": value}
+            mask &= ~_operator_mask(series, inner)
+        else:
+            raise UnsupportedQueryError(f"지원하지 않는 쿼리 연산자입니다: {name}")
+    return mask
+
+
+def _is_operator_document(value: Any) -> bool:
+    return isinstance(value, dict) and bool(value) and all(key.startswith("$") for key in value)
+
+
+def _filter_mask(df: pd.DataFrame, query: Dict[str, Any]) -> np.ndarray:
+    """쿼리 필터를 행 마스크로 변환"""
+    mask = np.ones(len(df), dtype=bool)
+    for key, condition in query.items():
+        if key in ("$and", "$or", "$nor"):
+            masks = [_filter_mask(df, clause) for clause in condition]
+            if key == "$and":
+                combined = np.logical_and.reduce(masks) if masks else np.ones(len(df), dtype=bool)
+            else:
+                combined = np.logical_or.reduce(masks) if masks else np.zeros(len(df), dtype=bool)
+                if key == "$nor":
+                    combined = ~combined
+            mask &= combined
+        elif key.startswith("$"):
+            raise UnsupportedQueryError(f"지원하지 않는 최상위 연산자입니다: {key}")
+        elif _is_operator_document(condition):
+            mask &= _operator_mask(_field(df, key), condition)
+        else:
+            mask &= _equals(_field(df, key), condition)
+    return mask
+
+
+# ---------------------------------------------------------------------------
+# 식 ($project, $group)
+# ---------------------------------------------------------------------------
+
+def _constant(df: pd.DataFrame, value: Any) -> pd.Series:
+    series = pd.Series([value] * len(df), index=df.index, dtype=object)
+    return series
+
+
+def _expression(df: pd.DataFrame, expression: Any) -> pd.Series:
+    """집계 식을 컬럼으로 계산"""
+    if isinstance(expression, str) and expression.startswith("$") and not expression.startswith("$$"):
+        return _field(df, expression[1:])
+    if not _is_operator_document(expression):
+        if isinstance(expression, dict):
+            raise UnsupportedQueryError("중첩 문서 식은 지원하지 않습니다")
+        return _constant(df, expression)
+    if len(expression) != 1:
+        raise UnsupportedQueryError(f"식에는 연산자가 하나만 있어야 합니다: {list(expression)}")
+
+    name, argument = next(iter(expression.items()))
+    if name == "$literal":
+        return _constant(df, argument)
+    if name == "$size":
+        values = _expression(df, argument[0] if isinstance(argument, list) else argument)
+        if not _type_mask(values, list).all():
+            raise ValueError("$size의 인자는 배열이어야 합니다")
+        return values.map(len)
+    if name in _ARITHMETIC:
+        operands = [_numeric(_expression(df, item)) for item in argument]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = _ARITHMETIC[name].reduce(operands) if name in ("$add", "$multiply") \
+                else _ARITHMETIC[name](operands[0], operands[1])
+        return pd.Series(result, index=df.index)
+    if name == "$round":
+        arguments = argument if isinstance(argument, list) else [argument]
+        places = arguments[1] if len(arguments) > 1 else 0
+        return pd.Series(np.round(_numeric(_expression(df, arguments[0])), places), index=df.index)
+    raise UnsupportedQueryError(f"지원하지 않는 식 연산자입니다: {name}")
+
+
+# ---------------------------------------------------------------------------
+# 스테이지
+# ---------------------------------------------------------------------------
+
+def _group_codes(df: pd.DataFrame, id_spec: Any):
+    """그룹 코드(첫 등장 순서)와 그룹별 _id 값"""
+    if isinstance(id_spec, dict) and not _is_operator_document(id_spec):
+        names = list(id_spec)
+        columns = [_expression(df, id_spec[name]) for name in names]
+    else:
+        names = None
+        columns = [_expression(df, id_spec)]
+
+    codes = np.zeros(len(df), dtype=np.int64)
+    uniques_per_column = []
+    for column in columns:
+        # 누락 값도 하나의 그룹 (use_na_sentinel=False는 pandas 1.5 이상이라 코드 -1을 직접 변환)
+        column_codes, uniques = pd.factorize(column)
+        missing = column_codes < 0
+        if missing.any():
+            column_codes = np.where(missing, len(uniques), column_codes)
+            uniques = np.append(np.asarray(uniques, dtype=object), None)
+        codes = codes * max(len(uniques), 1) + column_codes
+        uniques_per_column.append((column_codes, uniques))
+    codes, first_rows = pd.factorize(codes)
+    _, first_positions = np.unique(codes, return_index=True)
+    key_values = [
+        [None if _is_missing(value) else value for value in uniques[column_codes[first_positions]].tolist()]
+        for column_codes, uniques in uniques_per_column
+    ]
+    if names is None:
+        ids = key_values[0]
+    else:
+        ids = [dict(zip(names, values)) for values in zip(*key_values)]
+    return codes, len(first_rows), ids, first_positions
+
+
+def _accumulate(df: pd.DataFrame, codes: np.ndarray, n_groups: int,
+                first_positions: np.ndarray, name: str, argument: Any) -> List[Any]:
+    if name == "$count":
+        return np.bincount(codes, minlength=n_groups).tolist()
+    if name == "$sum" and isinstance(argument, (int, float)) and not isinstance(argument, bool):
+        # {$sum: 1} 등 상수 합계는 그룹 크기로 계산
+        return (np.bincount(codes, minlength=n_groups) * argument).tolist()
+
+    values = _expression(df, argument)
+
+    if name in ("$sum", "$avg"):
+        numbers = _numeric(values)
+        present = ~np.isnan(numbers)
+        sums = np.bincount(codes, weights=np.where(present, numbers, 0.0), minlength=n_groups)
+        if name == "$sum":
+            if _is_integral(values):
+                return sums.astype(np.int64).tolist()
+            return sums.tolist()
+        counts = np.bincount(codes, weights=present, minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        return [None if count == 0 else mean for mean, count in zip(means.tolist(), counts.tolist())]
+
+    if name in ("$first", "$last"):
+        if name == "$first":
+            positions = first_positions
+        else:
+            _, reversed_positions = np.unique(codes[::-1], return_index=True)
+            positions = len(codes) - 1 - reversed_positions
+        return [None if _is_missing(value) else value for value in values.to_numpy(dtype=object)[positions]]
+
+    present = values.notna().to_numpy()
+    frame = pd.DataFrame({"group": codes[present], "value": values.to_numpy(dtype=object)[present]})
+
+    if name in ("$min", "$max"):
+        numbers = _numeric(values)
+        if not np.isnan(numbers[present]).any():
+            grouped = pd.Series(numbers).groupby(codes)
+            extreme = grouped.min() if name == "$min" else grouped.max()
+            result = extreme.reindex(range(n_groups)).tolist()
+            integral = _is_integral(values)
+            return [None if _is_missing(value) else (int(value) if integral else value) for value in result]
+        extreme = frame.groupby("group")["value"].agg(min if name == "$min" else max)
+        return [None if _is_missing(value) else value for value in extreme.reindex(range(n_groups)).tolist()]
+
+    if name in ("$push", "$addToSet"):
+        if name == "$addToSet":
+            try:
+                frame = frame.drop_duplicates()
+            except TypeError:
+                # 배열/문서 값은 정규화 JSON으로 중복 판단
+                keys = frame["value"].map(lambda value: json.dumps(value, sort_keys=True, default=str))
+                frame = frame[~pd.DataFrame({"group": frame["group"], "key": keys}).duplicated().to_numpy()]
+        # 그룹 순서로 정렬한 뒤 경계 위치에서 잘라 그룹별 리스트 생성
+        groups = frame["group"].to_numpy()
+        order = np.argsort(groups, kind="stable")
+        items = frame["value"].to_numpy(dtype=object)[order]
+        bounds = np.searchsorted(groups[order], np.arange(n_groups + 1))
+        return [items[start:end].tolist() for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+    raise UnsupportedQueryError(f"지원하지 않는 누산기입니다: {name}")
+
+
+def _group(df: pd.DataFrame, spec: Dict[str, Any]) -> pd.DataFrame:
+    if "_id" not in spec:
+        raise ValueError("$group에는 _id가 필요합니다")
+    if df.empty:
+        return pd.DataFrame(columns=list(spec))
+
+    codes, n_groups, ids, first_positions = _group_codes(df, spec["_id"])
+    columns = {"_id": _group_column(ids)}
+    for name, accumulator in spec.items():
+        if name == "_id":
+            continue
+        if not _is_operator_document(accumulator) or len(accumulator) != 1:
+            raise ValueError(f"$group 필드 '{name}'에는 누산기 하나가 필요합니다")
+        operator_name, argument = next(iter(accumulator.items()))
+        columns[name] = _group_column(_accumulate(df, codes, n_groups, first_positions, operator_name, argument))
+    return pd.DataFrame(columns, columns=list(columns))
+
+
+def _group_column(values: List[Any]) -> Union[List[Any], pd.Series]:
+    """
+    그룹 출력 컬럼 - null 결과($avg/$min/$max/$first/$last의 값 없는 그룹)가 있으면 object 컬럼
+
+    수치 컬럼으로 만들면 None이 NaN이 되어 누락 필드처럼 문서에서 빠지지만,
+    MongoDB는 누산기 필드를 항상 출력하고 값이 없으면 null을 반환합니다.
+    """
+    if any(value is None for value in values):
+        return pd.Series(values, dtype=object)
+    return values
+
+
+def _is_flag(value: Any, flag: int) -> bool:
+    return value is bool(flag) or (type(value) in (int, float) and value == flag)
+
+
+def _project(df: pd.DataFrame, spec: Dict[str, Any]) -> pd.DataFrame:
+    id_spec = spec.get("_id", 1)
+    fields = {key: value for key, value in spec.items() if key != "_id"}
+
+    excluded = [key for key, value in fields.items() if _is_flag(value, 0)]
+    if excluded or not fields:
+        if len(excluded) != len(fields):
+            raise ValueError("$project에서 포함과 제외를 함께 사용할 수 없습니다")
+        dropped = [key for key in excluded if key in df.columns]
+        if _is_flag(id_spec, 0) and "_id" in df.columns:
+            dropped.append("_id")
+        return df.drop(columns=dropped)
+
+    columns = {}
+    if isinstance(id_spec, (str, dict)):
+        columns["_id"] = _expression(df, id_spec)
+    elif not _is_flag(id_spec, 0) and "_id" in df.columns:
+        columns["_id"] = df["_id"]
+    for key, value in fields.items():
+        if _is_flag(value, 1):
+            columns[key] = _field(df, key)
+        else:
+            columns[key] = _expression(df, value)
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _sort_key(series: pd.Series, ascending: bool) -> np.ndarray:
+    """정렬 키 배열 (누락/null은 가장 작은 값)"""
+    if series.dtype.kind in "iufb":
+        keys = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        keys = np.where(np.isnan(keys), -np.inf, keys)
+    else:
+        try:
+            keys, _ = pd.factorize(series.to_numpy(dtype=object), sort=True)
+        except TypeError:
+            keys = _mixed_sort_key(series.to_numpy(dtype=object))
+    return keys if ascending else -keys
+
+
+def _mixed_type_order(value: Any):
+    # 누락/null < 수치 < 문자열 < 기타 (기타는 문자열 표현으로 비교)
+    if _is_missing(value):
+        return (0, 0)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return (3, str(value))
+
+
+def _mixed_sort_key(values: np.ndarray) -> np.ndarray:
+    """타입이 섞인 컬럼의 정렬 순위 (같은 값은 같은 순위)"""
+    orders = [_mixed_type_order(value) for value in values]
+    ranks = np.empty(len(values), dtype=np.int64)
+    rank = -1
+    previous = None
+    for position in sorted(range(len(values)), key=orders.__getitem__):
+        if previous is None or orders[position] != previous:
+            rank += 1
+            previous = orders[position]
+        ranks[position] = rank
+    return ranks
+
+
+def _sort(df: pd.DataFrame, spec: Dict[str, Any]) -> pd.DataFrame:
+    if df.empty:
+        return df
+    # lexsort는 마지막 키가 우선
+    keys = [_sort_key(_field(df, name), direction in (1, True)) for name, direction in reversed(list(spec.items()))]
+    return df.iloc[np.lexsort(keys)]
+
+
+def _unwind(df: pd.DataFrame, spec: Any) -> pd.DataFrame:
+    path = spec["path"] if isinstance(spec, dict) else spec
+    column = path.lstrip("$")
+    if column not in df.columns:
+        return df.iloc[0:0]
+    values = df[column]
+    keep = values.map(lambda value: not _is_missing(value) and value != []).to_numpy(dtype=bool)
+    return df[keep].explode(column).reset_index(drop=True)
+
+
+def _count(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    if df.empty:
+        return pd.DataFrame(columns=[name])
+    return pd.DataFrame({name: [len(df)]})
+
+
+def _run_stage(df: pd.DataFrame, stage: Dict[str, Any]) -> pd.DataFrame:
+    if not isinstance(stage, dict) or len(stage) != 1:
+        raise ValueError(f"파이프라인 스테이지는 연산자 하나를 가진 문서여야 합니다: {stage!r}")
+    name, spec = next(iter(stage.items()))
+    if name == "$match":
+        return df[_filter_mask(df, spec)]
+    if name == "$group":
+        return _group(df, spec)
+    if name == "$project":
+        return _project(df, spec)
+    if name == "$sort":
+        return _sort(df, spec)
+    if name == "$limit":
+        return df.iloc[:int(spec)]
+    if name == "$skip":
+        return df.iloc[int(spec):]
+    if name == "$count":
+        return _count(df, spec)
+    if name == "$unwind":
+        return _unwind(df, spec)
+    raise UnsupportedQueryError(f"지원하지 않는 파이프라인 스테이지입니다: {name}")
+
+
+def _nest(document: Dict[str, Any]) -> Dict[str, Any]:
+    nested: Dict[str, Any] = {}
+    for key, value in document.items():
+        target = nested
+        *parents, leaf = key.split(".")
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = value
+    return nested
+
+
+def _to_documents(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """DataFrame을 문서 리스트로 변환 (스냅샷에 없던 필드는 제외)"""
+    nested = any("." in str(column) for column in df.columns)
+    documents = []
+    for record in df.to_dict("records"):
+        document = {key: value for key, value in record.items()
+                    if value is None or not _is_missing(value)}
+        documents.append(_nest(document) if nested else document)
+    return documents
+
+
+def _distinct_values(series: pd.Series) -> List[Any]:
+    values = []
+    for value in series:
+        if isinstance(value, list):
+            values.extend(value)
+        elif not _is_missing(value):
+            values.append(value)
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:
+        unique = []
+        for value in values:
+            if value not in unique:
+                unique.append(value)
+        return unique
+
+
+def load_collection(path: Union[str, Path]) -> pd.DataFrame:
+    """컬렉션 스냅샷 파일 로드 (.jsonl, .json 배열, .csv, .parquet)"""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+    if suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            return pd.DataFrame(json.load(f))
+    if suffix == ".csv":
+        return pd.read_csv(path)
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    raise ValueError(f"지원하지 않는 스냅샷 형식입니다: {path}")
+
+
+class AggregationExecutor:
+    """
+    컬렉션 스냅샷 기반 쿼리 실행기
+
+    Args:
+        collections: 컬렉션 이름 → DataFrame 또는 문서 리스트
+    """
+
+    SNAPSHOT_SUFFIXES = (".jsonl", ".ndjson", ".json", ".csv", ".parquet")
+
+    def __init__(self, collections: Optional[Mapping[str, CollectionData]] = None):
+        self.collections: Dict[str, pd.DataFrame] = {}
+        for name, data in (collections or {}).items():
+            self.add_collection(name, data)
+
+    @classmethod
+    def from_directory(cls, directory: Union[str, Path]) -> "AggregationExecutor":
+        """디렉터리의 스냅샷 파일을 파일 이름(확장자 제외)을 컬렉션 이름으로 로드"""
+        executor = cls()
+        for path in sorted(Path(directory).iterdir()):
+            if path.suffix.lower() in cls.SNAPSHOT_SUFFIXES:
+                executor.add_collection(path.stem, load_collection(path))
+        return executor
+
+    def add_collection(self, name: str, data: CollectionData) -> None:
+        self.collections[name] = data if isinstance(data, pd.DataFrame) else pd.DataFrame(list(data))
+
+    def _collection(self, name: str) -> pd.DataFrame:
+        try:
+            return self.collections[name]
+        except KeyError:
+            raise KeyError(f"스냅샷에 없는 컬렉션입니다: {name}") from None
+
+    def run(self, query: Union[str, ShellQuery]) -> Any:
+        """
+        쿼리 하나 실행
+
+        Returns:
+            find/aggregate: 문서 리스트, findOne: 문서 또는 None,
+            count/countDocuments: 정수, distinct: 값 리스트
+        """
+        parsed = parse_shell_query(query) if isinstance(query, str) else query
+        parsed = resolve_now(parsed)   # 인자 없는 Date()는 실행 시각
+        df = self._collection(parsed.collection)
+        method, args = parsed.method, parsed.args
+
+        if method == "aggregate":
+            pipeline = args[0] if args else []
+            if isinstance(pipeline, dict):
+                pipeline = args
+            for stage in pipeline:
+                df = _run_stage(df, stage)
+        elif method in ("find", "findOne", "countDocuments", "count"):
+            if args and args[0]:
+                df = df[_filter_mask(df, args[0])]
+            if method in ("countDocuments", "count"):
+                return self._apply_count_options(len(df), args[1] if len(args) > 1 else {})
+        elif method == "distinct":
+            if not args:
+                raise ValueError("distinct에는 필드 이름이 필요합니다")
+            if len(args) > 1 and args[1]:
+                df = df[_filter_mask(df, args[1])]
+            return _distinct_values(_field(df, args[0]))
+        else:
+            raise UnsupportedQueryError(f"지원하지 않는 메서드입니다: {method}")
+
+        projection = args[1] if method in ("find", "findOne") and len(args) > 1 else None
+        for name, chain_args in parsed.chain:
+            if name == "sort":
+                df = _sort(df, chain_args[0])
+            elif name == "skip":
+                df = df.iloc[int(chain_args[0]):]
+            elif name == "limit":
+                df = df.iloc[:int(chain_args[0])] if chain_args[0] else df
+            elif name in ("count", "itcount", "size"):
+                return len(df)
+            elif name in ("toArray", "pretty"):
+                continue
+            else:
+                raise UnsupportedQueryError(f"지원하지 않는 체이닝 메서드입니다: {name}")
+
+        if projection:
+            df = _project(df, projection)
+        documents = _to_documents(df.iloc[:1] if method == "findOne" else df)
+        if method == "findOne":
+            return documents[0] if documents else None
+        return documents
+
+    @staticmethod
+    def _apply_count_options(count: int, options: Dict[str, Any]) -> int:
+        count = max(count - int(options.get("skip", 0)), 0)
+        if options.get("limit"):
+            count = min(count, int(options["limit"]))
+        return count
+
+    def execute(self, queries: List[str], result_keys: Optional[List[Optional[str]]] = None) -> ExecutionRun:
+        """
+        쿼리 목록 실행 - 실패한 쿼리는 error 로그로 기록하고 계속 진행
+
+        Args:
+            queries: 셸 형식 쿼리 리스트
+            result_keys: 쿼리별 결과 이름 (선택적, ExecutionRun.direct_results 참고)
+        """
+        outputs = []
+        logs = []
+        for index, query in enumerate(queries):
+            started = time.perf_counter()
+            try:
+                output = self.run(query)
+            except Exception as e:
+                outputs.append(None)
+                logs.append({
+                    "status": "error",
+                    "query_index": index,
+                    "execution_time": time.perf_counter() - started,
+                    "tool": EXECUTOR_TOOL,
+                    "error": f"{type(e).__name__}: {e}",
+                })
+                continue
+            outputs.append(output)
+            logs.append({
+                "status": "success",
+                "query_index": index,
+                "execution_time": time.perf_counter() - started,
+                "tool": EXECUTOR_TOOL,
+                "error": None,
+                "n_documents": len(output) if isinstance(output, list) else int(output is not None),
+            })
+        return ExecutionRun(outputs=outputs, execution_logs=logs, result_keys=list(result_keys or []))
+
+    def attach(self, analysis_result, result_keys: Optional[List[Optional[str]]] = None):
+        """
+        분석 결과의 mongodb_queries를 실행하여 direct_mongodb_results를 채운 사본 반환
+
+        이미 있는 direct_mongodb_results 항목은 유지됩니다. 실행기 로그는 평가 대상(LLM 에이전트)의
+        실행 로그가 아니므로 execution_logs에 추가하지 않습니다 (execution_success_rate와
+        지연 시간 SLO에 섞이지 않음). 쿼리별 실행 시간이 필요하면 execute()의 ExecutionRun을 사용하세요.
+        """
+        run = self.execute(analysis_result.mongodb_queries, result_keys)
+        direct_results = run.direct_results()
+        if analysis_result.direct_mongodb_results:
+            direct_results.update(analysis_result.direct_mongodb_results)
+        return replace(analysis_result, direct_mongodb_results=direct_results)
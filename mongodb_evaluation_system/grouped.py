@@ -0,0 +1,256 @@
+"""
+그룹 키 기반 결과 비교 ($group 출력)
+
+$group 파이프라인 결과처럼 _id(또는 지정한 키)로 식별되는 문서 리스트를
+순서와 무관하게 해시 조인으로 맞춘 뒤, 수치 필드는 NumPy로 컬럼 단위 비교합니다.
+그룹별 불일치, 누락 그룹(MongoDB에만 있음), 추가 그룹(LLM에만 있음)을 보고합니다.
+그룹 키 동일성은 MongoDB $group과 같습니다: 1과 1.0은 같은 그룹, true는 1과 다른 그룹.
+배열 값($push/$addToSet 출력 등) 필드는 원소별 compare_values로 비교합니다.
+"""
+
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import methodcaller
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .compare import _FLOAT64_EXACT_INT, _fits_float64, compare_values
+
+
+MISMATCH_COLUMNS = ["group", "field", "calculated", "expected", "abs_diff"]
+
+_NUMERIC_KINDS = "biuf"
+
+# 불리언 그룹 키 태그 (Python에서는 True == 1이라 태그 없이는 숫자 키와 합쳐짐)
+_BOOL_TAG = object()
+
+
+@dataclass
+class GroupedComparison:
+    """그룹 키 조인 비교 결과"""
+    key: str                                    # 조인 키
+    n_calculated: int                           # LLM 결과 그룹 수
+    n_expected: int                             # MongoDB 결과 그룹 수
+    n_joined: int                               # 양쪽에 모두 있는 그룹 수
+    missing_groups: List[Any]                   # MongoDB에만 있는 그룹 키
+    extra_groups: List[Any]                     # LLM 결과에만 있는 그룹 키
+    duplicate_groups: List[Any]                 # 한쪽에서 중복된 그룹 키 (첫 문서만 비교)
+    mismatches: pd.DataFrame                    # 그룹/필드별 불일치 (MISMATCH_COLUMNS)
+    field_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)  # 필드별 차이 수, 최대 절대 차이
+    n_compared: int = 0                         # 비교한 (그룹, 필드) 셀 수
+
+    @property
+    def n_different(self) -> int:
+        return len(self.mismatches)
+
+    @property
+    def max_abs_diff(self) -> float:
+        values = [stats["max_abs_diff"] for stats in self.field_stats.values()]
+        return max(values) if values else 0.0
+
+    @property
+    def match(self) -> bool:
+        return (not self.missing_groups and not self.extra_groups
+                and not self.duplicate_groups and self.mismatches.empty)
+
+    def describe(self) -> str:
+        """비교 테이블 '차이' 컬럼용 요약"""
+        if self.match:
+            return "0"
+        parts = []
+        if self.missing_groups:
+            parts.append(f"누락 그룹 {len(self.missing_groups)}개")
+        if self.extra_groups:
+            parts.append(f"추가 그룹 {len(self.extra_groups)}개")
+        if self.duplicate_groups:
+            parts.append(f"중복 그룹 {len(self.duplicate_groups)}개")
+        if not self.mismatches.empty:
+            parts.append(f"불일치 {self.n_different}/{self.n_compared}셀 (최대 {self.max_abs_diff:.2f})")
+        return ", ".join(parts)
+
+
+def _normalize_key(value: Any) -> Any:
+    """복합 _id(딕셔너리/리스트)를 해시 가능한 튜플로, 불리언은 숫자와 구분되는 태그 키로 변환"""
+    if isinstance(value, bool):
+        return (_BOOL_TAG, value)
+    if isinstance(value, dict):
+        return tuple((k, _normalize_key(v)) for k, v in sorted(value.items(), key=lambda item: str(item[0])))
+    if isinstance(value, list):
+        return tuple(_normalize_key(v) for v in value)
+    return value
+
+
+def _unique_index(documents: List[Dict[str, Any]],
+                  key: str) -> Tuple[pd.Index, np.ndarray, List[Any], List[Any]]:
+    """그룹 키 해시 인덱스 생성 (중복 키는 첫 문서만 사용, 보고용 원래 키 값도 반환)"""
+    try:
+        keys = [document[key] for document in documents]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"모든 문서에 조인 키 '{key}'가 있어야 합니다") from e
+
+    original_keys = keys
+    key_types = set(map(type, keys))
+    if dict in key_types or list in key_types or bool in key_types:
+        keys = [_normalize_key(k) for k in keys]
+
+    index = pd.Index(keys, dtype=object, tupleize_cols=False)
+    positions = np.arange(len(keys))
+    duplicates: List[Any] = []
+    if not index.is_unique:
+        duplicated = index.duplicated(keep="first")
+        seen = set()
+        for position in np.flatnonzero(duplicated).tolist():
+            if keys[position] not in seen:
+                seen.add(keys[position])
+                duplicates.append(original_keys[position])
+        index = index[~duplicated]
+        positions = positions[~duplicated]
+    return index, positions, duplicates, original_keys
+
+
+def _field_names(documents: List[Dict[str, Any]], key: str) -> List[str]:
+    names = dict.fromkeys(chain.from_iterable(map(dict.keys, documents)))
+    names.pop(key, None)
+    return list(names)
+
+
+def _numeric_column(values: List[Any]) -> Optional[np.ndarray]:
+    """
+    수치(또는 누락) 값으로만 이루어진 컬럼을 1차원 float64 배열로 변환 (누락은 NaN)
+
+    배열 값 등 스칼라가 아닌 값이나 2**53을 넘는 정수가 있으면 None (원소별 compare_values 비교)
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None   # 길이가 다른 리스트 값
+    if array.ndim != 1:
+        return None   # 같은 길이의 리스트 값은 2차원 배열이 됨
+    if array.dtype.kind in _NUMERIC_KINDS:
+        return array.astype(np.float64, copy=False) if _fits_float64(array) else None
+    if array.dtype.kind != "O":
+        return None
+    for value in values:
+        if value is not None and not isinstance(value, (int, float)):
+            return None
+        if isinstance(value, int) and abs(value) > _FLOAT64_EXACT_INT:
+            return None
+    try:
+        return np.array(values, dtype=np.float64)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    """값 리스트 → 1차원 object 배열 (리스트 값도 원소 하나로 유지)"""
+    array = np.empty(len(values), dtype=object)
+    for position, value in enumerate(values):
+        array[position] = value
+    return array
+
+
+def compare_grouped(calculated: List[Dict[str, Any]], expected: List[Dict[str, Any]],
+                    key: str = "_id", abs_tol: float = 0.01,
+                    rel_tol: float = 0.0) -> GroupedComparison:
+    """
+    그룹 키 해시 조인 비교
+
+    Args:
+        calculated: LLM 계산 결과 문서 리스트
+        expected: MongoDB 직접 실행 결과 문서 리스트
+        key: 조인 키 (기본 _id)
+        abs_tol: 절대 허용 오차
+        rel_tol: 상대 허용 오차
+
+    Returns:
+        GroupedComparison: 그룹별 불일치, 누락/추가 그룹, 필드별 통계
+    """
+    (calculated_index, calculated_positions,
+     calculated_duplicates, calculated_keys) = _unique_index(calculated, key)
+    expected_index, expected_positions, expected_duplicates, expected_keys = _unique_index(expected, key)
+
+    # 해시 조인: MongoDB 그룹마다 LLM 결과의 위치 (-1이면 누락)
+    joined = calculated_index.get_indexer(expected_index)
+    found = joined >= 0
+    extra_mask = expected_index.get_indexer(calculated_index) < 0
+
+    calculated_rows = calculated_positions[joined[found]]
+    expected_rows = expected_positions[found]
+    group_keys = _object_array(expected_keys)[expected_rows]
+
+    fields = _field_names(calculated, key)
+    for name in _field_names(expected, key):
+        if name not in fields:
+            fields.append(name)
+
+    mismatch_frames = []
+    field_stats: Dict[str, Dict[str, float]] = {}
+    n_compared = len(fields) * len(expected_rows)
+
+    for name in fields:
+        # 문서 순서대로 컬럼을 뽑은 뒤 조인 순서로 재배열
+        getter = methodcaller("get", name)
+        calculated_column = list(map(getter, calculated))
+        expected_column = list(map(getter, expected))
+
+        calculated_values = _numeric_column(calculated_column)
+        expected_values = _numeric_column(expected_column) if calculated_values is not None else None
+
+        if expected_values is not None:
+            calculated_values = calculated_values[calculated_rows]
+            expected_values = expected_values[expected_rows]
+            diff = np.abs(calculated_values - expected_values)
+            limit = abs_tol + rel_tol * np.abs(expected_values) if rel_tol else abs_tol
+            both_missing = np.isnan(calculated_values) & np.isnan(expected_values)
+            different = ~(diff <= limit) & ~both_missing
+            comparable = ~np.isnan(diff)
+            max_abs_diff = float(diff.max(where=comparable, initial=0.0)) if comparable.any() else 0.0
+            rows = np.flatnonzero(different)
+            abs_diffs = diff[rows]
+        else:
+            # 완전히 같은 값은 건너뛰고 나머지만 원소별 비교 (허용 오차 반영)
+            rows = np.flatnonzero(_object_array(calculated_column)[calculated_rows]
+                                  != _object_array(expected_column)[expected_rows])
+            rows = np.asarray(
+                [row for row in rows.tolist()
+                 if not compare_values(calculated_column[calculated_rows[row]],
+                                       expected_column[expected_rows[row]],
+                                       abs_tol=abs_tol, rel_tol=rel_tol).match],
+                dtype=np.intp
+            )
+            abs_diffs = np.full(len(rows), np.nan)
+            max_abs_diff = 0.0
+
+        field_stats[name] = {"n_different": int(len(rows)), "max_abs_diff": max_abs_diff}
+        if len(rows):
+            mismatch_frames.append(pd.DataFrame({
+                "group": group_keys[rows],
+                "field": name,
+                "calculated": [calculated_column[i] for i in calculated_rows[rows].tolist()],
+                "expected": [expected_column[i] for i in expected_rows[rows].tolist()],
+                "abs_diff": abs_diffs,
+            }, columns=MISMATCH_COLUMNS))
+
+    if mismatch_frames:
+        mismatches = pd.concat(mismatch_frames, ignore_index=True)
+    else:
+        mismatches = pd.DataFrame(columns=MISMATCH_COLUMNS)
+
+    seen = {_normalize_key(group) for group in calculated_duplicates}
+    duplicate_groups = calculated_duplicates + [group for group in expected_duplicates
+                                                if _normalize_key(group) not in seen]
+
+    return GroupedComparison(
+        key=key,
+        n_calculated=len(calculated),
+        n_expected=len(expected),
+        n_joined=int(found.sum()),
+        missing_groups=[expected_keys[i] for i in expected_positions[~found].tolist()],
+        extra_groups=[calculated_keys[i] for i in calculated_positions[extra_mask].tolist()],
+        duplicate_groups=duplicate_groups,
+        mismatches=mismatches,
+        field_stats=field_stats,
+        n_compared=n_compared,
+    )
@@ -0,0 +1,396 @@
+"""
+디스크 기반 평가 이력 저장소
+
+수개월치 평가 결과를 JSON 로그 재파싱 없이 조회하기 위한 추가 전용 세그먼트 파일 형식입니다.
+- 레코드: ResultsStore와 같은 고정 폭 구조(RESULTS_DTYPE)를 그대로 기록
+- 세그먼트: segment-000000.bin ... 일정 레코드 수마다 새 파일로 전환
+- 조회: 세그먼트를 memory-map하여 복사 없이 읽고, 세그먼트별 시간 범위 인덱스로
+  겹치는 세그먼트만 접근 (시간순으로 쌓인 세그먼트는 이진 탐색)
+- 장애 안전: 기록 중 중단되어 남은 불완전 레코드/질의 줄은 다시 열 때 잘라냄
+
+한 디렉터리에는 한 프로세스만 기록해야 합니다 (읽기는 여러 프로세스 가능).
+
+    history = EvaluationHistory("history/")
+    history.append(metrics, analysis_result)
+    month = history.range("2024-05-01", "2024-06-01")   # 구조화 배열
+"""
+
+import json
+import os
+import re
+import struct
+import threading
+from dataclasses import dataclass, asdict, replace
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+
+from .core import EvaluationMetrics, UniversalAnalysisResult
+from .store import RESULTS_DTYPE, ResultsStore, _Dictionary, _to_datetime64
+
+
+HISTORY_MAGIC = b"MEVALHST"
+HISTORY_FORMAT_VERSION = 1
+HEADER_SIZE = 64
+
+# 매직(8) + 형식 버전(4) + 레코드 크기(4), 나머지는 예약
+_HEADER = struct.Struct("<8sII")
+_SEGMENT_NAME = re.compile(r"^segment-(\d{6})\.bin$")
+_QUERIES_FILE = "queries.jsonl"
+
+_NAT_INT = np.iinfo(np.int64).min   # datetime64 NaT의 정수 표현
+
+
+@dataclass
+class SegmentInfo:
+    """세그먼트 시간 범위 인덱스"""
+    number: int
+    count: int
+    min_timestamp: Optional[int]   # datetime64[us] 정수값 (레코드가 없거나 모두 NaT이면 None)
+    max_timestamp: Optional[int]
+    monotonic: bool          # 타임스탬프가 기록 순서대로 증가하는지 여부 (이진 탐색 가능)
+    sealed: bool = False
+
+
+def _segment_path(directory: str, number: int) -> str:
+    return os.path.join(directory, f"segment-{number:06d}.bin")
+
+
+def _meta_path(directory: str, number: int) -> str:
+    return os.path.join(directory, f"segment-{number:06d}.meta.json")
+
+
+def _scan_timestamps(timestamps: np.ndarray) -> Tuple[Optional[int], Optional[int], bool]:
+    values = timestamps.view(np.int64)
+    valid = values[values != _NAT_INT]
+    if len(valid) == 0:
+        return None, None, True
+    monotonic = len(valid) == len(values) and bool(np.all(values[1:] >= values[:-1]))
+    return int(valid.min()), int(valid.max()), monotonic
+
+
+def _range_bound(value: Any, name: str) -> Optional[int]:
+    """range() 경계를 datetime64[us] 정수로 변환 (해석할 수 없으면 ValueError)"""
+    if value is None:
+        return None
+    bound = int(_to_datetime64(value).view(np.int64))
+    if bound == _NAT_INT:
+        # NaT는 모든 비교가 거짓이라 빈 결과로 조용히 바뀜
+        raise ValueError(f"{name} 시각을 해석할 수 없습니다: {value!r}")
+    return bound
+
+
+class EvaluationHistory:
+    """
+    추가 전용 memory-map 평가 이력
+
+    Args:
+        directory: 이력 디렉터리 (없으면 생성)
+        segment_records: 세그먼트당 최대 레코드 수
+        durable: True이면 append()마다 fsync (기본: sync()/close() 및 세그먼트 전환 시에만)
+    """
+
+    def __init__(self, directory: str, segment_records: int = 1 << 20, durable: bool = False):
+        if segment_records < 1:
+            raise ValueError(f"segment_records는 1 이상이어야 합니다: {segment_records}")
+        self.directory = directory
+        self.segment_records = segment_records
+        self.durable = durable
+        self._lock = threading.Lock()
+        self._record_size = RESULTS_DTYPE.itemsize
+        os.makedirs(directory, exist_ok=True)
+
+        self._queries = _Dictionary()
+        self._queries_file = None
+        self._load_queries()
+
+        self._segments: List[SegmentInfo] = []
+        self._maps: Dict[int, np.ndarray] = {}     # 봉인된 세그먼트 memory-map
+        self._active_file = None
+        self._load_segments()
+
+    # ------------------------------------------------------------------ 열기 / 복구
+
+    def _load_queries(self) -> None:
+        path = os.path.join(self.directory, _QUERIES_FILE)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                # 기록 중 중단된 마지막 줄 제거
+                with open(path, "r+b") as f:
+                    f.truncate(complete)
+            for line in data[:complete].splitlines():
+                self._queries.encode(json.loads(line))
+        self._queries_file = open(path, "ab")
+
+    def _load_segments(self) -> None:
+        numbers = sorted(int(match.group(1)) for match in map(_SEGMENT_NAME.match, os.listdir(self.directory))
+                         if match)
+        for position, number in enumerate(numbers):
+            last = position == len(numbers) - 1
+            info = None if last else self._read_meta(number)
+            if info is None:
+                info = self._recover_segment(number, sealed=not last)
+            self._segments.append(info)
+
+        if self._segments and self._segments[-1].count >= self.segment_records and not self._segments[-1].sealed:
+            self._segments[-1].sealed = True
+            self._write_meta(self._segments[-1])
+        if not self._segments or self._segments[-1].count >= self.segment_records:
+            self._start_segment(self._segments[-1].number + 1 if self._segments else 0)
+        else:
+            self._active_file = open(_segment_path(self.directory, self._segments[-1].number), "ab")
+
+    def _read_meta(self, number: int) -> Optional[SegmentInfo]:
+        try:
+            with open(_meta_path(self.directory, number), encoding="utf-8") as f:
+                return SegmentInfo(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_meta(self, info: SegmentInfo) -> None:
+        path = _meta_path(self.directory, info.number)
+        temporary = path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(asdict(info), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+
+    def _recover_segment(self, number: int, sealed: bool) -> SegmentInfo:
+        """헤더 검증, 불완전 레코드 제거 후 시간 범위 인덱스 재계산"""
+        path = _segment_path(self.directory, number)
+        size = os.path.getsize(path)
+        if size < HEADER_SIZE:
+            # 헤더 기록 중 중단 - 빈 세그먼트로 다시 작성
+            self._write_header(path)
+            size = HEADER_SIZE
+        else:
+            with open(path, "rb") as f:
+                magic, version, record_size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != HISTORY_MAGIC or version != HISTORY_FORMAT_VERSION or record_size != self._record_size:
+                raise ValueError(f"평가 이력 세그먼트 형식이 다릅니다: {path}")
+
+        excess = (size - HEADER_SIZE) % self._record_size
+        if excess:
+            with open(path, "r+b") as f:
+                f.truncate(size - excess)
+            size -= excess
+
+        count = (size - HEADER_SIZE) // self._record_size
+        records = self._map(number, count, sealed)
+        min_timestamp, max_timestamp, monotonic = _scan_timestamps(records["timestamp"]) if count else (None, None, True)
+        info = SegmentInfo(number, count, min_timestamp, max_timestamp, monotonic, sealed)
+        if sealed:
+            self._write_meta(info)
+        return info
+
+    def _write_header(self, path: str) -> None:
+        header = _HEADER.pack(HISTORY_MAGIC, HISTORY_FORMAT_VERSION, self._record_size)
+        with open(path, "wb") as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _start_segment(self, number: int) -> None:
+        path = _segment_path(self.directory, number)
+        self._write_header(path)
+        self._segments.append(SegmentInfo(number, 0, None, None, True))
+        self._active_file = open(path, "ab")
+
+    def _seal_active(self) -> None:
+        info = self._segments[-1]
+        self._sync_active()
+        self._active_file.close()
+        info.sealed = True
+        self._write_meta(info)
+
+    # ------------------------------------------------------------------ 기록
+
+    def _sync_active(self) -> None:
+        self._queries_file.flush()
+        os.fsync(self._queries_file.fileno())
+        self._active_file.flush()
+        os.fsync(self._active_file.fileno())
+
+    def append(self, metrics: EvaluationMetrics,
+               analysis_result: Optional[UniversalAnalysisResult] = None,
+               run_id: Optional[int] = None, timestamp: Any = None,
+               analysis_query: Optional[str] = None) -> int:
+        """
+        평가 결과 하나 기록
+
+        Args:
+            metrics: 평가 결과 (quick_evaluate 반환값 등)
+            analysis_result: 분석 질의와 타임스탬프를 가져올 분석 결과 (선택적)
+            run_id: 실행 ID (기본: 전체 기록 순번)
+            timestamp: 타임스탬프 (기본: analysis_result.timestamp)
+            analysis_query: 분석 질의 (analysis_result가 없을 때)
+
+        Returns:
+            int: 전체 기록 순번
+        """
+        if analysis_query is None and analysis_result is not None:
+            analysis_query = analysis_result.analysis_query
+        if timestamp is None and analysis_result is not None:
+            timestamp = analysis_result.timestamp
+        timestamp = _to_datetime64(timestamp)
+
+        with self._lock:
+            if self._segments[-1].count >= self.segment_records:
+                self._seal_active()
+                self._start_segment(self._segments[-1].number + 1)
+
+            query_id = -1
+            if analysis_query is not None:
+                known = len(self._queries)
+                query_id = self._queries.encode(analysis_query)
+                if query_id == known:
+                    # 질의 사전을 레코드보다 먼저 기록 (중단 시 참조 없는 질의만 남음)
+                    self._queries_file.write(json.dumps(analysis_query, ensure_ascii=False).encode("utf-8") + b"\n")
+                    self._queries_file.flush()
+
+            sequence = len(self)
+            record = np.array([(
+                sequence if run_id is None else run_id,
+                query_id,
+                timestamp,
+                metrics.semantic_error_rate,
+                metrics.execution_success_rate,
+                metrics.empty_result_rate,
+                metrics.accuracy_rate,
+                bool(metrics.overall_pass),
+            )], dtype=RESULTS_DTYPE)
+            self._active_file.write(record.tobytes())
+            self._active_file.flush()
+            if self.durable:
+                self._sync_active()
+
+            info = self._segments[-1]
+            value = int(record["timestamp"].view(np.int64)[0])
+            if value == _NAT_INT:
+                info.monotonic = False
+            else:
+                if info.max_timestamp is not None and value < info.max_timestamp:
+                    info.monotonic = False
+                info.min_timestamp = value if info.min_timestamp is None else min(info.min_timestamp, value)
+                info.max_timestamp = value if info.max_timestamp is None else max(info.max_timestamp, value)
+            info.count += 1
+            return sequence
+
+    def sync(self) -> None:
+        """기록한 레코드를 디스크에 반영 (fsync)"""
+        with self._lock:
+            self._sync_active()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._active_file is None:
+                return
+            self._sync_active()
+            self._active_file.close()
+            self._queries_file.close()
+            self._active_file = None
+            self._maps.clear()
+
+    def __enter__(self) -> "EvaluationHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ 조회
+
+    def __len__(self) -> int:
+        return sum(info.count for info in self._segments)
+
+    @property
+    def segments(self) -> List[SegmentInfo]:
+        return list(self._segments)
+
+    @property
+    def queries(self) -> List[str]:
+        """분석 질의 사전 (query_id → 분석 질의)"""
+        return self._queries.values
+
+    def _map(self, number: int, count: int, sealed: bool) -> np.ndarray:
+        """세그먼트 레코드 memory-map (봉인된 세그먼트는 재사용)"""
+        if count == 0:
+            return np.zeros(0, dtype=RESULTS_DTYPE)
+        cached = self._maps.get(number)
+        if cached is not None and len(cached) == count:
+            return cached
+        records = np.memmap(_segment_path(self.directory, number), dtype=RESULTS_DTYPE, mode="r",
+                            offset=HEADER_SIZE, shape=(count,))
+        if sealed:
+            self._maps[number] = records
+        return records
+
+    def _segment_range(self, info: SegmentInfo, start: Optional[int], end: Optional[int]) -> np.ndarray:
+        records = self._map(info.number, info.count, info.sealed)
+        if start is None and end is None:
+            return records
+        timestamps = records["timestamp"].view(np.int64)
+        if info.monotonic:
+            # 시간순 세그먼트: 이진 탐색으로 경계 위치만 확인 (연속 구간 뷰 반환)
+            lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+            hi = info.count if end is None else int(np.searchsorted(timestamps, end, side="left"))
+            return records[lo:hi]
+        selected = timestamps != _NAT_INT
+        if start is not None:
+            selected &= timestamps >= start
+        if end is not None:
+            selected &= timestamps < end
+        return records[selected]
+
+    def range(self, start: Any = None, end: Any = None) -> np.ndarray:
+        """
+        [start, end) 시간 범위의 레코드
+
+        Args:
+            start: 시작 시각 (ISO 문자열, datetime, epoch 초, None이면 처음부터)
+            end: 끝 시각 (제외, None이면 끝까지)
+
+        Returns:
+            np.ndarray: RESULTS_DTYPE 구조화 배열. 한 세그먼트의 시간순 구간이면 복사 없는 읽기 전용 뷰
+
+        Raises:
+            ValueError: start/end를 시각으로 해석할 수 없는 경우
+        """
+        start_value = _range_bound(start, "start")
+        end_value = _range_bound(end, "end")
+
+        with self._lock:
+            segments = [replace(info) for info in self._segments]
+        parts = []
+        for info in segments:
+            if info.count == 0:
+                continue
+            if info.min_timestamp is None and (start_value is not None or end_value is not None):
+                continue
+            if start_value is not None and info.max_timestamp < start_value:
+                continue
+            if end_value is not None and info.min_timestamp >= end_value:
+                continue
+            part = self._segment_range(info, start_value, end_value)
+            if len(part):
+                parts.append(part)
+
+        if not parts:
+            return np.zeros(0, dtype=RESULTS_DTYPE)
+        if len(parts) == 1:
+            return parts[0]
+        return np.concatenate(parts)
+
+    def to_store(self, start: Any = None, end: Any = None) -> ResultsStore:
+        """시간 범위 레코드를 ResultsStore로 변환 (분석 질의별 집계, pandas 변환용)"""
+        records = self.range(start, end)
+        store = ResultsStore(capacity=len(records), keep_comparisons=False)
+        store._data[:len(records)] = records
+        store._size = len(records)
+        store._queries = self._queries.copy()
+        store._has_comparison.frombytes(bytes(len(records)))
+        store._offsets.frombytes(bytes(8 * len(records)))
+        return store
@@ -0,0 +1,378 @@
+"""
+실행 로그 기반 지연 시간 분석
+
+execution_logs의 execution_time(초)을 도구(tool)별, 쿼리 인덱스(query_index)별로 모아
+p50/p95/p99를 계산합니다.
+- 원본 샘플을 보관하지 않는 DDSketch 방식 분위수 스케치 (상대 오차 보장, 로그 간격 버킷)
+- 같은 상대 오차로 만든 스케치끼리는 버킷 합산으로 병합 (배치/워커 결과 결합)
+- 버킷 수는 값의 범위에 따라 로그 스케일로만 늘어나며, max_bins를 넘으면 가장 작은 버킷부터 합침
+"""
+
+import math
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+# 기본 보고 분위수
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+# 도구 이름이 없는 로그의 그룹 이름
+UNKNOWN_TOOL = "unknown"
+
+# SLO에서 모든 도구에 적용하는 키
+ALL_TOOLS = "*"
+
+# 이 값 이하의 지연 시간은 0 버킷으로 집계 (초)
+_MIN_VALUE = 1e-9
+
+
+def _quantile_name(q: float) -> str:
+    """0.95 → "p95", 0.999 → "p99.9" """
+    return "p" + format(q * 100, "g")
+
+
+def _parse_quantile(name: str) -> float:
+    """"p95" → 0.95"""
+    if not name.startswith("p"):
+        raise ValueError(f"분위수 이름은 'p95' 형식이어야 합니다: {name}")
+    q = float(name[1:]) / 100
+    if not 0.0 <= q <= 1.0:
+        raise ValueError(f"분위수는 p0 ~ p100 범위여야 합니다: {name}")
+    return q
+
+
+class LatencySketch:
+    """
+    병합 가능한 분위수 스케치 (DDSketch 방식)
+
+    값 x를 ceil(log_γ(x)) 버킷에 세므로, 반환하는 분위수는 실제 값과의 상대 오차가
+    relative_accuracy 이내입니다 (max_bins로 합쳐진 하위 버킷 제외).
+
+    Args:
+        relative_accuracy: 분위수 상대 오차 (기본 1%)
+        max_bins: 최대 버킷 수 (기본 2048 - 1% 오차로 1ns ~ 수년 범위를 담는 크기)
+    """
+
+    __slots__ = ("relative_accuracy", "max_bins", "_gamma", "_log_gamma",
+                 "_bins", "_zero_count", "count", "sum", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy는 0과 1 사이여야 합니다: {relative_accuracy}")
+        if max_bins < 1:
+            raise ValueError(f"max_bins는 1 이상이어야 합니다: {max_bins}")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """값 추가 (음수, NaN, 무한대는 ValueError)"""
+        if not value >= 0.0 or value == math.inf:
+            raise ValueError(f"지연 시간은 0 이상의 유한한 값이어야 합니다: {value}")
+        if value <= _MIN_VALUE:
+            self._zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            bins = self._bins
+            bins[key] = bins.get(key, 0) + count
+            if len(bins) > self.max_bins:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def _collapse(self) -> None:
+        """버킷 수가 max_bins를 넘으면 가장 작은 버킷들을 하나로 합침 (높은 분위수 정확도 유지)"""
+        keys = sorted(self._bins)
+        excess = len(keys) - self.max_bins
+        if excess <= 0:
+            return
+        target = keys[excess]
+        merged = sum(self._bins.pop(key) for key in keys[:excess])
+        self._bins[target] += merged
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        """다른 스케치를 이 스케치에 합침 (같은 relative_accuracy 필요). self 반환"""
+        if other._gamma != self._gamma:
+            raise ValueError("relative_accuracy가 다른 스케치는 병합할 수 없습니다: "
+                             f"{self.relative_accuracy} vs {other.relative_accuracy}")
+        if other.count == 0:
+            return self
+        bins = self._bins
+        for key, count in other._bins.items():
+            bins[key] = bins.get(key, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse()
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "LatencySketch":
+        sketch = LatencySketch(self.relative_accuracy, self.max_bins)
+        return sketch.merge(self)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 추정값 (0 ≤ q ≤ 1, 값이 없으면 None)"""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"분위수는 0과 1 사이여야 합니다: {q}")
+        if self.count == 0:
+            return None
+        # 최근접 순위 방식 - 표본이 적어도 꼬리 분위수를 낮춰 잡지 않음 (SLO 판정용)
+        rank = max(math.ceil(q * self.count), 1)
+        seen = self._zero_count
+        if seen >= rank:
+            return max(0.0, self.min)
+        value = self.max
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen >= rank:
+                # 버킷 (γ^(k-1), γ^k]의 대표값 - 양 끝과의 상대 오차가 같은 지점
+                value = 2.0 * self._gamma ** key / (self._gamma + 1)
+                break
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """{"p50": ..., "p95": ..., "p99": ...}"""
+        return {_quantile_name(q): self.quantile(q) for q in qs}
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def __len__(self) -> int:
+        return len(self._bins) + (1 if self._zero_count else 0)
+
+    def __getstate__(self):
+        return (self.relative_accuracy, self.max_bins, self._bins, self._zero_count,
+                self.count, self.sum, self.min, self.max)
+
+    def __setstate__(self, state):
+        relative_accuracy, max_bins, bins, zero_count, count, total, minimum, maximum = state
+        self.__init__(relative_accuracy, max_bins)
+        self._bins = dict(bins)
+        self._zero_count = zero_count
+        self.count = count
+        self.sum = total
+        self.min = minimum
+        self.max = maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (버킷 키/개수 포함)"""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "bins": [[key, count] for key, count in sorted(self._bins.items())],
+            "zero_count": self._zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(data.get("relative_accuracy", 0.01), data.get("max_bins", 2048))
+        sketch._bins = {int(key): int(count) for key, count in data.get("bins", ())}
+        sketch._zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+    def __repr__(self) -> str:
+        return (f"LatencySketch(count={self.count}, bins={len(self)}, "
+                f"relative_accuracy={self.relative_accuracy})")
+
+
+GroupKey = Union[str, int]
+
+
+class LatencyStats:
+    """
+    실행 로그 지연 시간 집계 - 전체, 도구별, 쿼리 인덱스별 스케치
+
+    from_logs()로 실행 한 번의 로그에서 만들고, merge()/combine()으로 여러 실행,
+    배치, 워커의 결과를 합칩니다. execution_time이 없거나 숫자가 아닌 로그는 건너뜁니다.
+    """
+
+    __slots__ = ("relative_accuracy", "overall", "by_tool", "by_query")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.overall = LatencySketch(relative_accuracy)
+        self.by_tool: Dict[str, LatencySketch] = {}
+        self.by_query: Dict[int, LatencySketch] = {}
+
+    def _sketch(self, groups: Dict[Any, LatencySketch], key: GroupKey) -> LatencySketch:
+        sketch = groups.get(key)
+        if sketch is None:
+            sketch = groups[key] = LatencySketch(self.relative_accuracy)
+        return sketch
+
+    def add(self, execution_time: float, tool: Optional[str] = None,
+            query_index: Optional[int] = None) -> None:
+        self.overall.add(execution_time)
+        self._sketch(self.by_tool, tool or UNKNOWN_TOOL).add(execution_time)
+        if query_index is not None:
+            self._sketch(self.by_query, query_index).add(execution_time)
+
+    def add_logs(self, execution_logs: Iterable[Dict[str, Any]]) -> "LatencyStats":
+        """실행 로그의 execution_time 추가. self 반환"""
+        for log in execution_logs:
+            execution_time = log.get("execution_time")
+            if isinstance(execution_time, bool) or not isinstance(execution_time, (int, float)):
+                continue
+            if not execution_time >= 0.0 or execution_time == math.inf:
+                continue
+            query_index = log.get("query_index")
+            self.add(float(execution_time), log.get("tool"),
+                     query_index if isinstance(query_index, int) else None)
+        return self
+
+    @classmethod
+    def from_logs(cls, execution_logs: Iterable[Dict[str, Any]],
+                  relative_accuracy: float = 0.01) -> Optional["LatencyStats"]:
+        """실행 로그에서 생성 (execution_time이 있는 로그가 없으면 None)"""
+        stats = cls(relative_accuracy).add_logs(execution_logs)
+        return stats if stats.overall.count else None
+
+    def merge(self, other: "LatencyStats") -> "LatencyStats":
+        """다른 집계를 이 집계에 합침. self 반환"""
+        self.overall.merge(other.overall)
+        for key, sketch in other.by_tool.items():
+            self._sketch(self.by_tool, key).merge(sketch)
+        for key, sketch in other.by_query.items():
+            self._sketch(self.by_query, key).merge(sketch)
+        return self
+
+    @classmethod
+    def combine(cls, stats: Iterable[Optional["LatencyStats"]],
+                relative_accuracy: float = 0.01) -> "LatencyStats":
+        """여러 집계를 새 집계 하나로 합침 (None 항목은 무시, 원본은 수정하지 않음)"""
+        combined = cls(relative_accuracy)
+        for item in stats:
+            if item is not None:
+                combined.merge(item)
+        return combined
+
+    @property
+    def count(self) -> int:
+        return self.overall.count
+
+    def tool_quantile(self, tool: str, q: float) -> Optional[float]:
+        sketch = self.by_tool.get(tool)
+        return sketch.quantile(q) if sketch is not None else None
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        분위수 요약
+
+        Returns:
+            {"overall": {...}, "tools": {tool: {...}}, "queries": {query_index: {...}}}
+            각 항목은 count, mean, max와 p50/p95/p99 (초)
+        """
+        quantiles = tuple(quantiles)
+
+        def describe(sketch: LatencySketch) -> Dict[str, Any]:
+            row = {"count": sketch.count, "mean": sketch.mean, "max": sketch.max}
+            row.update(sketch.quantiles(quantiles))
+            return row
+
+        return {
+            "overall": describe(self.overall),
+            "tools": {tool: describe(sketch) for tool, sketch in sorted(self.by_tool.items())},
+            "queries": {index: describe(sketch) for index, sketch in sorted(self.by_query.items())},
+        }
+
+    def rows(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> List[Tuple[str, Dict[str, Any]]]:
+        """리포트 표용 (그룹 이름, 요약) 목록 - 도구별, 쿼리별 순서"""
+        summary = self.summary(quantiles)
+        return ([(f"tool={tool}", row) for tool, row in summary["tools"].items()]
+                + [(f"query={index}", row) for index, row in summary["queries"].items()])
+
+    def __getstate__(self):
+        return (self.relative_accuracy, self.overall, self.by_tool, self.by_query)
+
+    def __setstate__(self, state):
+        self.relative_accuracy, self.overall, self.by_tool, self.by_query = state
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "overall": self.overall.to_dict(),
+            "tools": {tool: sketch.to_dict() for tool, sketch in self.by_tool.items()},
+            "queries": {str(index): sketch.to_dict() for index, sketch in self.by_query.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyStats":
+        stats = cls(data.get("relative_accuracy", 0.01))
+        stats.overall = LatencySketch.from_dict(data["overall"])
+        stats.by_tool = {tool: LatencySketch.from_dict(sketch)
+                         for tool, sketch in data.get("tools", {}).items()}
+        stats.by_query = {int(index): LatencySketch.from_dict(sketch)
+                          for index, sketch in data.get("queries", {}).items()}
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"LatencyStats(count={self.count}, tools={sorted(self.by_tool)}, "
+                f"queries={sorted(self.by_query)})")
+
+
+def normalize_slo(latency_slo: Optional[Dict[str, Any]]) -> Dict[str, Dict[float, float]]:
+    """
+    지연 시간 SLO 설정 정규화
+
+    {"p95": 1.0} 처럼 분위수만 주면 모든 도구("*")에 적용하고,
+    {"mongodb_direct": {"p99": 0.5}, "*": {"p95": 1.0}} 처럼 도구별로 줄 수 있습니다.
+
+    Returns:
+        도구 이름 → {분위수: 최대 허용 지연 시간(초)}
+    """
+    if not latency_slo:
+        return {}
+    if all(isinstance(value, (int, float)) for value in latency_slo.values()):
+        latency_slo = {ALL_TOOLS: latency_slo}
+    normalized: Dict[str, Dict[float, float]] = {}
+    for tool, limits in latency_slo.items():
+        if not isinstance(limits, dict):
+            raise ValueError(f"도구별 SLO는 {{'p95': 초}} 형식이어야 합니다: {tool}={limits!r}")
+        normalized[tool] = {_parse_quantile(name): float(limit) for name, limit in limits.items()}
+    return normalized
+
+
+def slo_violations(stats: Optional[LatencyStats],
+                   slo: Dict[str, Dict[float, float]]) -> List[Dict[str, Any]]:
+    """
+    SLO 위반 목록 (normalize_slo() 결과 기준)
+
+    "*" 항목은 도구별 항목이 없는 모든 도구에 적용합니다.
+    지연 시간 기록이 없는 도구는 위반으로 보지 않습니다.
+    """
+    if stats is None or not slo:
+        return []
+    default = slo.get(ALL_TOOLS)
+    violations = []
+    for tool, sketch in sorted(stats.by_tool.items()):
+        limits = slo.get(tool, default)
+        if not limits:
+            continue
+        for q, limit in limits.items():
+            value = sketch.quantile(q)
+            if value is not None and value > limit:
+                violations.append({"tool": tool, "quantile": _quantile_name(q),
+                                   "value": value, "limit": limit})
+    return violations
@@ -0,0 +1,127 @@
+"""
+프로세스 풀 병렬 평가
+
+분석 결과를 청크 단위로 프로세스 풀에 보내 평가합니다.
+평가기(임계값, 컴파일된 의미 오류 규칙)는 워커 초기화 시 한 번만 전달되며,
+결과는 입력 순서대로 반환되고 실패한 레코드는 전체 실행을 중단하지 않고
+레코드별 EvaluationFailure로 보고됩니다.
+"""
+
+import math
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
+
+
+@dataclass
+class EvaluationFailure:
+    """레코드별 평가 실패 정보"""
+    index: int                 # 입력 순서 기준 위치
+    error_type: str            # 예외 클래스 이름
+    message: str               # 예외 메시지
+    traceback: str = ""        # 워커에서 발생한 traceback
+
+
+# 워커 프로세스별 평가기 (초기화 시 한 번 설정)
+_worker_evaluator = None
+
+
+def _init_worker(evaluator) -> None:
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _evaluate_record(evaluator, index: int, analysis_result,
+                     ground_truth: Optional[Dict[str, Any]]):
+    try:
+        return evaluator.evaluate(analysis_result, ground_truth)
+    except Exception as e:
+        return EvaluationFailure(
+            index=index,
+            error_type=type(e).__name__,
+            message=str(e),
+            traceback=traceback.format_exc()
+        )
+
+
+def _evaluate_chunk(chunk: List[Tuple[int, Any, Optional[Dict[str, Any]]]]) -> list:
+    return [_evaluate_record(_worker_evaluator, index, analysis_result, ground_truth)
+            for index, analysis_result, ground_truth in chunk]
+
+
+def _default_chunk_size(n_records: int, workers: int) -> int:
+    # 워커당 약 4개 청크로 나눠 부하 불균형을 줄이되 청크가 너무 커지지 않게 제한
+    return max(1, min(256, math.ceil(n_records / (workers * 4))))
+
+
+def evaluate_many(evaluator, results: Sequence,
+                  ground_truths: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+                  workers: Optional[int] = None,
+                  chunk_size: Optional[int] = None) -> List[Union[Any, EvaluationFailure]]:
+    """
+    분석 결과 리스트 병렬 평가
+
+    Args:
+        evaluator: 워커에 한 번 전달될 UniversalMongoDBEvaluator
+        results: 분석 결과 리스트
+        ground_truths: results와 같은 순서의 정답 데이터 리스트 (선택적)
+        workers: 워커 프로세스 수 (기본 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+        chunk_size: 워커에 한 번에 보낼 레코드 수 (기본 자동)
+
+    Returns:
+        List: 입력 순서대로 EvaluationMetrics 또는 EvaluationFailure
+    """
+    results = list(results)
+    n_records = len(results)
+
+    if ground_truths is None:
+        ground_truths = [None] * n_records
+    else:
+        ground_truths = list(ground_truths)
+        if len(ground_truths) != n_records:
+            raise ValueError(
+                f"ground_truths 길이({len(ground_truths)})가 results 길이({n_records})와 다릅니다"
+            )
+
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers는 1 이상이어야 합니다: {workers}")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+
+    if workers == 1 or n_records <= 1:
+        return [_evaluate_record(evaluator, index, analysis_result, ground_truth)
+                for index, (analysis_result, ground_truth) in enumerate(zip(results, ground_truths))]
+
+    chunk_size = chunk_size or _default_chunk_size(n_records, workers)
+    chunks = [
+        [(index, results[index], ground_truths[index])
+         for index in range(start, min(start + chunk_size, n_records))]
+        for start in range(0, n_records, chunk_size)
+    ]
+
+    evaluated: List[Union[Any, EvaluationFailure]] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                             initializer=_init_worker,
+                             initargs=(evaluator,)) as executor:
+        futures = [executor.submit(_evaluate_chunk, chunk) for chunk in chunks]
+
+        # 제출 순서대로 수집하여 입력 순서 유지
+        for future, chunk in zip(futures, chunks):
+            try:
+                evaluated.extend(future.result())
+            except Exception as e:
+                # 직렬화 실패나 워커 종료 등 청크 단위 오류는 청크의 모든 레코드에 기록
+                evaluated.extend(
+                    EvaluationFailure(
+                        index=index,
+                        error_type=type(e).__name__,
+                        message=str(e),
+                        traceback="".join(traceback.format_exception(type(e), e, e.__traceback__))
+                    )
+                    for index, _, _ in chunk
+                )
+
+    return evaluated
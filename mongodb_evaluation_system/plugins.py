@@ -0,0 +1,256 @@
+"""
+사용자 정의 평가 지표 플러그인
+
+4개 핵심 지표 외의 검사(키 커버리지, 실행 비용 등)를 Evidently의 Metric(값 계산)과
+Test(임계값 판정)를 합친 형태의 플러그인으로 등록합니다.
+- inputs: 플러그인이 읽는 입력 이름. 선언한 입력만 MetricInputs에 채워지므로
+  선언하지 않은 입력은 None입니다 ("profile"을 선언한 경우에만 일괄 평가에서 프로파일 생성)
+- compute: 실행 하나의 지표 값 계산. evaluate()의 단일 순회 프로파일을 그대로 받을 수 있어
+  계산 결과를 다시 순회하지 않아도 됩니다.
+- batch_compute: 실행 리스트의 지표 값을 한 번에 계산 (선택적, evaluate_batch()에서 사용)
+- threshold/higher_is_better/gate: 플러그인별 Pass/Fail 판정 규칙. 평가기 thresholds에
+  같은 이름의 키가 있으면 그 값이 우선합니다.
+
+    registry = MetricRegistry([key_coverage_metric(0.9)])
+    registry.register("query_count", lambda inputs: len(inputs.mongodb_queries),
+                      inputs=("mongodb_queries",), threshold=10, higher_is_better=False)
+    evaluator = UniversalMongoDBEvaluator(metric_plugins=registry)
+
+병렬 평가(evaluate_many)는 평가기를 워커로 직렬화하므로 compute/batch_compute는
+모듈 수준 함수여야 합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# 핵심 지표 / 임계값 키와 겹치면 안 되는 이름 (evaluate_batch() 컬럼, thresholds 키)
+_RESERVED_NAMES = frozenset({
+    "semantic_error_rate", "execution_success_rate", "empty_result_rate", "accuracy_rate", "overall_pass",
+    "semantic_error", "execution_success", "empty_result", "accuracy",
+})
+
+# 플러그인이 선언할 수 있는 입력
+METRIC_INPUTS = (
+    "analysis_query",          # 분석 질의
+    "mongodb_queries",         # 실행된 MongoDB 쿼리들
+    "calculation_results",     # LLM 계산 결과
+    "execution_logs",          # 실행 로그
+    "direct_mongodb_results",  # MongoDB 직접 실행 결과
+    "ground_truth",            # 정답 데이터
+    "profile",                 # 계산 결과 단일 순회 요약 (ResultProfile)
+    "latency",                 # 도구별/쿼리별 지연 시간 스케치 (LatencyStats)
+)
+
+
+@dataclass(slots=True)
+class MetricInputs:
+    """플러그인 입력 (선언하지 않은 입력은 None)"""
+    analysis_query: Optional[str] = None
+    mongodb_queries: Optional[List[str]] = None
+    calculation_results: Optional[Dict[str, Any]] = None
+    execution_logs: Optional[List[Dict[str, Any]]] = None
+    direct_mongodb_results: Optional[Dict[str, Any]] = None
+    ground_truth: Optional[Dict[str, Any]] = None
+    profile: Any = None
+    latency: Any = None
+
+
+@dataclass
+class MetricPlugin:
+    """사용자 정의 평가 지표"""
+    name: str                                                      # 지표 이름 (custom_metrics 키)
+    compute: Callable[[MetricInputs], float]                       # 실행 하나의 지표 값
+    inputs: Tuple[str, ...] = ("calculation_results",)             # 읽는 입력 이름
+    threshold: Optional[float] = None                              # 판정 임계값 (None이면 판정 없음)
+    higher_is_better: bool = True                                  # True: 값 ≥ 임계값 통과, False: 값 ≤ 임계값 통과
+    gate: bool = True                                              # 전체 Pass/Fail에 포함 여부
+    batch_compute: Optional[Callable[[List[MetricInputs]], Sequence[float]]] = None  # 일괄 계산 (선택적)
+    description: str = ""                                          # 지표 설명
+
+    def signature(self) -> Tuple:
+        functions = [f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+                     for fn in (self.compute, self.batch_compute) if fn is not None]
+        return (self.name, tuple(self.inputs), self.threshold, self.higher_is_better, self.gate, *functions)
+
+    def passes(self, value: float, threshold: Optional[float] = None) -> bool:
+        """임계값 판정 (threshold: 평가기 설정으로 덮어쓴 임계값)"""
+        if threshold is None:
+            threshold = self.threshold
+        if threshold is None:
+            return True
+        if value is None or value != value:   # None 또는 NaN은 미달
+            return False
+        return value >= threshold if self.higher_is_better else value <= threshold
+
+
+class MetricRegistry:
+    """
+    사용자 정의 평가 지표 레지스트리
+
+    등록 순서대로 계산되며, 입력 이름은 등록 시점에 검증됩니다.
+    """
+
+    def __init__(self, plugins: Optional[Iterable[MetricPlugin]] = None):
+        self._plugins: List[MetricPlugin] = []
+        self._inputs: frozenset = frozenset()
+        for plugin in plugins or ():
+            self.add(plugin)
+
+    @property
+    def plugins(self) -> List[MetricPlugin]:
+        return list(self._plugins)
+
+    @property
+    def inputs(self) -> frozenset:
+        """등록된 플러그인이 읽는 입력 이름 전체"""
+        return self._inputs
+
+    def register(self, name: str, compute: Callable[[MetricInputs], float],
+                 inputs: Tuple[str, ...] = ("calculation_results",),
+                 threshold: Optional[float] = None, higher_is_better: bool = True,
+                 gate: bool = True,
+                 batch_compute: Optional[Callable[[List[MetricInputs]], Sequence[float]]] = None,
+                 description: str = "") -> MetricPlugin:
+        """지표 플러그인 추가"""
+        plugin = MetricPlugin(name=name, compute=compute, inputs=tuple(inputs), threshold=threshold,
+                              higher_is_better=higher_is_better, gate=gate,
+                              batch_compute=batch_compute, description=description)
+        self.add(plugin)
+        return plugin
+
+    def add(self, plugin: MetricPlugin) -> None:
+        if any(existing.name == plugin.name for existing in self._plugins):
+            raise ValueError(f"이미 등록된 지표입니다: {plugin.name}")
+        if plugin.name in _RESERVED_NAMES:
+            raise ValueError(f"핵심 지표와 같은 이름은 사용할 수 없습니다: {plugin.name}")
+        if not callable(plugin.compute):
+            raise ValueError(f"지표 '{plugin.name}'의 compute는 호출 가능해야 합니다")
+        if plugin.batch_compute is not None and not callable(plugin.batch_compute):
+            raise ValueError(f"지표 '{plugin.name}'의 batch_compute는 호출 가능해야 합니다")
+        unknown = [name for name in plugin.inputs if name not in METRIC_INPUTS]
+        if unknown:
+            raise ValueError(f"지표 '{plugin.name}'에 알 수 없는 입력이 있습니다: {unknown} "
+                             f"(사용 가능: {', '.join(METRIC_INPUTS)})")
+        self._plugins.append(plugin)
+        self._invalidate()
+
+    def remove(self, name: str) -> None:
+        self._plugins = [plugin for plugin in self._plugins if plugin.name != name]
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._inputs = frozenset(name for plugin in self._plugins for name in plugin.inputs)
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def __iter__(self):
+        return iter(self._plugins)
+
+    def signatures(self) -> List[Tuple]:
+        return [plugin.signature() for plugin in self._plugins]
+
+    # ------------------------------------------------------------------ 계산 / 판정
+
+    def make_inputs(self, analysis_result, ground_truth: Optional[Dict[str, Any]] = None,
+                    profile: Any = None, latency: Any = None) -> MetricInputs:
+        """선언된 입력만 채운 MetricInputs"""
+        used = self._inputs
+        return MetricInputs(
+            analysis_query=analysis_result.analysis_query if "analysis_query" in used else None,
+            mongodb_queries=analysis_result.mongodb_queries if "mongodb_queries" in used else None,
+            calculation_results=(analysis_result.calculation_results
+                                 if "calculation_results" in used else None),
+            execution_logs=analysis_result.execution_logs if "execution_logs" in used else None,
+            direct_mongodb_results=(analysis_result.direct_mongodb_results
+                                    if "direct_mongodb_results" in used else None),
+            ground_truth=ground_truth if "ground_truth" in used else None,
+            profile=profile if "profile" in used else None,
+            latency=latency if "latency" in used else None,
+        )
+
+    def compute(self, inputs: MetricInputs) -> Dict[str, float]:
+        """실행 하나의 전체 지표 값 {이름: 값}"""
+        return {plugin.name: plugin.compute(inputs) for plugin in self._plugins}
+
+    def compute_batch(self, inputs: List[MetricInputs]) -> Dict[str, List[float]]:
+        """실행 리스트의 전체 지표 값 {이름: 실행별 값} (batch_compute가 없으면 실행별 compute)"""
+        values = {}
+        for plugin in self._plugins:
+            if plugin.batch_compute is None:
+                column = [plugin.compute(item) for item in inputs]
+            else:
+                column = list(plugin.batch_compute(inputs))
+                if len(column) != len(inputs):
+                    raise ValueError(f"지표 '{plugin.name}'의 batch_compute 결과 길이({len(column)})가 "
+                                     f"실행 수({len(inputs)})와 다릅니다")
+            values[plugin.name] = column
+        return values
+
+    def failures(self, values: Dict[str, float],
+                 thresholds: Optional[Dict[str, float]] = None) -> List[str]:
+        """Pass/Fail 판정에 포함되는 지표 중 임계값 미달 지표 이름"""
+        thresholds = thresholds or {}
+        return [plugin.name for plugin in self._plugins
+                if plugin.gate and not plugin.passes(values.get(plugin.name), thresholds.get(plugin.name))]
+
+
+# ---------------------------------------------------------------------------
+# 내장 지표
+# ---------------------------------------------------------------------------
+
+def _key_coverage(inputs: MetricInputs) -> float:
+    direct_results = inputs.direct_mongodb_results
+    if not direct_results:
+        return 1.0
+    calculation_results = inputs.calculation_results
+    return sum(key in calculation_results for key in direct_results) / len(direct_results)
+
+
+def _key_coverage_batch(inputs: List[MetricInputs]) -> List[float]:
+    import numpy as np
+
+    covered = np.fromiter((sum(key in item.calculation_results for key in item.direct_mongodb_results)
+                           if item.direct_mongodb_results else 0 for item in inputs),
+                          dtype=np.float64, count=len(inputs))
+    totals = np.fromiter((len(item.direct_mongodb_results) if item.direct_mongodb_results else 0
+                          for item in inputs), dtype=np.float64, count=len(inputs))
+    coverage = np.ones(len(inputs), dtype=np.float64)
+    np.divide(covered, totals, out=coverage, where=totals > 0)
+    return coverage.tolist()
+
+
+def key_coverage_metric(threshold: Optional[float] = 0.9, gate: bool = True) -> MetricPlugin:
+    """
+    키 커버리지: MongoDB 직접 실행 결과 키 중 LLM이 계산한 키의 비율
+
+    직접 실행 결과가 없는 실행은 1.0입니다.
+    """
+    return MetricPlugin(name="key_coverage", compute=_key_coverage,
+                        inputs=("calculation_results", "direct_mongodb_results"),
+                        threshold=threshold, higher_is_better=True, gate=gate,
+                        batch_compute=_key_coverage_batch,
+                        description="MongoDB 직접 실행 결과 키 커버리지")
+
+
+def _execution_time(inputs: MetricInputs) -> float:
+    total = 0.0
+    for log in inputs.execution_logs:
+        execution_time = log.get("execution_time")
+        # LatencyStats와 같이 숫자가 아닌 값은 건너뜀
+        if isinstance(execution_time, (int, float)) and not isinstance(execution_time, bool):
+            total += execution_time
+    return total
+
+
+def execution_time_metric(budget: Optional[float] = None, gate: bool = True) -> MetricPlugin:
+    """
+    실행 비용: 실행 로그 execution_time 합계 (초)
+
+    budget을 주면 합계가 budget 이하일 때 통과합니다. 분위수 기준 판정은 latency_slo를 사용합니다.
+    """
+    return MetricPlugin(name="execution_time", compute=_execution_time,
+                        inputs=("execution_logs",), threshold=budget, higher_is_better=False,
+                        gate=gate,
+                        description="실행 로그 execution_time 합계 (초)")
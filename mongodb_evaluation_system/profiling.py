@@ -0,0 +1,285 @@
+"""
+평가 단계별 시간 측정
+
+evaluate()와 리포트 생성기의 단계(비교 쌍 수집, 의미 오류 검사, 정답 비교, 포맷팅 등)마다
+벽시계 시간과 CPU 시간(스레드 기준)을 기록합니다.
+- 측정 결과는 EvaluationMetrics.stage_timings에 첨부하거나 싱크로 전달
+- 싱크: 콜백 함수, Prometheus 텍스트 노출 형식, OpenTelemetry 형식 스팬 파일(JSONL)
+- 평가기에 profiler가 없으면 공유된 빈 기록기를 사용하므로 추가 비용이 거의 없음
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+
+@dataclass
+class StageTiming:
+    """단계 측정값"""
+    stage: str                 # 단계 이름
+    wall_seconds: float        # 벽시계 시간
+    cpu_seconds: float         # 현재 스레드 CPU 시간
+    start_time: float = 0.0    # 시작 시각 (epoch 초)
+
+
+@dataclass
+class ProfileSpan:
+    """evaluate() 또는 리포트 생성 한 번의 측정 결과"""
+    name: str                                   # "evaluate", "comprehensive_report" ...
+    start_time: float                           # 시작 시각 (epoch 초)
+    wall_seconds: float
+    cpu_seconds: float
+    stages: List[StageTiming] = field(default_factory=list)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def timings(self) -> Dict[str, StageTiming]:
+        """단계 이름 → 측정값 (같은 이름이 반복되면 합산)"""
+        merged: Dict[str, StageTiming] = {}
+        for timing in self.stages:
+            previous = merged.get(timing.stage)
+            if previous is None:
+                merged[timing.stage] = StageTiming(timing.stage, timing.wall_seconds,
+                                                   timing.cpu_seconds, timing.start_time)
+            else:
+                previous.wall_seconds += timing.wall_seconds
+                previous.cpu_seconds += timing.cpu_seconds
+        return merged
+
+
+class _Stage:
+    """단계 측정 컨텍스트"""
+
+    __slots__ = ("_recording", "_name", "_wall", "_cpu")
+
+    def __init__(self, recording: "Recording", name: str):
+        self._recording = recording
+        self._name = name
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        recording = self._recording
+        recording.stages.append(StageTiming(self._name, wall, cpu,
+                                            recording.start_time + (self._wall - recording.start_wall)))
+        return False
+
+
+class Recording:
+    """진행 중인 측정 - stage()로 단계를 기록하고 finish()로 싱크에 전달"""
+
+    __slots__ = ("profiler", "name", "attributes", "stages", "start_time", "start_wall", "start_cpu")
+
+    def __init__(self, profiler: "Profiler", name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.profiler = profiler
+        self.name = name
+        self.attributes = attributes or {}
+        self.stages: List[StageTiming] = []
+        self.start_time = time.time()
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.thread_time()
+
+    def stage(self, name: str) -> _Stage:
+        return _Stage(self, name)
+
+    def finish(self) -> Optional[Dict[str, StageTiming]]:
+        """측정 종료 - 싱크에 스팬을 전달하고, attach 설정 시 단계별 측정값 반환"""
+        span = ProfileSpan(
+            name=self.name,
+            start_time=self.start_time,
+            wall_seconds=time.perf_counter() - self.start_wall,
+            cpu_seconds=time.thread_time() - self.start_cpu,
+            stages=self.stages,
+            attributes=self.attributes,
+        )
+        self.profiler.emit(span)
+        return span.timings() if self.profiler.attach else None
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _NullRecording:
+    """profiler가 없을 때 사용하는 빈 기록기 (상태 없음, 공유)"""
+
+    __slots__ = ()
+    _stage = _NullStage()
+
+    def stage(self, name: str) -> _NullStage:
+        return self._stage
+
+    def finish(self) -> None:
+        return None
+
+
+NULL_RECORDING = _NullRecording()
+
+
+class Profiler:
+    """
+    단계별 시간 측정기
+
+    Args:
+        sinks: 측정 결과(ProfileSpan)를 받을 싱크들. 호출 가능한 객체는 콜백으로 사용
+        attach: True이면 evaluate() 결과의 stage_timings에 단계별 측정값 첨부
+    """
+
+    def __init__(self, sinks: Iterable[Callable[[ProfileSpan], None]] = (), attach: bool = True):
+        self.sinks = list(sinks)
+        self.attach = attach
+
+    def start(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Recording:
+        return Recording(self, name, attributes)
+
+    def emit(self, span: ProfileSpan) -> None:
+        for sink in self.sinks:
+            sink(span)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            close = getattr(sink, "close", None)
+            if close is not None:
+                close()
+
+
+_PROMETHEUS_PREFIX = "mongodb_evaluation"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusSink:
+    """
+    Prometheus 텍스트 노출 형식 싱크
+
+    스팬/단계별 벽시계, CPU 시간 합계와 횟수를 누적합니다. exposition()을 HTTP 응답으로 제공하거나
+    write(path)로 node_exporter textfile collector 디렉터리에 기록합니다.
+    """
+
+    def __init__(self, prefix: str = _PROMETHEUS_PREFIX):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._totals: Dict[tuple, List[float]] = {}   # (span, stage) → [wall 합계, cpu 합계, 횟수]
+
+    def __call__(self, span: ProfileSpan) -> None:
+        with self._lock:
+            self._add((span.name, "total"), span.wall_seconds, span.cpu_seconds)
+            for timing in span.stages:
+                self._add((span.name, timing.stage), timing.wall_seconds, timing.cpu_seconds)
+
+    def _add(self, key: tuple, wall: float, cpu: float) -> None:
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = self._totals[key] = [0.0, 0.0, 0]
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += 1
+
+    def exposition(self) -> str:
+        with self._lock:
+            items = sorted(self._totals.items())
+        name = f"{self.prefix}_stage_seconds"
+        lines = [f"# HELP {name} Time spent in each evaluation stage.",
+                 f"# TYPE {name} summary"]
+        for (span, stage), (wall, cpu, count) in items:
+            labels = f'span="{_escape_label(span)}",stage="{_escape_label(stage)}"'
+            lines.append(f'{name}_sum{{{labels},clock="wall"}} {wall!r}')
+            lines.append(f'{name}_count{{{labels},clock="wall"}} {count}')
+            lines.append(f'{name}_sum{{{labels},clock="cpu"}} {cpu!r}')
+            lines.append(f'{name}_count{{{labels},clock="cpu"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """임시 파일에 쓴 뒤 교체 (수집기가 쓰는 중인 파일을 읽지 않도록)"""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(self.exposition())
+        os.replace(temporary, path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+    def __getstate__(self):
+        return {"prefix": self.prefix}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+def _span_id() -> str:
+    return os.urandom(8).hex()
+
+
+class SpanFileSink:
+    """
+    OpenTelemetry 형식 스팬 파일 싱크 (JSONL)
+
+    측정 한 번마다 상위 스팬과 단계별 하위 스팬을 한 줄씩 기록합니다.
+    필드는 OTLP JSON 스팬(traceId, spanId, parentSpanId, name, startTimeUnixNano,
+    endTimeUnixNano, attributes)을 따르므로 수집기나 변환 스크립트로 그대로 가져갈 수 있습니다.
+    """
+
+    def __init__(self, path: str, service_name: str = "mongodb_evaluation_system"):
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._file = None
+
+    def __call__(self, span: ProfileSpan) -> None:
+        trace_id = os.urandom(16).hex()
+        root_id = _span_id()
+        start_ns = int(span.start_time * 1e9)
+        records = [self._record(trace_id, root_id, None, span.name, start_ns,
+                                start_ns + int(span.wall_seconds * 1e9),
+                                {**span.attributes, "cpu_seconds": span.cpu_seconds})]
+        for timing in span.stages:
+            stage_start = int(timing.start_time * 1e9)
+            records.append(self._record(trace_id, _span_id(), root_id, f"{span.name}.{timing.stage}",
+                                        stage_start, stage_start + int(timing.wall_seconds * 1e9),
+                                        {"cpu_seconds": timing.cpu_seconds}))
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(payload)
+            self._file.flush()
+
+    def _record(self, trace_id: str, span_id: str, parent_id: Optional[str], name: str,
+                start_ns: int, end_ns: int, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "traceId": trace_id,
+            "spanId": span_id,
+            "parentSpanId": parent_id or "",
+            "name": name,
+            "startTimeUnixNano": start_ns,
+            "endTimeUnixNano": end_ns,
+            "attributes": {"service.name": self.service_name, **attributes},
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __getstate__(self):
+        return {"path": self.path, "service_name": self.service_name}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
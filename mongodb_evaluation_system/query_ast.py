@@ -0,0 +1,169 @@
+"""
+쿼리 AST 및 파싱 캐시
+
+LLM이 생성한 쿼리 문자열을 한 번만 파싱하여 파이프라인 AST로 변환합니다.
+- find(...).sort(...).limit(...)는 같은 의미의 파이프라인 스테이지
+  ($match, $sort, $skip, $limit, $project, $count)로 정규화
+- LLM은 같은 쿼리를 반복 생성하므로 공백/주석을 정규화한 쿼리 문자열을 키로 LRU 캐싱
+- 파싱에 실패한 쿼리는 예외 대신 error가 채워진 AST로 반환
+
+캐시된 AST와 스펙 딕셔너리는 호출자 간에 공유되므로 읽기 전용으로 다뤄야 합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+from .shell import ShellQuery, parse_shell_query
+
+
+# 파싱 캐시 최대 항목 수 (원문 캐시, 정규화 캐시 각각)
+PARSE_CACHE_SIZE = 4096
+
+_COUNT_METHODS = {"count", "countDocuments", "estimatedDocumentCount"}
+
+_CHAIN_STAGES = {"sort": "$sort", "skip": "$skip", "limit": "$limit"}
+
+# 문자열 리터럴은 그대로 두고 주석과 공백만 정규화
+_NORMALIZE = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|//[^\n]*|/\*.*?\*/|\s+""", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """파이프라인 스테이지"""
+    operator: str                  # "$match", "$group" ...
+    spec: Any                      # 스테이지 인자
+    index: int                     # 파이프라인 내 위치
+
+
+@dataclass(frozen=True)
+class QueryAST:
+    """파싱된 쿼리"""
+    collection: Optional[str]                   # 컬렉션 이름
+    method: Optional[str]                       # 원래 메서드 (find, aggregate, countDocuments ...)
+    stages: Tuple[PipelineStage, ...] = ()      # 정규화된 파이프라인
+    duplicate_keys: Tuple[str, ...] = ()        # 한 객체에서 중복된 키 경로
+    error: Optional[str] = None                 # 파싱 실패 사유
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def stages_of(self, operator: str) -> List[PipelineStage]:
+        return [stage for stage in self.stages if stage.operator == operator]
+
+    @property
+    def is_count(self) -> bool:
+        """개수 집계 쿼리 여부 (count 메서드, $count 스테이지, {$sum: 1} 누산기)"""
+        if self.method in _COUNT_METHODS:
+            return True
+        for stage in self.stages:
+            if stage.operator == "$count":
+                return True
+            if stage.operator == "$group" and isinstance(stage.spec, dict):
+                for name, accumulator in stage.spec.items():
+                    if name != "_id" and isinstance(accumulator, dict) and (
+                            accumulator.get("$sum") == 1 or "$count" in accumulator):
+                        return True
+        return False
+
+
+def _find_stages(query: ShellQuery) -> List[Tuple[str, Any]]:
+    """find 계열 호출을 동등한 파이프라인 스테이지로 변환"""
+    args = query.args
+    stages = []
+    if args and args[0]:
+        stages.append(("$match", args[0]))
+    projection = args[1] if query.method in ("find", "findOne") and len(args) > 1 else None
+
+    for name, chain_args in query.chain:
+        if name in _CHAIN_STAGES and chain_args:
+            stages.append((_CHAIN_STAGES[name], chain_args[0]))
+        elif name in ("count", "itcount", "size"):
+            stages.append(("$count", "count"))
+    if query.method == "findOne":
+        stages.append(("$limit", 1))
+    if projection:
+        stages.append(("$project", projection))
+    return stages
+
+
+def build_ast(query: ShellQuery) -> QueryAST:
+    """셸 쿼리를 AST로 변환"""
+    if query.method == "aggregate":
+        pipeline = query.args[0] if query.args else []
+        if isinstance(pipeline, dict):
+            pipeline = query.args
+        stages = []
+        for stage in pipeline:
+            if isinstance(stage, dict) and len(stage) == 1:
+                stages.append(next(iter(stage.items())))
+            else:
+                stages.append(("", stage))
+    elif query.method == "distinct":
+        stages = [("$match", query.args[1])] if len(query.args) > 1 and query.args[1] else []
+    else:
+        stages = _find_stages(query)
+
+    return QueryAST(
+        collection=query.collection,
+        method=query.method,
+        stages=tuple(PipelineStage(operator, spec, index) for index, (operator, spec) in enumerate(stages)),
+        duplicate_keys=tuple(query.duplicate_keys),
+    )
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 정규화 - 주석 제거, 토큰 사이 공백 제거 (문자열 리터럴은 유지)"""
+    text = text.strip()
+
+    def replace(match: re.Match) -> str:
+        if match.group(1):
+            return match.group(1)
+        # 식별자 사이 공백(new Date 등)은 하나로 유지
+        before = text[match.start() - 1] if match.start() > 0 else ""
+        after = text[match.end()] if match.end() < len(text) else ""
+        if (before.isalnum() or before in "_$") and (after.isalnum() or after in "_$"):
+            return " "
+        return ""
+
+    return _NORMALIZE.sub(replace, text).rstrip(";")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_normalized(normalized: str) -> QueryAST:
+    try:
+        shell_query = parse_shell_query(normalized)
+    except (ValueError, TypeError, RecursionError) as e:
+        # RecursionError: 재귀 한도를 넘는 깊은 중첩 쿼리
+        return QueryAST(collection=None, method=None, error=str(e) or type(e).__name__)
+    return build_ast(shell_query)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_text(text: str) -> QueryAST:
+    return _parse_normalized(normalize_query(text))
+
+
+def parse_query(text: str) -> QueryAST:
+    """
+    쿼리 문자열을 AST로 변환 (원문 → 정규화 문자열 2단계 LRU 캐시)
+
+    같은 원문은 정규화 없이 바로 반환되고, 공백/주석만 다른 쿼리는 정규화 캐시에서 공유됩니다.
+    """
+    # 캐시 조회 전에 타입 검사 (dict/list 등 해시 불가 값은 lru_cache에서 TypeError)
+    if not isinstance(text, str):
+        return QueryAST(collection=None, method=None, error=f"문자열이 아닌 쿼리: {type(text).__name__}")
+    return _parse_text(text)
+
+
+def parse_cache_info() -> Dict[str, Any]:
+    """파싱 캐시 통계 (원문 캐시, 정규화 캐시)"""
+    return {"text": _parse_text.cache_info()._asdict(),
+            "normalized": _parse_normalized.cache_info()._asdict()}
+
+
+def clear_parse_cache() -> None:
+    _parse_text.cache_clear()
+    _parse_normalized.cache_clear()
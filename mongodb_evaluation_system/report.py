@@ -0,0 +1,343 @@
+"""
+스트리밍 일괄 평가 리포트
+
+여러 실행의 평가 결과를 Markdown 또는 HTML로 파일 객체에 바로 기록합니다.
+- 실행별 섹션은 write_run() 호출 시 즉시 기록하고 보관하지 않음
+- 넓은 비교 테이블은 상대 차이가 큰 상위 K개 불일치만 표시
+- 코퍼스 요약(통과율, 사용자 정의 지표를 포함한 지표 평균, 임계값 미달 건수, 전체 상위 K 불일치,
+  지연 시간 분위수)은 고정 크기 누적값, 힙, 병합한 분위수 스케치로 유지하여 close() 시 기록
+
+    with ReportWriter(open("nightly.md", "w"), evaluator, top_k=20) as report:
+        for analysis_result in results:
+            report.write_run(evaluator.evaluate(analysis_result), analysis_result)
+"""
+
+import heapq
+import html
+import math
+from typing import List, Any, Optional, TextIO, Tuple
+
+from .core import (
+    COMPARISON_LLM_MISSING,
+    COMPARISON_MATCH,
+    COMPARISON_MISMATCH,
+    COMPARISON_NA,
+    EvaluationMetrics,
+    UniversalAnalysisResult,
+    UniversalMongoDBEvaluator,
+)
+from .latency import LatencyStats
+
+
+REPORT_FORMATS = ("markdown", "html")
+
+_METRIC_LABELS = [
+    # (지표 속성, 표시 이름, 임계값 키, 낮을수록 좋은지 여부)
+    ("semantic_error_rate", "의미 오류율", "semantic_error", True),
+    ("execution_success_rate", "실행 성공률", "execution_success", False),
+    ("empty_result_rate", "무응답률", "empty_result", True),
+    ("accuracy_rate", "정답 일치율", "accuracy", False),
+]
+
+_MISMATCH_HEADERS = ["지표", "LLM 계산 결과", "MongoDB 직접 실행", "차이", "상대 차이"]
+
+_LATENCY_HEADERS = ["구분", "실행 수", "p50", "p95", "p99", "최대"]
+
+
+def relative_difference(llm_value: Any, mongodb_value: Any, group_key: Optional[str] = None) -> float:
+    """
+    불일치 정렬용 상대 차이
+
+    수치는 |차이| / |MongoDB 값|, 중첩 결과는 허용 오차를 벗어난 원소 비율,
+    타입/구조 불일치와 0 대비 차이는 무한대입니다.
+    """
+    if isinstance(llm_value, bool) or isinstance(mongodb_value, bool):
+        return 0.0 if llm_value == mongodb_value else math.inf
+    if isinstance(llm_value, (int, float)) and isinstance(mongodb_value, (int, float)):
+        try:
+            diff = abs(llm_value - mongodb_value)
+            if mongodb_value != 0:
+                return diff / abs(mongodb_value)
+        except OverflowError:   # float 범위를 넘는 int
+            return math.inf
+        return math.inf if diff > 0 else 0.0
+    if isinstance(llm_value, (list, dict)) and type(llm_value) == type(mongodb_value):
+        from .compare import compare_values
+        comparison = compare_values(llm_value, mongodb_value, group_key=group_key)
+        if comparison.structural:
+            return math.inf
+        return comparison.n_different / comparison.n_compared if comparison.n_compared else 0.0
+    return math.inf
+
+
+def _format_ratio(value: float) -> str:
+    return "∞" if math.isinf(value) else f"{value:.1%}"
+
+
+class _Markdown:
+    def begin(self, title: str) -> str:
+        return f"# {title}\n\n"
+
+    def end(self) -> str:
+        return ""
+
+    def heading(self, level: int, text: str) -> str:
+        return f"{'#' * level} {text}\n\n"
+
+    def paragraph(self, text: str) -> str:
+        return f"{text}\n\n"
+
+    def code(self, text: str, language: str = "") -> str:
+        return f"```{language}\n{text}\n```\n\n"
+
+    def table(self, headers: List[str], rows: List[List[Any]]) -> str:
+        lines = ["| " + " | ".join(self._cell(h) for h in headers) + " |",
+                 "|" + "|".join("---" for _ in headers) + "|"]
+        lines.extend("| " + " | ".join(self._cell(value) for value in row) + " |" for row in rows)
+        return "\n".join(lines) + "\n\n"
+
+    @staticmethod
+    def _cell(value: Any) -> str:
+        return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+class _Html:
+    def begin(self, title: str) -> str:
+        return (f"<!DOCTYPE html>\n<html lang=\"ko\">\n<head>\n<meta charset=\"utf-8\">\n"
+                f"<title>{html.escape(title)}</title>\n</head>\n<body>\n<h1>{html.escape(title)}</h1>\n")
+
+    def end(self) -> str:
+        return "</body>\n</html>\n"
+
+    def heading(self, level: int, text: str) -> str:
+        return f"<h{level}>{html.escape(text)}</h{level}>\n"
+
+    def paragraph(self, text: str) -> str:
+        return f"<p>{html.escape(text)}</p>\n"
+
+    def code(self, text: str, language: str = "") -> str:
+        return f"<pre><code>{html.escape(text)}</code></pre>\n"
+
+    def table(self, headers: List[str], rows: List[List[Any]]) -> str:
+        parts = ["<table>\n<thead><tr>"]
+        parts.extend(f"<th>{html.escape(str(h))}</th>" for h in headers)
+        parts.append("</tr></thead>\n<tbody>\n")
+        for row in rows:
+            parts.append("<tr>")
+            parts.extend(f"<td>{html.escape(str(value))}</td>" for value in row)
+            parts.append("</tr>\n")
+        parts.append("</tbody>\n</table>\n")
+        return "".join(parts)
+
+
+class ReportWriter:
+    """
+    Markdown/HTML 일괄 평가 리포트 스트리밍 기록기
+
+    Args:
+        stream: 기록할 텍스트 파일 객체 (close()에서 닫지 않음)
+        evaluator: 임계값과 값 포맷팅에 사용할 평가기
+        output_format: "markdown" 또는 "html"
+        top_k: 실행별/코퍼스 전체 불일치 표시 개수
+        include_runs: False이면 실행별 섹션 없이 코퍼스 요약만 기록
+        title: 리포트 제목
+    """
+
+    def __init__(self, stream: TextIO, evaluator: Optional[UniversalMongoDBEvaluator] = None,
+                 output_format: str = "markdown", top_k: int = 20, include_runs: bool = True,
+                 title: str = "MongoDB 분석 일괄 평가 결과"):
+        if output_format not in REPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 리포트 형식입니다: {output_format}")
+        self.stream = stream
+        self.evaluator = evaluator or UniversalMongoDBEvaluator()
+        self.output_format = output_format
+        self.top_k = top_k
+        self.include_runs = include_runs
+        self.title = title
+        self._format = _Markdown() if output_format == "markdown" else _Html()
+
+        self.runs = 0
+        self.passed = 0
+        self._metric_sums = dict.fromkeys((name for name, _, _, _ in _METRIC_LABELS), 0.0)
+        self._metric_failures = dict.fromkeys((name for name, _, _, _ in _METRIC_LABELS), 0)
+        self._status_counts = dict.fromkeys((COMPARISON_NA, COMPARISON_MATCH,
+                                             COMPARISON_MISMATCH, COMPARISON_LLM_MISSING), 0)
+        # 코퍼스 전체 상위 K 불일치 (상대 차이 최소 힙): (상대 차이, 순번, 행)
+        self._top_mismatches: List[Tuple[float, int, List[Any]]] = []
+        self._sequence = 0
+        # 코퍼스 전체 지연 시간 (실행별 스케치 병합)
+        self.latency = LatencyStats()
+        self.latency_slo_failures = 0
+        # 사용자 정의 지표 누적값: 이름 → [합계, 실행 수, 미달 실행 수]
+        self._custom_metrics = {}
+        self._started = False
+        self._closed = False
+
+    def _write(self, text: str) -> None:
+        if not self._started:
+            self._started = True
+            self.stream.write(self._format.begin(self.title))
+        self.stream.write(text)
+
+    def _metric_passes(self, threshold_key: str, lower_is_better: bool, value: float) -> bool:
+        threshold = self.evaluator.thresholds[threshold_key]
+        return value <= threshold if lower_is_better else value >= threshold
+
+    def _custom_threshold(self, plugin) -> Tuple[Optional[float], str]:
+        threshold = self.evaluator.thresholds.get(plugin.name, plugin.threshold)
+        if threshold is None:
+            return None, "-"
+        return threshold, f"{'≥' if plugin.higher_is_better else '≤'}{threshold:g}"
+
+    def _mismatches(self, metrics: EvaluationMetrics) -> List[Tuple[float, str, Any, Any]]:
+        rows = metrics.comparison_rows
+        if rows is None:
+            return []
+        group_key = self.evaluator.group_key
+        return [(relative_difference(llm_value, mongodb_value, group_key), key, llm_value, mongodb_value)
+                for key, llm_value, mongodb_value, status
+                in zip(rows.keys, rows.llm_values, rows.mongodb_values, rows.statuses)
+                if status == COMPARISON_MISMATCH]
+
+    def _mismatch_row(self, relative: float, key: str, llm_value: Any, mongodb_value: Any) -> List[Any]:
+        evaluator = self.evaluator
+        return [key, evaluator._format_value(llm_value), evaluator._format_value(mongodb_value),
+                evaluator._calculate_difference(llm_value, mongodb_value), _format_ratio(relative)]
+
+    def write_run(self, metrics: EvaluationMetrics, analysis_result: UniversalAnalysisResult,
+                  index: Optional[int] = None) -> None:
+        """실행 하나의 평가 결과 기록 및 코퍼스 요약 누적"""
+        if self._closed:
+            raise ValueError("이미 닫힌 리포트입니다")
+        run_index = self.runs if index is None else index
+        self.runs += 1
+        self.passed += bool(metrics.overall_pass)
+
+        metric_rows = []
+        for name, label, threshold_key, lower_is_better in _METRIC_LABELS:
+            value = getattr(metrics, name)
+            self._metric_sums[name] += value
+            ok = self._metric_passes(threshold_key, lower_is_better, value)
+            if not ok:
+                self._metric_failures[name] += 1
+            comparator = "≤" if lower_is_better else "≥"
+            metric_rows.append([label, f"{value:.2%}",
+                                f"{comparator}{self.evaluator.thresholds[threshold_key]:.2%}",
+                                "✅" if ok else "❌"])
+
+        if metrics.custom_metrics:
+            for plugin in self.evaluator.metric_plugins:
+                if plugin.name not in metrics.custom_metrics:
+                    continue
+                value = metrics.custom_metrics[plugin.name]
+                threshold, limit = self._custom_threshold(plugin)
+                ok = plugin.passes(value, threshold)
+                totals = self._custom_metrics.setdefault(plugin.name, [0.0, 0, 0])
+                totals[0] += value
+                totals[1] += 1
+                totals[2] += not ok
+                metric_rows.append([plugin.name, f"{value:.4g}", limit,
+                                    "-" if threshold is None else ("✅" if ok else "❌")])
+
+        latency = metrics.latency
+        if latency is None:
+            latency = LatencyStats.from_logs(analysis_result.execution_logs)   # SLO 미설정 시 리포트용으로 계산
+        if latency is not None:
+            self.latency.merge(latency)
+            if self.evaluator.latency_slo_violations(latency):
+                self.latency_slo_failures += 1
+
+        if metrics.comparison_rows is not None:
+            for status in metrics.comparison_rows.statuses:
+                self._status_counts[status] += 1
+        mismatches = self._mismatches(metrics)
+        top = heapq.nlargest(self.top_k, mismatches, key=lambda item: item[0])
+        for item in top:
+            self._sequence += 1
+            entry = (item[0], -self._sequence, [run_index] + self._mismatch_row(*item))
+            if len(self._top_mismatches) < self.top_k:
+                heapq.heappush(self._top_mismatches, entry)
+            elif entry[:2] > self._top_mismatches[0][:2]:
+                heapq.heapreplace(self._top_mismatches, entry)
+
+        if not self.include_runs:
+            return
+
+        f = self._format
+        status = "✅ PASS" if metrics.overall_pass else "❌ FAIL"
+        parts = [f.heading(2, f"실행 {run_index}: {status}"),
+                 f.code(analysis_result.analysis_query),
+                 f.table(["지표", "값", "임계값", "상태"], metric_rows)]
+
+        if metrics.comparison_rows is None:
+            parts.append(f.paragraph("비교 데이터가 없습니다."))
+        else:
+            statuses = metrics.comparison_rows.statuses
+            summary = (f"비교 {len(statuses)}개 지표: 일치 {statuses.count(COMPARISON_MATCH)}, "
+                       f"불일치 {len(mismatches)}, LLM 누락 {statuses.count(COMPARISON_LLM_MISSING)}, "
+                       f"N/A {statuses.count(COMPARISON_NA)}")
+            if len(mismatches) > len(top):
+                summary += f" (상대 차이 상위 {len(top)}개 불일치만 표시)"
+            parts.append(f.paragraph(summary))
+            if top:
+                parts.append(f.table(_MISMATCH_HEADERS, [self._mismatch_row(*item) for item in top]))
+
+        parts.append(f.heading(3, "실행된 MongoDB 쿼리들"))
+        parts.extend(f.code(query, "javascript") for query in analysis_result.mongodb_queries)
+        parts.append(f.paragraph(f"평가 시간: {analysis_result.timestamp}"))
+        self._write("".join(parts))
+
+    def write_summary(self) -> None:
+        """코퍼스 요약 기록"""
+        f = self._format
+        parts = [f.heading(2, "코퍼스 요약")]
+        if self.runs == 0:
+            parts.append(f.paragraph("평가된 실행이 없습니다."))
+            self._write("".join(parts))
+            return
+
+        parts.append(f.paragraph(f"실행 {self.runs}건, PASS {self.passed}건, FAIL {self.runs - self.passed}건 "
+                                 f"(통과율 {self.passed / self.runs:.1%})"))
+        rows = []
+        for name, label, threshold_key, lower_is_better in _METRIC_LABELS:
+            comparator = "≤" if lower_is_better else "≥"
+            rows.append([label, f"{self._metric_sums[name] / self.runs:.2%}",
+                         f"{comparator}{self.evaluator.thresholds[threshold_key]:.2%}",
+                         self._metric_failures[name]])
+        for plugin in self.evaluator.metric_plugins:
+            if plugin.name in self._custom_metrics:
+                total, count, failures = self._custom_metrics[plugin.name]
+                rows.append([plugin.name, f"{total / count:.4g}", self._custom_threshold(plugin)[1], failures])
+        parts.append(f.table(["지표", "평균", "임계값", "미달 실행 수"], rows))
+
+        counts = self._status_counts
+        parts.append(f.paragraph(f"비교 지표: 일치 {counts[COMPARISON_MATCH]}, 불일치 {counts[COMPARISON_MISMATCH]}, "
+                                 f"LLM 누락 {counts[COMPARISON_LLM_MISSING]}, N/A {counts[COMPARISON_NA]}"))
+        if self._top_mismatches:
+            parts.append(f.heading(3, f"상대 차이 상위 {len(self._top_mismatches)}개 불일치"))
+            ranked = sorted(self._top_mismatches, reverse=True)
+            parts.append(f.table(["실행"] + _MISMATCH_HEADERS, [row for _, _, row in ranked]))
+        if self.latency.count:
+            parts.append(f.heading(3, "실행 지연 시간"))
+            if self.evaluator.latency_slo:
+                parts.append(f.paragraph(f"지연 시간 SLO 미달 실행 수: {self.latency_slo_failures}"))
+            parts.append(f.table(_LATENCY_HEADERS, [
+                [name, row["count"], f"{row['p50']:.3f}s", f"{row['p95']:.3f}s",
+                 f"{row['p99']:.3f}s", f"{row['max']:.3f}s"]
+                for name, row in [("전체", self.latency.summary()["overall"])] + self.latency.rows()]))
+        self._write("".join(parts))
+
+    def close(self) -> None:
+        """코퍼스 요약과 문서 끝을 기록 (스트림은 닫지 않음)"""
+        if self._closed:
+            return
+        self.write_summary()
+        self._write(self._format.end())
+        self.stream.flush()
+        self._closed = True
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,343 @@
+"""
+실시간 운영 모니터링용 온라인 지표 집계기
+
+평가 결과를 하나씩 받아 4개 핵심 지표의 구간 평균을 유지합니다.
+- 슬라이딩 윈도우: 최근 N회 실행 (고정 크기 링 버퍼), 최근 T초 (고정 개수 시간 버킷)
+- 텀블링 윈도우: N회 실행마다, T초 구간마다 마감하여 최근 K개 구간 보관
+- 누적 합계
+
+갱신은 실행당 O(1)이고, 메모리는 입력 건수와 무관하게 윈도우 설정으로 고정됩니다.
+시간 슬라이딩 윈도우의 경계는 버킷 폭(T / 버킷 수) 단위로 맞춰집니다.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Iterable, Union
+
+from .core import DEFAULT_THRESHOLDS, EvaluationMetrics
+
+
+# 누적 값 위치: 4개 지표 + 통과 수
+_FIELDS = ("semantic_error_rate", "execution_success_rate", "empty_result_rate", "accuracy_rate", "overall_pass")
+_N_FIELDS = len(_FIELDS)
+
+Timestamp = Union[float, int, str, datetime, None]
+
+
+@dataclass
+class WindowSnapshot:
+    """윈도우 집계 값"""
+    window: str                                   # 윈도우 이름 (예: "last_100_runs", "last_300s")
+    count: int                                    # 포함된 실행 수
+    semantic_error_rate: Optional[float] = None   # 구간 평균 (실행이 없으면 None)
+    execution_success_rate: Optional[float] = None
+    empty_result_rate: Optional[float] = None
+    accuracy_rate: Optional[float] = None
+    pass_rate: Optional[float] = None             # 개별 실행 통과 비율
+    overall_pass: Optional[bool] = None           # 구간 평균의 임계값 통과 여부
+    start: Optional[float] = None                 # 구간 시작 (epoch 초, 시간 윈도우만)
+    end: Optional[float] = None                   # 구간 끝 (epoch 초, 시간 윈도우만)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _to_epoch(timestamp: Timestamp, clock: Callable[[], float]) -> float:
+    if timestamp is None:
+        return clock()
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return timestamp.timestamp()
+
+
+def _snapshot(window: str, count: int, sums: List[float], thresholds: Dict[str, float],
+              start: Optional[float] = None, end: Optional[float] = None) -> WindowSnapshot:
+    if count == 0:
+        return WindowSnapshot(window=window, count=0, start=start, end=end)
+    semantic_error_rate, execution_success_rate, empty_result_rate, accuracy_rate, passed = (
+        value / count for value in sums
+    )
+    overall_pass = (semantic_error_rate <= thresholds["semantic_error"]
+                    and execution_success_rate >= thresholds["execution_success"]
+                    and empty_result_rate <= thresholds["empty_result"]
+                    and accuracy_rate >= thresholds["accuracy"])
+    return WindowSnapshot(
+        window=window,
+        count=count,
+        semantic_error_rate=semantic_error_rate,
+        execution_success_rate=execution_success_rate,
+        empty_result_rate=empty_result_rate,
+        accuracy_rate=accuracy_rate,
+        pass_rate=passed,
+        overall_pass=overall_pass,
+        start=start,
+        end=end,
+    )
+
+
+class _CountWindow:
+    """최근 N회 실행 슬라이딩 윈도우 (링 버퍼)"""
+
+    __slots__ = ("size", "name", "_buffer", "_position", "_count", "_sums", "_updates")
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"윈도우 크기는 1 이상이어야 합니다: {size}")
+        self.size = size
+        self.name = f"last_{size}_runs"
+        self._buffer: List[Optional[tuple]] = [None] * size
+        self._position = 0
+        self._count = 0
+        self._sums = [0.0] * _N_FIELDS
+        self._updates = 0
+
+    def add(self, values: tuple) -> None:
+        outgoing = self._buffer[self._position]
+        self._buffer[self._position] = values
+        self._position = (self._position + 1) % self.size
+        sums = self._sums
+        if outgoing is None:
+            self._count += 1
+            for i in range(_N_FIELDS):
+                sums[i] += values[i]
+        else:
+            for i in range(_N_FIELDS):
+                sums[i] += values[i] - outgoing[i]
+
+        # 부동소수점 누적 오차 방지: 버퍼가 한 바퀴 돌 때마다 다시 합산 (분할 상환 O(1))
+        self._updates += 1
+        if self._updates >= self.size:
+            self._updates = 0
+            filled = [item for item in self._buffer if item is not None]
+            self._sums = [sum(item[i] for item in filled) for i in range(_N_FIELDS)]
+
+    def snapshot(self, thresholds: Dict[str, float]) -> WindowSnapshot:
+        return _snapshot(self.name, self._count, self._sums, thresholds)
+
+
+class _TimeWindow:
+    """최근 T초 슬라이딩 윈도우 (고정 개수 시간 버킷)"""
+
+    __slots__ = ("seconds", "name", "_width", "_bucket_ids", "_counts", "_sums", "late")
+
+    def __init__(self, seconds: float, buckets: int):
+        if seconds <= 0 or buckets < 1:
+            raise ValueError(f"시간 윈도우 설정이 올바르지 않습니다: {seconds}초, 버킷 {buckets}개")
+        self.seconds = seconds
+        self.name = f"last_{seconds:g}s"
+        self._width = seconds / buckets
+        self._bucket_ids = [None] * buckets
+        self._counts = [0] * buckets
+        self._sums = [[0.0] * _N_FIELDS for _ in range(buckets)]
+        self.late = 0
+
+    def add(self, timestamp: float, values: tuple, newest: float) -> None:
+        bucket_id = int(timestamp // self._width)
+        n_buckets = len(self._bucket_ids)
+        if bucket_id <= int(newest // self._width) - n_buckets:
+            self.late += 1   # 윈도우 밖의 늦게 도착한 실행
+            return
+        slot = bucket_id % n_buckets
+        sums = self._sums[slot]
+        if self._bucket_ids[slot] != bucket_id:
+            self._bucket_ids[slot] = bucket_id
+            self._counts[slot] = 0
+            for i in range(_N_FIELDS):
+                sums[i] = 0.0
+        self._counts[slot] += 1
+        for i in range(_N_FIELDS):
+            sums[i] += values[i]
+
+    def snapshot(self, now: float, thresholds: Dict[str, float]) -> WindowSnapshot:
+        current = int(now // self._width)
+        oldest = current - len(self._bucket_ids) + 1
+        count = 0
+        totals = [0.0] * _N_FIELDS
+        for bucket_id, bucket_count, sums in zip(self._bucket_ids, self._counts, self._sums):
+            if bucket_id is not None and oldest <= bucket_id <= current:
+                count += bucket_count
+                for i in range(_N_FIELDS):
+                    totals[i] += sums[i]
+        return _snapshot(self.name, count, totals, thresholds,
+                         start=oldest * self._width, end=(current + 1) * self._width)
+
+
+class _TumblingWindow:
+    """N회 실행 또는 T초 구간마다 마감하는 텀블링 윈도우"""
+
+    __slots__ = ("runs", "seconds", "name", "closed", "_count", "_sums", "_window_id", "late")
+
+    def __init__(self, runs: Optional[int] = None, seconds: Optional[float] = None, history: int = 100):
+        if (runs is None) == (seconds is None):
+            raise ValueError("텀블링 윈도우에는 runs 또는 seconds 중 하나만 지정해야 합니다")
+        if (runs is not None and runs < 1) or (seconds is not None and seconds <= 0):
+            raise ValueError(f"텀블링 윈도우 크기가 올바르지 않습니다: runs={runs}, seconds={seconds}")
+        self.runs = runs
+        self.seconds = seconds
+        self.name = f"every_{runs}_runs" if runs is not None else f"every_{seconds:g}s"
+        self.closed: deque = deque(maxlen=history)
+        self._count = 0
+        self._sums = [0.0] * _N_FIELDS
+        self._window_id: Optional[int] = None
+        self.late = 0
+
+    def add(self, timestamp: float, values: tuple, thresholds: Dict[str, float]) -> Optional[WindowSnapshot]:
+        """실행 추가 - 구간이 마감되면 마감된 구간 반환"""
+        closed = None
+        if self.seconds is not None:
+            window_id = int(timestamp // self.seconds)
+            if self._window_id is None:
+                self._window_id = window_id
+            elif window_id < self._window_id:
+                self.late += 1
+                return None
+            elif window_id > self._window_id:
+                closed = self._close(thresholds)
+                self._window_id = window_id
+
+        self._count += 1
+        sums = self._sums
+        for i in range(_N_FIELDS):
+            sums[i] += values[i]
+
+        if self.runs is not None and self._count >= self.runs:
+            closed = self._close(thresholds)
+        return closed
+
+    def _close(self, thresholds: Dict[str, float]) -> Optional[WindowSnapshot]:
+        if self._count == 0:
+            return None
+        start = end = None
+        if self.seconds is not None:
+            start = self._window_id * self.seconds
+            end = start + self.seconds
+        snapshot = _snapshot(self.name, self._count, self._sums, thresholds, start=start, end=end)
+        self.closed.append(snapshot)
+        self._count = 0
+        self._sums = [0.0] * _N_FIELDS
+        return snapshot
+
+    def current(self, thresholds: Dict[str, float]) -> WindowSnapshot:
+        start = end = None
+        if self.seconds is not None and self._window_id is not None:
+            start = self._window_id * self.seconds
+            end = start + self.seconds
+        return _snapshot(self.name, self._count, self._sums, thresholds, start=start, end=end)
+
+
+class RollingMetrics:
+    """
+    4개 핵심 지표 온라인 집계기
+
+    Args:
+        thresholds: Pass/Fail 판정 임계값 (기본: 평가기 기본 임계값)
+        window_runs: 최근 N회 실행 슬라이딩 윈도우 크기들
+        window_seconds: 최근 T초 슬라이딩 윈도우 길이들
+        tumbling_runs: N회 실행마다 마감하는 텀블링 윈도우 크기들
+        tumbling_seconds: T초마다 마감하는 텀블링 윈도우 길이들
+        buckets: 시간 슬라이딩 윈도우당 버킷 수 (경계 해상도)
+        history: 텀블링 윈도우별로 보관할 마감 구간 수
+        on_window_closed: 텀블링 구간 마감 시 호출할 콜백 (WindowSnapshot 인자)
+        clock: 타임스탬프가 없을 때 사용할 현재 시각 함수 (epoch 초)
+    """
+
+    def __init__(self, thresholds: Optional[Dict[str, float]] = None,
+                 window_runs: Iterable[int] = (100,),
+                 window_seconds: Iterable[float] = (300,),
+                 tumbling_runs: Iterable[int] = (),
+                 tumbling_seconds: Iterable[float] = (),
+                 buckets: int = 60,
+                 history: int = 100,
+                 on_window_closed: Optional[Callable[[WindowSnapshot], None]] = None,
+                 clock: Callable[[], float] = time.time):
+        self.thresholds = thresholds or dict(DEFAULT_THRESHOLDS)
+        self.on_window_closed = on_window_closed
+        self.clock = clock
+        self._count_windows = [_CountWindow(size) for size in window_runs]
+        self._time_windows = [_TimeWindow(seconds, buckets) for seconds in window_seconds]
+        self._tumbling = ([_TumblingWindow(runs=runs, history=history) for runs in tumbling_runs]
+                          + [_TumblingWindow(seconds=seconds, history=history) for seconds in tumbling_seconds])
+        self._total_count = 0
+        self._total_sums = [0.0] * _N_FIELDS
+        self._newest: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(self, metrics: EvaluationMetrics, timestamp: Timestamp = None) -> None:
+        """평가 결과 하나 반영 (timestamp: epoch 초, ISO 문자열, datetime 또는 None=현재 시각)"""
+        self.update_values(metrics.semantic_error_rate, metrics.execution_success_rate,
+                           metrics.empty_result_rate, metrics.accuracy_rate,
+                           metrics.overall_pass, timestamp)
+
+    def update_values(self, semantic_error_rate: float, execution_success_rate: float,
+                      empty_result_rate: float, accuracy_rate: float,
+                      overall_pass: bool, timestamp: Timestamp = None) -> None:
+        """지표 값으로 직접 반영 (스트리밍/일괄 평가 결과 행용)"""
+        values = (float(semantic_error_rate), float(execution_success_rate),
+                  float(empty_result_rate), float(accuracy_rate), 1.0 if overall_pass else 0.0)
+        epoch = _to_epoch(timestamp, self.clock)
+
+        closed = []
+        with self._lock:
+            self._total_count += 1
+            for i in range(_N_FIELDS):
+                self._total_sums[i] += values[i]
+            if self._newest is None or epoch > self._newest:
+                self._newest = epoch
+
+            for window in self._count_windows:
+                window.add(values)
+            for window in self._time_windows:
+                window.add(epoch, values, self._newest)
+            for window in self._tumbling:
+                snapshot = window.add(epoch, values, self.thresholds)
+                if snapshot is not None:
+                    closed.append(snapshot)
+
+        if self.on_window_closed is not None:
+            for snapshot in closed:
+                self.on_window_closed(snapshot)
+
+    @property
+    def count(self) -> int:
+        return self._total_count
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, WindowSnapshot]:
+        """
+        현재 윈도우 값
+
+        Args:
+            now: 시간 윈도우 기준 시각 (기본: 현재 시각과 마지막 실행 시각 중 늦은 값)
+
+        Returns:
+            Dict: 윈도우 이름 → WindowSnapshot ("total", 슬라이딩 윈도우, 진행 중인 텀블링 구간)
+        """
+        with self._lock:
+            if now is None:
+                now = self.clock()
+                if self._newest is not None and self._newest > now:
+                    now = self._newest
+            snapshots = {"total": _snapshot("total", self._total_count, self._total_sums, self.thresholds)}
+            for window in self._count_windows:
+                snapshots[window.name] = window.snapshot(self.thresholds)
+            for window in self._time_windows:
+                snapshots[window.name] = window.snapshot(now, self.thresholds)
+            for window in self._tumbling:
+                snapshots[window.name] = window.current(self.thresholds)
+            return snapshots
+
+    def closed_windows(self, name: Optional[str] = None) -> List[WindowSnapshot]:
+        """마감된 텀블링 구간 (오래된 순, name 지정 시 해당 윈도우만)"""
+        with self._lock:
+            return [snapshot for window in self._tumbling if name is None or window.name == name
+                    for snapshot in window.closed]
+
+    @property
+    def late_runs(self) -> int:
+        """시간 윈도우에서 제외된 늦게 도착한 실행 수 (윈도우별 합계)"""
+        return (sum(window.late for window in self._time_windows)
+                + sum(window.late for window in self._tumbling))
@@ -0,0 +1,420 @@
+"""
+의미 오류 규칙 엔진
+
+두 종류의 규칙을 지원합니다.
+- AST 규칙: 쿼리를 한 번 파싱한 AST(query_ast)에서 빈 $match, 자기 자신과의 필드 비교,
+  중복 _id 그룹핑 등을 구조적으로 검사합니다. 파싱할 수 없는 쿼리에는 선택적 대체 정규식을 사용합니다.
+- 정규식 규칙: 평가기당 한 번만 컴파일하고, 모든 규칙을 하나의 정규식으로 결합하여
+  쿼리당 단일 스캔으로 검사합니다.
+
+어떤 규칙이 감지했는지와 규칙별 감지 횟수 및 소요 시간을 함께 기록합니다.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Iterable, Iterator, Tuple, Union
+
+from .query_ast import QueryAST, parse_query
+
+
+# 규칙 단위로 적용 가능한 인라인 플래그
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+# 역참조(\1 등)와 이스케이프된 백슬래시 토큰
+_BACKREFERENCE = re.compile(r"\\\\|\\([1-9][0-9]?)")
+
+
+@dataclass
+class SemanticRule:
+    """의미 오류 검사 규칙 (정규식)"""
+    name: str                      # 규칙 이름 (감지 결과에 보고됨)
+    pattern: str                   # 정규식 패턴
+    description: str = ""          # 규칙 설명
+    flags: int = re.IGNORECASE     # 정규식 플래그 (i, m, s, x 만 허용)
+
+    def signature(self) -> Tuple:
+        return (self.name, self.pattern, int(self.flags))
+
+
+@dataclass
+class AstRule:
+    """의미 오류 검사 규칙 (쿼리 AST)"""
+    name: str                                        # 규칙 이름 (감지 결과에 보고됨)
+    check: Callable[[QueryAST], Optional[str]]       # 감지 시 상세 설명, 아니면 None
+    description: str = ""                            # 규칙 설명
+    fallback_pattern: Optional[str] = None           # 파싱할 수 없는 쿼리에 사용할 정규식
+    flags: int = re.IGNORECASE                       # 대체 정규식 플래그
+
+    def signature(self) -> Tuple:
+        check = f"{getattr(self.check, '__module__', '')}.{getattr(self.check, '__qualname__', repr(self.check))}"
+        return (self.name, check, self.fallback_pattern, int(self.flags))
+
+
+Rule = Union[SemanticRule, AstRule]
+
+
+@dataclass
+class RuleMatch:
+    """규칙 감지 결과"""
+    rule: str                      # 감지한 규칙 이름
+    span: Tuple[int, int]          # 쿼리 내 감지 위치 (AST 규칙은 쿼리 전체)
+    text: str                      # 감지된 문자열 (AST 규칙은 상세 설명)
+
+
+@dataclass
+class RuleStats:
+    """규칙별 통계"""
+    hits: int = 0                  # 감지 횟수
+    seconds: float = 0.0           # 해당 규칙이 감지한 스캔의 누적 소요 시간
+
+
+# ---------------------------------------------------------------------------
+# 내장 AST 검사
+# ---------------------------------------------------------------------------
+
+_COMPARISON_OPERATORS = {"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$cmp"}
+
+# 이보다 큰 하한 조건($gt/$gte)은 비현실적인 값으로 간주 (기존 정규식 >\s*9{8,} 기준)
+UNREALISTIC_LOWER_BOUND = 99_999_999
+
+# 입력 문서를 바꾸는 스테이지 - 이후의 _id는 원본 문서의 고유 키가 아님
+_RESHAPING_STAGES = {"$group", "$project", "$unwind", "$replaceRoot", "$replaceWith",
+                     "$addFields", "$set", "$lookup", "$bucket", "$facet"}
+
+_WHERE_SELF_COMPARISON = re.compile(r"this\.(\w+)\s*(?:[!=]==?|[<>]=?)\s*this\.\1\b")
+
+
+def _nodes(value: Any) -> Iterator[dict]:
+    """중첩 스펙의 모든 딕셔너리 노드"""
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _is_field_reference(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("$") and not value.startswith("$$")
+
+
+def _expression_roots(stage) -> Iterator[Any]:
+    """스테이지에서 집계 식으로 평가되는 부분 ($match는 $expr 값, 그 외 스테이지는 스펙 전체)"""
+    if stage.operator != "$match":
+        yield stage.spec
+        return
+    for node in _nodes(stage.spec):
+        if "$expr" in node:
+            yield node["$expr"]
+
+
+def check_self_comparison(ast: QueryAST) -> Optional[str]:
+    """
+    필드를 자기 자신과 비교 (집계 식 {$eq: ["$a", "$a"]}, $where this.a == this.a)
+
+    쿼리 필터의 {a: "$a"}, {a: {$eq: "$a"}}에서 "$a"는 문자열 리터럴이므로
+    $match에서는 $expr 안의 식만 필드 참조로 검사합니다.
+    """
+    for stage in ast.stages:
+        for root in _expression_roots(stage):
+            for node in _nodes(root):
+                for key, operand in node.items():
+                    if (key in _COMPARISON_OPERATORS and isinstance(operand, list) and len(operand) == 2
+                            and _is_field_reference(operand[0]) and operand[0] == operand[1]):
+                        return f"{stage.operator} 스테이지 {stage.index}: {operand[0]} {key} {operand[1]}"
+
+        if stage.operator != "$match":
+            continue
+        for node in _nodes(stage.spec):
+            where = node.get("$where")
+            if isinstance(where, str):
+                found = _WHERE_SELF_COMPARISON.search(where)
+                if found:
+                    return f"$match 스테이지 {stage.index}: {found.group(0)}"
+    return None
+
+
+def check_unrealistic_number(ast: QueryAST) -> Optional[str]:
+    """비현실적으로 큰 하한 조건 ($gt/$gte)"""
+    for stage in ast.stages:
+        for node in _nodes(stage.spec):
+            for key in ("$gt", "$gte"):
+                operand = node.get(key)
+                if isinstance(operand, list) and len(operand) == 2:
+                    operand = operand[1]
+                if (isinstance(operand, (int, float)) and not isinstance(operand, bool)
+                        and operand >= UNREALISTIC_LOWER_BOUND):
+                    return f"{stage.operator} 스테이지 {stage.index}: {key} {operand}"
+    return None
+
+
+def check_empty_match(ast: QueryAST) -> Optional[str]:
+    """조건이 빈 $match 스테이지 (find의 빈 필터는 제외)"""
+    for stage in ast.stages_of("$match"):
+        if stage.spec == {} or stage.spec == {"$and": []}:
+            return f"$match 스테이지 {stage.index}: 빈 조건"
+    return None
+
+
+def check_duplicate_group_id(ast: QueryAST) -> Optional[str]:
+    """중복 _id 그룹핑 (_id 키 중복, 복합 _id의 같은 필드 반복, 원본 고유 키 _id로 그룹핑)"""
+    for path in ast.duplicate_keys:
+        if path.endswith("$group._id"):
+            return f"$group에 _id 키 중복 ({path})"
+
+    reshaped = False
+    for stage in ast.stages:
+        if stage.operator == "$group" and isinstance(stage.spec, dict):
+            group_id = stage.spec.get("_id")
+            if isinstance(group_id, dict):
+                references = [value for value in group_id.values() if _is_field_reference(value)]
+                if len(references) != len(set(references)):
+                    return f"$group 스테이지 {stage.index}: 복합 _id에 같은 필드 반복"
+            elif group_id == "$_id" and not reshaped:
+                return f"$group 스테이지 {stage.index}: 고유 키 _id로 그룹핑"
+        if stage.operator in _RESHAPING_STAGES:
+            reshaped = True
+    return None
+
+
+DEFAULT_SEMANTIC_RULES = [
+    AstRule("self_comparison", check_self_comparison, "동일 필드 비교 (field != field)",
+            fallback_pattern=r"(\w+)\s*[!=<>]+\s*\1"),
+    SemanticRule("zero_count_exists", r"count.*==.*0.*AND.*exists", "존재하면서 개수가 0인 모순"),
+    AstRule("unrealistic_number", check_unrealistic_number, "비현실적인 큰 수",
+            fallback_pattern=r">\s*9{8,}"),
+    AstRule("empty_match", check_empty_match, "빈 매치 조건",
+            fallback_pattern=r"\$match.*\{\s*\}"),
+    AstRule("duplicate_group_id", check_duplicate_group_id, "중복 그룹핑",
+            fallback_pattern=r"\$group.*_id.*_id"),
+]
+
+
+# ---------------------------------------------------------------------------
+# 레지스트리
+# ---------------------------------------------------------------------------
+
+def _flag_prefix(rule: SemanticRule) -> str:
+    letters = ""
+    remaining = rule.flags
+    for flag, letter in _SCOPED_FLAGS:
+        if remaining & flag:
+            letters += letter
+            remaining &= ~flag
+    if remaining:
+        raise ValueError(f"규칙 '{rule.name}'에 규칙 단위로 적용할 수 없는 플래그가 있습니다: {remaining}")
+    return letters
+
+
+def _shift_backreferences(pattern: str, offset: int, group_count: int) -> str:
+    """결합 정규식 안에서 그룹 번호가 밀리는 만큼 역참조 번호 보정"""
+
+    def replace(match):
+        if match.group(1) is None:
+            return match.group(0)
+        number = int(match.group(1))
+        if number > group_count:
+            return match.group(0)
+        return f"(?:\\{number + offset})"
+
+    return _BACKREFERENCE.sub(replace, pattern)
+
+
+def _fallback_rule(rule: AstRule) -> SemanticRule:
+    return SemanticRule(name=rule.name, pattern=rule.fallback_pattern,
+                        description=rule.description, flags=rule.flags)
+
+
+def _combine(rules: List[SemanticRule]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """정규식 규칙을 이름 있는 그룹의 대안(|)으로 결합"""
+    parts = []
+    group_names = {}
+    offset = 0
+    for index, rule in enumerate(rules):
+        group_count = re.compile(rule.pattern, rule.flags).groups
+        group_name = f"_rule{index}"
+        group_names[group_name] = rule.name
+        # 규칙 감싸는 그룹 1개만큼 번호가 추가로 밀림
+        body = _shift_backreferences(rule.pattern, offset + 1, group_count)
+        parts.append(f"(?P<{group_name}>(?{_flag_prefix(rule)}:{body}))")
+        offset += group_count + 1
+
+    try:
+        compiled = re.compile("|".join(parts)) if parts else re.compile(r"(?!)")
+    except re.error as e:
+        raise ValueError(f"규칙 결합에 실패했습니다 (이름 있는 그룹 중복 등): {e}") from e
+    return compiled, group_names
+
+
+class SemanticRuleRegistry:
+    """
+    의미 오류 규칙 레지스트리
+
+    규칙은 등록 시점에 검증되고, 결합 정규식은 규칙 목록이 바뀐 뒤
+    첫 검사에서 한 번만 컴파일됩니다. AST 규칙을 먼저 검사한 뒤 정규식 규칙을 스캔합니다.
+    """
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None):
+        self._rules: List[Rule] = []
+        self._ast_rules: List[AstRule] = []
+        self._compiled: Optional[Tuple[re.Pattern, Dict[str, str]]] = None
+        self._compiled_fallback: Optional[Tuple[re.Pattern, Dict[str, str]]] = None
+        self.stats: Dict[str, RuleStats] = {}
+        self.scans = 0
+        self.scan_seconds = 0.0
+        self.parse_errors = 0
+
+        for rule in (DEFAULT_SEMANTIC_RULES if rules is None else rules):
+            self.add(rule)
+
+    @property
+    def rules(self) -> List[Rule]:
+        return list(self._rules)
+
+    def register(self, name: str, pattern: str, description: str = "",
+                 flags: int = re.IGNORECASE) -> SemanticRule:
+        """정규식 규칙 추가 (다음 검사 시 한 번 재컴파일)"""
+        rule = SemanticRule(name=name, pattern=pattern, description=description, flags=flags)
+        self.add(rule)
+        return rule
+
+    def register_ast(self, name: str, check: Callable[[QueryAST], Optional[str]],
+                     description: str = "", fallback_pattern: Optional[str] = None,
+                     flags: int = re.IGNORECASE) -> AstRule:
+        """AST 규칙 추가 - check는 감지 시 상세 설명 문자열, 아니면 None 반환"""
+        rule = AstRule(name=name, check=check, description=description,
+                       fallback_pattern=fallback_pattern, flags=flags)
+        self.add(rule)
+        return rule
+
+    def add(self, rule: Rule) -> None:
+        if any(existing.name == rule.name for existing in self._rules):
+            raise ValueError(f"이미 등록된 규칙입니다: {rule.name}")
+        if isinstance(rule, AstRule):
+            if not callable(rule.check):
+                raise ValueError(f"규칙 '{rule.name}'의 check는 호출 가능해야 합니다")
+            patterns = [_fallback_rule(rule)] if rule.fallback_pattern is not None else []
+        else:
+            patterns = [rule]
+        for pattern_rule in patterns:
+            try:
+                re.compile(pattern_rule.pattern, pattern_rule.flags)
+            except re.error as e:
+                raise ValueError(f"규칙 '{rule.name}'의 패턴이 올바르지 않습니다: {e}") from e
+            _flag_prefix(pattern_rule)
+
+        self._rules.append(rule)
+        self.stats[rule.name] = RuleStats()
+        self._invalidate()
+
+    def remove(self, name: str) -> None:
+        self._rules = [rule for rule in self._rules if rule.name != name]
+        self.stats.pop(name, None)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._ast_rules = [rule for rule in self._rules if isinstance(rule, AstRule)]
+        self._compiled = None
+        self._compiled_fallback = None
+
+    def _compile(self, fallback: bool) -> Tuple[re.Pattern, Dict[str, str]]:
+        rules = []
+        for rule in self._rules:
+            if isinstance(rule, SemanticRule):
+                rules.append(rule)
+            elif fallback and rule.fallback_pattern is not None:
+                rules.append(_fallback_rule(rule))
+        combined = _combine(rules)
+        if fallback:
+            self._compiled_fallback = combined
+        else:
+            self._compiled = combined
+        return combined
+
+    def match(self, query: str) -> Optional[RuleMatch]:
+        """쿼리 검사 (AST 규칙 → 결합 정규식 단일 스캔) - 감지된 규칙 반환 (없으면 None)"""
+        start = time.perf_counter()
+        # AST 규칙이 없으면 파싱하지 않음
+        ast = parse_query(query) if self._ast_rules else None
+        found = None
+        rule_name = None
+        if ast is None or ast.ok:
+            for rule in self._ast_rules:
+                detail = rule.check(ast)
+                if detail is not None:
+                    rule_name = rule.name
+                    found = RuleMatch(rule=rule.name, span=(0, len(query)), text=detail)
+                    break
+            compiled, group_names = self._compiled or self._compile(fallback=False)
+        else:
+            self.parse_errors += 1
+            compiled, group_names = self._compiled_fallback or self._compile(fallback=True)
+
+        if found is None:
+            regex_match = compiled.search(query)
+            if regex_match is not None:
+                rule_name = group_names.get(regex_match.lastgroup) or self._fired_rule(regex_match, group_names)
+                found = RuleMatch(rule=rule_name, span=regex_match.span(), text=regex_match.group(0))
+        elapsed = time.perf_counter() - start
+
+        self.scans += 1
+        self.scan_seconds += elapsed
+        if found is None:
+            return None
+
+        stats = self.stats[rule_name]
+        stats.hits += 1
+        stats.seconds += elapsed
+        return found
+
+    @staticmethod
+    def _fired_rule(found: re.Match, group_names: Dict[str, str]) -> str:
+        # 규칙 내부에 그룹이 있으면 lastgroup 이 내부 그룹을 가리킬 수 있음
+        for group_name, rule_name in group_names.items():
+            if found.group(group_name) is not None:
+                return rule_name
+        raise RuntimeError("감지된 규칙을 찾을 수 없습니다")
+
+    def reset_stats(self) -> None:
+        for name in self.stats:
+            self.stats[name] = RuleStats()
+        self.scans = 0
+        self.scan_seconds = 0.0
+        self.parse_errors = 0
+
+    def profile(self, queries: Iterable[str]) -> Dict[str, float]:
+        """규칙별 개별 검사 비용 측정 (규칙당 누적 초, 통계에는 반영하지 않음)"""
+        checks = []
+        for rule in self._rules:
+            if isinstance(rule, AstRule):
+                fallback = re.compile(rule.fallback_pattern, rule.flags) if rule.fallback_pattern else None
+                checks.append((rule.name, rule.check, fallback))
+            else:
+                checks.append((rule.name, None, re.compile(rule.pattern, rule.flags)))
+
+        costs = {name: 0.0 for name, _, _ in checks}
+        for query in queries:
+            ast = parse_query(query)
+            for name, check, pattern in checks:
+                start = time.perf_counter()
+                if check is not None and ast.ok:
+                    check(ast)
+                elif pattern is not None and (check is None or not ast.ok):
+                    pattern.search(query)
+                costs[name] += time.perf_counter() - start
+        return costs
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # 컴파일된 정규식은 워커에서 한 번 다시 컴파일
+        state["_compiled"] = None
+        state["_compiled_fallback"] = None
+        return state
@@ -0,0 +1,312 @@
+"""
+표본 기반 정답 일치율 추정
+
+MongoDB 직접 실행 결과가 매우 클 때(문서별/그룹별 출력) 모든 키를 비교하지 않고
+층화 무작위 표본만 비교하여 정답 일치율과 신뢰구간을 추정합니다.
+- 층: 스칼라 키는 값 종류(수치/문자열/중첩/기타)별 층, min_split 이상 길이의 리스트 값은
+  키마다 원소 단위 층 (group_key 설정 시 그룹 키로 조인한 원소)
+- 층 가중치는 키 수 기준: 스칼라 키는 키당 1, 큰 리스트 키는 1 (원소 일치 비율이 그 키의 점수)
+  따라서 큰 리스트가 없으면 추정 대상은 정확 비교의 키 단위 일치율과 같습니다.
+- 라운드마다 batch_size개를 가중치 비례로 추가 추출하고, 신뢰구간이 accuracy 임계값의 한쪽에
+  완전히 놓이면 조기 종료 (Pass/Fail 확정)
+- 같은 seed와 같은 입력이면 같은 표본, 같은 결과 (표준 라이브러리 random.Random 사용)
+
+    evaluator = UniversalMongoDBEvaluator(accuracy_sampling=AccuracySampling(confidence=0.95, seed=7))
+    metrics = evaluator.evaluate(analysis_result)
+    metrics.accuracy_estimate     # AccuracyEstimate(estimate, lower, upper, sampled, population ...)
+"""
+
+import math
+import random
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import canonical_json
+
+
+@dataclass(frozen=True)
+class AccuracySampling:
+    """표본 기반 정답 일치율 추정 설정"""
+    confidence: float = 0.95       # 신뢰수준
+    seed: int = 0                  # 표본 추출 시드
+    min_population: int = 2000     # 비교 단위 수가 이보다 적으면 정확 비교
+    batch_size: int = 200          # 라운드당 추가 표본 수
+    min_samples: int = 400         # 조기 종료 판단 전 최소 표본 수
+    max_samples: int = 20000       # 최대 표본 수 (도달하면 점 추정값으로 판정)
+    min_split: int = 1000          # 이 길이 이상의 리스트 값은 원소 단위로 추출
+
+    def __post_init__(self):
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError(f"confidence는 0과 1 사이여야 합니다: {self.confidence}")
+        if min(self.batch_size, self.min_samples, self.max_samples, self.min_split) < 1:
+            raise ValueError("batch_size, min_samples, max_samples, min_split은 1 이상이어야 합니다")
+
+    def signature(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class AccuracyEstimate:
+    """정답 일치율 추정 결과"""
+    estimate: float                # 층화 추정값 (accuracy_rate로 사용)
+    lower: float                   # 신뢰구간 하한
+    upper: float                   # 신뢰구간 상한
+    confidence: float              # 신뢰수준
+    sampled: int                   # 비교한 단위 수
+    population: int                # 전체 비교 단위 수
+    strata: int                    # 층 수
+    decided: Optional[bool] = None # 신뢰구간으로 확정된 판정 (True: 통과, False: 미달, None: 미확정)
+
+    @property
+    def exhaustive(self) -> bool:
+        """모든 단위를 비교했는지 여부 (신뢰구간 폭 0)"""
+        return self.sampled >= self.population
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"estimate": self.estimate, "lower": self.lower, "upper": self.upper,
+                "confidence": self.confidence, "sampled": self.sampled, "population": self.population,
+                "strata": self.strata, "decided": self.decided}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AccuracyEstimate":
+        return cls(**data)
+
+
+class _Stratum:
+    """비교 단위 층 - compare(i)는 i번째 단위의 일치 여부"""
+
+    __slots__ = ("name", "weight", "size", "compare", "order", "taken", "matches", "key")
+
+    def __init__(self, name: str, weight: float, size: int, compare: Callable[[int], bool],
+                 key: Optional[str] = None):
+        self.name = name
+        self.weight = weight
+        self.size = size
+        self.compare = compare
+        self.order: List[int] = []
+        self.taken = 0
+        self.matches = 0
+        self.key = key          # 원소 단위 층의 결과 키 (스칼라 키 층은 None)
+
+    def draw(self, count: int) -> None:
+        for index in self.order[self.taken:self.taken + count]:
+            self.matches += self.compare(index)
+        self.taken = min(self.taken + count, len(self.order))
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, dict)):
+        return "nested"
+    return "other"
+
+
+# 흔한 값 타입의 층 (하위 클래스는 _kind로 판별)
+_KIND_BY_TYPE = {int: "number", float: "number", bool: "number", str: "string",
+                 list: "nested", dict: "nested", type(None): "other"}
+
+
+# 불리언/복합 그룹 키 태그 (True == 1, 복합 키 JSON == 같은 텍스트의 문자열 키 충돌 방지)
+_KEY_TAG = object()
+
+
+def _group_id(value: Any) -> Any:
+    """
+    그룹 키 값을 해시 가능한 값으로 변환 (grouped.compare_grouped와 같은 MongoDB $group 동일성)
+
+    1과 1.0은 같은 그룹, 불리언은 숫자와 다른 그룹, 복합 _id는 타입을 보존하는 정규화 JSON
+    """
+    if type(value) is bool:
+        return (_KEY_TAG, value)
+    try:
+        hash(value)
+    except TypeError:
+        return (_KEY_TAG, canonical_json(value))
+    return value
+
+
+def _list_stratum(key: str, calculated: list, expected: list, values_match: Callable[[Any, Any], bool],
+                  group_key: Optional[str]) -> _Stratum:
+    """큰 리스트 값의 원소 단위 층 (group_key 문서 리스트는 그룹 키 조인, 그 외는 위치 기준)"""
+    if (group_key is not None and calculated and expected
+            and isinstance(calculated[0], dict) and group_key in calculated[0]
+            and isinstance(expected[0], dict) and group_key in expected[0]):
+        expected_index = {}
+        for document in expected:
+            if isinstance(document, dict) and group_key in document:
+                expected_index.setdefault(_group_id(document[group_key]), document)
+        calculated_ids = [_group_id(document.get(group_key)) if isinstance(document, dict) else None
+                          for document in calculated]
+        calculated_set = set(calculated_ids)
+        # MongoDB에만 있는 그룹은 불일치 단위
+        missing = sum(1 for group in expected_index if group not in calculated_set)
+        n_calculated = len(calculated)
+
+        def compare(index: int) -> bool:
+            if index >= n_calculated:
+                return False
+            document = expected_index.get(calculated_ids[index])
+            return document is not None and values_match(calculated[index], document)
+
+        return _Stratum(f"{key}[{group_key}]", 1.0, n_calculated + missing, compare, key)
+
+    n_common = min(len(calculated), len(expected))
+
+    def compare(index: int) -> bool:
+        # 길이가 다르면 남는 위치는 불일치
+        return index < n_common and values_match(calculated[index], expected[index])
+
+    return _Stratum(f"{key}[]", 1.0, max(len(calculated), len(expected)), compare, key)
+
+
+def _build_strata(calculation_results: Dict[str, Any], expected_results: Dict[str, Any],
+                  values_match: Callable[[Any, Any], bool], group_key: Optional[str],
+                  min_split: int, on_key: Optional[Callable[[str, Any, Any, bool], None]]) -> List[_Stratum]:
+    scalar_keys: Dict[str, List[str]] = {}
+    strata = []
+    for key, calculated in calculation_results.items():
+        if key not in expected_results:
+            continue
+        value_type = type(calculated)
+        if value_type is list or isinstance(calculated, list):
+            expected = expected_results[key]
+            if isinstance(expected, list) and max(len(calculated), len(expected)) >= min_split:
+                strata.append(_list_stratum(key, calculated, expected, values_match, group_key))
+                continue
+        kind = _KIND_BY_TYPE.get(value_type) or _kind(calculated)
+        keys = scalar_keys.get(kind)
+        if keys is None:
+            keys = scalar_keys[kind] = []
+        keys.append(key)
+
+    for kind, keys in scalar_keys.items():
+        def compare(index: int, keys=keys) -> bool:
+            key = keys[index]
+            calculated, expected = calculation_results[key], expected_results[key]
+            match = values_match(calculated, expected)
+            if on_key is not None:
+                on_key(key, calculated, expected, match)
+            return match
+
+        strata.append(_Stratum(kind, float(len(keys)), len(keys), compare))
+    return strata
+
+
+def _allocate(strata: List[_Stratum], budget: int) -> List[int]:
+    """budget개를 층 가중치에 비례해 배분 (남은 단위 수 상한, 남는 몫은 다른 층으로)"""
+    allocation = [0] * len(strata)
+    remaining = budget
+    active = [i for i, stratum in enumerate(strata) if stratum.taken < len(stratum.order)]
+    while remaining > 0 and active:
+        total_weight = sum(strata[i].weight for i in active)
+        share_left = remaining
+        next_active = []
+        for i in active:
+            stratum = strata[i]
+            capacity = len(stratum.order) - stratum.taken - allocation[i]
+            share = max(1, round(share_left * stratum.weight / total_weight))
+            share = min(share, capacity, remaining)
+            allocation[i] += share
+            remaining -= share
+            if capacity - share > 0:
+                next_active.append(i)
+            if remaining == 0:
+                break
+        active = next_active
+    return allocation
+
+
+def _interval(strata: List[_Stratum], z: float) -> Tuple[float, float, float]:
+    """층화 추정값과 정규 근사 신뢰구간 (유한 모집단 보정, 분산은 0.5 보정 비율로 계산)"""
+    total_weight = sum(stratum.weight for stratum in strata)
+    estimate = 0.0
+    variance = 0.0
+    for stratum in strata:
+        share = stratum.weight / total_weight
+        n = stratum.taken
+        if n == 0:
+            # 아직 추출하지 않은 층은 [0, 1] 전체가 가능
+            variance += share * share * 0.25
+            estimate += share * 0.5
+            continue
+        estimate += share * stratum.matches / n
+        if n >= stratum.size:
+            continue
+        smoothed = (stratum.matches + 0.5) / (n + 1)
+        variance += share * share * smoothed * (1 - smoothed) / n * (1 - n / stratum.size)
+    margin = z * math.sqrt(variance)
+    return estimate, max(0.0, estimate - margin), min(1.0, estimate + margin)
+
+
+def estimate_accuracy(calculation_results: Dict[str, Any], expected_results: Dict[str, Any],
+                      values_match: Callable[[Any, Any], bool], threshold: float,
+                      sampling: AccuracySampling, group_key: Optional[str] = None,
+                      on_key: Optional[Callable[[str, Any, Any, bool], None]] = None) -> Optional[AccuracyEstimate]:
+    """
+    층화 표본으로 정답 일치율 추정
+
+    Args:
+        calculation_results: LLM 계산 결과
+        expected_results: MongoDB 직접 실행 결과
+        values_match: 값 일치 판정 함수 (평가기의 _values_match)
+        threshold: accuracy 임계값 (조기 종료 판정 기준)
+        sampling: 추정 설정
+        group_key: 큰 문서 리스트를 조인할 그룹 키 (선택적)
+        on_key: 표본으로 비교한 키마다 (키, 계산 값, 기대 값, 일치 여부) 호출 (비교 원본 쌍 수집용).
+            원소 단위로 추출한 리스트 키는 추정이 끝난 뒤 한 번 호출되며, 추출한 원소가 모두 일치하면 일치
+
+    Returns:
+        AccuracyEstimate, 비교 단위 수가 min_population 미만이면 None (정확 비교 사용)
+    """
+    strata = _build_strata(calculation_results, expected_results, values_match, group_key,
+                           sampling.min_split, on_key)
+    population = sum(stratum.size for stratum in strata)
+    if population < sampling.min_population:
+        return None
+
+    from statistics import NormalDist
+
+    rng = random.Random(sampling.seed)
+    limit = min(sampling.max_samples, population)
+    for stratum in strata:
+        # 층별 추출 순서는 처음에 고정 (최대 표본 수까지만) - 조기 종료 시점과 무관하게 같은 순서
+        stratum.order = rng.sample(range(stratum.size), min(stratum.size, limit))
+
+    z = NormalDist().inv_cdf(0.5 + sampling.confidence / 2)
+    sampled = 0
+    decided = None
+    while True:
+        budget = min(sampling.batch_size, limit - sampled)
+        if budget <= 0:
+            break
+        allocation = _allocate(strata, budget)
+        drawn = sum(allocation)
+        if drawn == 0:
+            break
+        for stratum, count in zip(strata, allocation):
+            if count:
+                stratum.draw(count)
+        sampled += drawn
+        if sampled >= sampling.min_samples:
+            _, lower, upper = _interval(strata, z)
+            if lower >= threshold:
+                decided = True
+                break
+            if upper < threshold:
+                decided = False
+                break
+
+    if on_key is not None:
+        for stratum in strata:
+            if stratum.key is not None and stratum.taken:
+                on_key(stratum.key, calculation_results[stratum.key], expected_results[stratum.key],
+                       stratum.matches == stratum.taken)
+
+    estimate, lower, upper = _interval(strata, z)
+    if decided is None and sampled >= population:
+        decided = estimate >= threshold
+    return AccuracyEstimate(estimate=estimate, lower=lower, upper=upper, confidence=sampling.confidence,
+                            sampled=sampled, population=population, strata=len(strata), decided=decided)
@@ -0,0 +1,522 @@
+"""
+로컬 평가 서버 (요청 마이크로 배치)
+
+여러 서비스가 각자 프로세스 안에서 quick_evaluate()를 호출하면 pandas import와
+초기화 비용을 서비스마다 따로 치릅니다. 이 모듈은 로컬 HTTP 또는 Unix 소켓에서 오래 실행되는
+평가 서버와 클라이언트를 제공합니다.
+- 동시에 들어온 요청을 최대 대기 시간(max_wait)과 최대 배치 크기(max_batch_size)로 묶어
+  평가 스레드 하나가 배치 단위로 꺼내 처리 (레코드 평가는 레코드별로 수행하며, 배치는 스레드
+  깨우기/잠금/통계 갱신 비용만 나눠 가짐)
+- 요청마다 해당 레코드의 EvaluationMetrics를 JSON으로 반환 (지표, 비교 원본 쌍, latency_slo 설정 시 지연 시간 스케치)
+- 대기열 상한(max_queue)을 넘으면 503, 제한 시간(request_timeout) 안에 평가되지 않으면 504 응답
+- 잘못된 요청 (Content-Length, UTF-8, JSON, 레코드 형식 오류)은 400 응답
+- GET /stats: 처리량, 대기열 깊이, 배치 크기, 대기/처리 시간 분위수
+
+    python -m mongodb_evaluation_system serve --unix /tmp/mongodb-evaluation.sock
+
+    client = EvaluationClient("unix:///tmp/mongodb-evaluation.sock")
+    metrics = client.evaluate(analysis_result)
+
+요청 본문은 명령행 스트리밍 평가의 JSONL 레코드 한 줄과 같은 JSON 객체입니다.
+"""
+
+import concurrent.futures
+import http.client
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional, Tuple
+
+from .core import ComparisonRows, EvaluationMetrics, UniversalAnalysisResult, UniversalMongoDBEvaluator
+from .latency import LatencySketch, LatencyStats
+from .streaming import RecordError, parse_record
+from .sampling import AccuracyEstimate
+
+
+class ServerBusy(RuntimeError):
+    """평가 대기열이 가득 참"""
+
+
+class EvaluationServerError(RuntimeError):
+    """서버가 오류 응답을 반환함"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+# ---------------------------------------------------------------------- 직렬화
+
+def metrics_to_dict(metrics: EvaluationMetrics) -> Dict[str, Any]:
+    """EvaluationMetrics → JSON 응답 (비교 테이블 대신 비교 원본 쌍 포함)"""
+    rows = metrics.comparison_rows
+    return {
+        "semantic_error_rate": metrics.semantic_error_rate,
+        "execution_success_rate": metrics.execution_success_rate,
+        "empty_result_rate": metrics.empty_result_rate,
+        "accuracy_rate": metrics.accuracy_rate,
+        "overall_pass": bool(metrics.overall_pass),
+        "comparison_rows": None if rows is None else [
+            [key, llm_value, mongodb_value, status]
+            for key, llm_value, mongodb_value, status
+            in zip(rows.keys, rows.llm_values, rows.mongodb_values, rows.statuses)
+        ],
+        "latency": None if metrics.latency is None else metrics.latency.to_dict(),
+        "custom_metrics": metrics.custom_metrics,
+        "accuracy_estimate": (None if metrics.accuracy_estimate is None
+                              else metrics.accuracy_estimate.to_dict()),
+    }
+
+
+def metrics_from_dict(data: Dict[str, Any]) -> EvaluationMetrics:
+    """JSON 응답 → EvaluationMetrics (비교 테이블은 접근 시 기본 평가기 포맷으로 생성)"""
+    comparison_rows = None
+    if data.get("comparison_rows") is not None:
+        comparison_rows = ComparisonRows(None)
+        for key, llm_value, mongodb_value, status in data["comparison_rows"]:
+            comparison_rows.append(key, llm_value, mongodb_value, status)
+    latency = data.get("latency")
+    return EvaluationMetrics(
+        semantic_error_rate=data["semantic_error_rate"],
+        execution_success_rate=data["execution_success_rate"],
+        empty_result_rate=data["empty_result_rate"],
+        accuracy_rate=data["accuracy_rate"],
+        overall_pass=data["overall_pass"],
+        comparison_rows=comparison_rows,
+        latency=None if latency is None else LatencyStats.from_dict(latency),
+        custom_metrics=data.get("custom_metrics"),
+        accuracy_estimate=(None if data.get("accuracy_estimate") is None
+                           else AccuracyEstimate.from_dict(data["accuracy_estimate"])),
+    )
+
+
+def record_to_dict(analysis_result: UniversalAnalysisResult,
+                   ground_truth: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """분석 결과 → 요청 본문 (streaming.parse_record() 입력 형식)"""
+    payload = {
+        "analysis_query": analysis_result.analysis_query,
+        "mongodb_queries": analysis_result.mongodb_queries,
+        "calculation_results": analysis_result.calculation_results,
+        "execution_logs": analysis_result.execution_logs,
+        "direct_mongodb_results": analysis_result.direct_mongodb_results,
+        "timestamp": analysis_result.timestamp,
+    }
+    if ground_truth is not None:
+        payload["ground_truth"] = ground_truth
+    return payload
+
+
+# ---------------------------------------------------------------------- 마이크로 배치
+
+class MicroBatcher:
+    """
+    요청 마이크로 배치 평가기
+
+    submit()으로 들어온 레코드를 대기열에 넣고, 평가 스레드가 첫 레코드 도착 후
+    max_wait초가 지나거나 max_batch_size개가 모이면 배치를 꺼내 레코드별로 평가합니다.
+    배치로 줄어드는 것은 요청마다 평가 스레드를 깨우고 잠금과 통계를 갱신하는 비용이며,
+    레코드 평가 자체는 evaluate()를 그대로 호출합니다. 레코드별 평가 오류는 해당 요청에만 전달됩니다.
+
+    Args:
+        evaluator: 평가기 (기본 설정 평가기)
+        max_batch_size: 배치 최대 레코드 수
+        max_wait: 첫 레코드 도착 후 배치를 마감하기까지 최대 대기 시간 (초)
+        max_queue: 대기열 상한 (초과 시 ServerBusy)
+    """
+
+    def __init__(self, evaluator: Optional[UniversalMongoDBEvaluator] = None,
+                 max_batch_size: int = 32, max_wait: float = 0.005, max_queue: int = 1024):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size는 1 이상이어야 합니다: {max_batch_size}")
+        if max_wait < 0:
+            raise ValueError(f"max_wait는 0 이상이어야 합니다: {max_wait}")
+        if max_queue < 1:
+            raise ValueError(f"max_queue는 1 이상이어야 합니다: {max_queue}")
+        self.evaluator = evaluator or UniversalMongoDBEvaluator()
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+
+        # (분석 결과, 정답 데이터, Future, 도착 시각)
+        self._queue: deque = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self._started_at = time.monotonic()
+        self._submitted = 0
+        self._rejected = 0
+        self._evaluated = 0
+        self._errors = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._batch_sizes = LatencySketch()    # 배치 크기 분포 (분위수 스케치 재사용)
+        self._wait_seconds = LatencySketch()   # 도착 → 배치 시작
+        self._batch_seconds = LatencySketch()  # 배치 평가 시간
+        self._recent: deque = deque()          # 최근 처리 (시각, 레코드 수) - 최근 처리량 계산
+
+        self._thread = threading.Thread(target=self._run, name="mongodb-evaluation-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, analysis_result: UniversalAnalysisResult,
+               ground_truth: Optional[Dict[str, Any]] = None) -> Future:
+        """레코드를 대기열에 추가하고 EvaluationMetrics를 받을 Future 반환"""
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("이미 종료된 평가 서버입니다")
+            if len(self._queue) >= self.max_queue:
+                self._rejected += 1
+                raise ServerBusy(f"평가 대기열이 가득 찼습니다 (max_queue={self.max_queue})")
+            self._queue.append((analysis_result, ground_truth, future, time.monotonic()))
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            self._condition.notify()
+        return future
+
+    def evaluate(self, analysis_result: UniversalAnalysisResult,
+                 ground_truth: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None) -> EvaluationMetrics:
+        """submit() 후 결과를 기다림"""
+        return self.submit(analysis_result, ground_truth).result(timeout)
+
+    def _next_batch(self) -> List[Tuple[UniversalAnalysisResult, Optional[Dict[str, Any]], Future, float]]:
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if not self._queue:
+                return []
+            deadline = self._queue[0][3] + self.max_wait
+            while len(self._queue) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            size = min(len(self._queue), self.max_batch_size)
+            return [self._queue.popleft() for _ in range(size)]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._evaluate_batch(batch)
+
+    def _evaluate_batch(self, batch) -> None:
+        started = time.monotonic()
+        evaluator = self.evaluator
+        errors = 0
+        for analysis_result, ground_truth, future, _ in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(evaluator.evaluate(analysis_result, ground_truth))
+            except Exception as e:
+                errors += 1
+                future.set_exception(e)
+        finished = time.monotonic()
+
+        with self._condition:
+            self._batches += 1
+            self._evaluated += len(batch)
+            self._errors += errors
+            self._batch_sizes.add(len(batch))
+            self._batch_seconds.add(finished - started)
+            for _, _, _, arrived in batch:
+                self._wait_seconds.add(max(0.0, started - arrived))
+            self._recent.append((finished, len(batch)))
+            while self._recent and self._recent[0][0] < finished - 60:
+                self._recent.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        """처리량, 대기열 깊이, 배치 크기, 대기/처리 시간 분위수"""
+        with self._condition:
+            now = time.monotonic()
+            uptime = now - self._started_at
+            recent = sum(count for finished, count in self._recent if finished >= now - 60)
+            return {
+                "uptime_seconds": uptime,
+                "submitted": self._submitted,
+                "evaluated": self._evaluated,
+                "errors": self._errors,
+                "rejected": self._rejected,
+                "batches": self._batches,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_queue_depth,
+                "throughput_per_second": self._evaluated / uptime if uptime > 0 else 0.0,
+                "recent_throughput_per_second": recent / min(60.0, uptime) if uptime > 0 else 0.0,
+                "mean_batch_size": self._evaluated / self._batches if self._batches else None,
+                "batch_size": self._batch_sizes.quantiles(),
+                "wait_seconds": self._wait_seconds.quantiles(),
+                "batch_seconds": self._batch_seconds.quantiles(),
+                "max_batch_size": self.max_batch_size,
+                "max_wait_seconds": self.max_wait,
+            }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """새 요청을 거부하고 대기열에 남은 레코드를 처리한 뒤 평가 스레드 종료"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+
+# ---------------------------------------------------------------------- HTTP 서버
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MongoDBEvaluationServer"
+    disable_nagle_algorithm = True   # 헤더와 본문을 나눠 쓰는 유지 연결의 지연 ACK 대기 방지
+
+    def address_string(self) -> str:
+        # Unix 소켓 연결은 client_address가 빈 문자열
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send_json(200, self.server.batcher.stats())
+        elif self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"알 수 없는 경로입니다: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/evaluate":
+            self._send_json(404, {"error": f"알 수 없는 경로입니다: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.close_connection = True   # 본문 길이를 알 수 없으므로 연결 재사용 불가
+            self._send_json(400, {"error": f"잘못된 Content-Length입니다: {self.headers.get('Content-Length')}"})
+            return
+        if length < 0:
+            self.close_connection = True
+            self._send_json(400, {"error": f"잘못된 Content-Length입니다: {length}"})
+            return
+        try:
+            body = self.rfile.read(length).decode("utf-8")
+            analysis_result, ground_truth = parse_record(body)
+        except UnicodeDecodeError as e:
+            self._send_json(400, {"error": f"요청 본문이 UTF-8이 아닙니다: {e}"})
+            return
+        except RecordError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            future = self.server.batcher.submit(analysis_result, ground_truth)
+        except ServerBusy as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        try:
+            metrics = future.result(self.server.request_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()   # 아직 배치에 들어가지 않았으면 평가하지 않음
+            self._send_json(504, {"error": f"평가 제한 시간을 초과했습니다 ({self.server.request_timeout}초)"})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send_json(200, metrics_to_dict(metrics))
+
+
+class _UnixHandler(_Handler):
+    disable_nagle_algorithm = False   # Unix 소켓에는 TCP_NODELAY 옵션이 없음
+
+
+class _ServerMixin:
+    daemon_threads = True
+    request_queue_size = 128   # listen 대기열 (기본 5면 동시 연결이 몰릴 때 Unix 소켓 connect가 EAGAIN)
+    batcher: MicroBatcher
+    verbose: bool
+    request_timeout: Optional[float]
+
+
+def _remove_stale_socket(path: str) -> None:
+    """이전 실행이 남긴 소켓 파일 삭제 (소켓이 아닌 파일은 지우지 않고 오류)"""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"Unix 소켓 경로에 소켓이 아닌 파일이 있습니다: {path}")
+    os.unlink(path)
+
+
+class _TcpServer(_ServerMixin, ThreadingHTTPServer):
+    pass
+
+
+class _UnixServer(_ServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    def server_bind(self) -> None:
+        _remove_stale_socket(self.server_address)
+        super().server_bind()
+
+
+class EvaluationServer:
+    """
+    마이크로 배치 평가 HTTP 서버
+
+    Args:
+        batcher: 마이크로 배치 평가기 (기본 설정 평가기로 생성)
+        host, port: TCP 주소 (unix_path가 없을 때, port 0이면 임의 포트)
+        unix_path: Unix 소켓 경로 (지정 시 TCP 대신 사용, 소켓이 아닌 파일이 있으면 FileExistsError)
+        verbose: 요청 로그를 stderr에 기록
+        request_timeout: 요청 하나의 평가 대기 제한 시간 (초, 초과 시 504, None이면 무제한)
+    """
+
+    def __init__(self, batcher: Optional[MicroBatcher] = None, host: str = "127.0.0.1",
+                 port: int = 8765, unix_path: Optional[str] = None, verbose: bool = False,
+                 request_timeout: Optional[float] = 30.0):
+        if request_timeout is not None and request_timeout <= 0:
+            raise ValueError(f"request_timeout은 0보다 커야 합니다: {request_timeout}")
+        self.unix_path = unix_path
+        if unix_path:
+            self._server = _UnixServer(unix_path, _UnixHandler)
+        else:
+            self._server = _TcpServer((host, port), _Handler)
+        self.batcher = batcher or MicroBatcher()   # 바인드 실패 시 평가 스레드를 만들지 않음
+        self._server.batcher = self.batcher
+        self._server.verbose = verbose
+        self._server.request_timeout = request_timeout
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """EvaluationClient에 전달할 주소"""
+        if self.unix_path:
+            return f"unix://{self.unix_path}"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "EvaluationServer":
+        """백그라운드 스레드에서 요청 처리 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mongodb-evaluation-server",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """요청 수신 중지, 남은 배치 처리 후 종료"""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self.batcher.close()
+        if self.unix_path:
+            # 실행 중 경로가 다른 파일로 바뀌었으면 그대로 둠
+            try:
+                if stat.S_ISSOCK(os.lstat(self.unix_path).st_mode):
+                    os.unlink(self.unix_path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "EvaluationServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------- 클라이언트
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class EvaluationClient:
+    """
+    로컬 평가 서버 클라이언트 (스레드별 연결 유지)
+
+    Args:
+        address: "http://127.0.0.1:8765" 또는 "unix:///tmp/mongodb-evaluation.sock"
+        timeout: 요청 제한 시간 (초)
+    """
+
+    def __init__(self, address: str = "http://127.0.0.1:8765", timeout: Optional[float] = 30.0):
+        self.address = address
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self.address.startswith("unix://"):
+                connection = _UnixConnection(self.address[len("unix://"):], timeout=self.timeout)
+            else:
+                hostport = self.address.split("://", 1)[-1].rstrip("/")
+                connection = http.client.HTTPConnection(hostport, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        body = None if payload is None else json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = json.loads(response.read().decode("utf-8"))
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # 서버가 유지 연결을 닫은 경우 한 번 재연결
+                connection.close()
+                self._local.connection = None
+                if attempt:
+                    raise
+        if response.status != 200:
+            raise EvaluationServerError(response.status, data.get("error", ""))
+        return data
+
+    def evaluate(self, analysis_result: UniversalAnalysisResult,
+                 ground_truth: Optional[Dict[str, Any]] = None) -> EvaluationMetrics:
+        """서버에서 평가한 EvaluationMetrics 반환 (대기열이 가득 차면 EvaluationServerError 503)"""
+        return metrics_from_dict(self._request("POST", "/evaluate", record_to_dict(analysis_result, ground_truth)))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._request("GET", "/stats")
+
+    def health(self) -> bool:
+        try:
+            return self._request("GET", "/health").get("status") == "ok"
+        except (OSError, EvaluationServerError):
+            return False
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,308 @@
+"""
+MongoDB 셸 문법 파서
+
+LLM이 생성한 `db.<컬렉션>.<메서드>(...)` 형태의 쿼리 문자열을 파이썬 값으로 변환합니다.
+JSON보다 느슨한 셸 문법을 허용합니다.
+- 따옴표 없는 키 ({$group: {_id: "$status"}}), 작은따옴표 문자열, 후행 쉼표
+- 정규식 리터럴 (/운영자/i → {"$regex": "운영자", "$options": "i"})
+- ObjectId("..."), ISODate("..."), new Date("..."), NumberInt/NumberLong/NumberDecimal(...)
+- 인자 없는 Date()/ISODate()는 현재 시각 대신 SHELL_NOW 표식 (실행 시 resolve_now()로 변환)
+  파싱 결과는 입력 문자열만으로 결정되므로 캐시해도 시각이 고정되지 않습니다.
+- 체이닝 메서드 (.sort({...}).limit(10).count())
+- // 및 /* */ 주석
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Tuple, Optional
+
+
+class ShellSyntaxError(ValueError):
+    """셸 쿼리 문법 오류"""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} (위치 {position})")
+        self.position = position
+
+
+@dataclass
+class ShellQuery:
+    """파싱된 셸 쿼리"""
+    collection: str                                      # 컬렉션 이름
+    method: str                                          # find, aggregate, countDocuments ...
+    args: List[Any] = field(default_factory=list)        # 메서드 인자
+    chain: List[Tuple[str, List[Any]]] = field(default_factory=list)  # 체이닝 메서드와 인자
+    duplicate_keys: List[str] = field(default_factory=list)  # 한 객체에서 중복된 키 경로 (예: "0.0.$group._id")
+
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\](),:.])
+""", re.VERBOSE | re.DOTALL)
+
+_REGEX_LITERAL = re.compile(r"/((?:[^/\\\n]|\\.)+)/([a-z]*)")
+
+_ESCAPE = re.compile(r"\\(?:u([0-9a-fA-F]{4})|(.))", re.DOTALL)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "0": "\0"}
+
+_CONSTANTS = {"true": True, "false": False, "null": None, "undefined": None}
+
+_NUMBER_WRAPPERS = {"NumberInt", "NumberLong", "NumberDecimal", "Int32", "Long", "Decimal128", "Double"}
+
+
+class ShellNow:
+    """인자 없는 Date()/ISODate() - 실행 시점의 현재 시각을 뜻하는 표식 (SHELL_NOW 하나만 사용)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "SHELL_NOW"
+
+    def __reduce__(self) -> str:
+        # 직렬화 후에도 같은 객체 (is 비교 유지)
+        return "SHELL_NOW"
+
+
+SHELL_NOW = ShellNow()
+
+
+def resolve_now(value: Any, now: Optional[datetime] = None) -> Any:
+    """
+    SHELL_NOW 표식을 현재 시각으로 바꾼 값 (표식이 없으면 원래 객체를 그대로 반환)
+
+    ShellQuery, 딕셔너리, 리스트를 순회하며 한 번의 호출 안에서는 같은 시각을 사용합니다.
+    """
+    if now is None:
+        now = datetime.now()
+    if value is SHELL_NOW:
+        return now
+    if isinstance(value, ShellQuery):
+        args = resolve_now(value.args, now)
+        chain = [(name, resolve_now(chain_args, now)) for name, chain_args in value.chain]
+        if args is value.args and all(new is old for (_, new), (_, old) in zip(chain, value.chain)):
+            return value
+        return ShellQuery(value.collection, value.method, args, chain, list(value.duplicate_keys))
+    if isinstance(value, dict):
+        items = {key: resolve_now(item, now) for key, item in value.items()}
+        return value if all(items[key] is item for key, item in value.items()) else items
+    if isinstance(value, list):
+        items = [resolve_now(item, now) for item in value]
+        return value if all(new is old for new, old in zip(items, value)) else items
+    return value
+
+
+def _replace_escape(match: re.Match) -> str:
+    if match.group(1):
+        return chr(int(match.group(1), 16))
+    return _ESCAPES.get(match.group(2), match.group(2))
+
+
+def _unescape(body: str) -> str:
+    if "\\" not in body:
+        return body
+    return _ESCAPE.sub(_replace_escape, body)
+
+
+def _parse_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+
+
+class _Parser:
+    """재귀 하강 파서 (토큰은 필요할 때 하나씩 읽음)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.position = 0
+        self.token: Optional[Tuple[str, str, int]] = None
+        self.duplicate_keys: List[str] = []
+        self._advance(expect_value=True)
+
+    def _advance(self, expect_value: bool = False) -> None:
+        text = self.text
+        while True:
+            if self.position >= len(text):
+                self.token = ("end", "", self.position)
+                return
+            # 값 위치의 '/'는 정규식 리터럴
+            if expect_value and text[self.position] == "/" and text[self.position:self.position + 2] not in ("//", "/*"):
+                match = _REGEX_LITERAL.match(text, self.position)
+                if match is None:
+                    raise ShellSyntaxError("닫히지 않은 정규식 리터럴", self.position)
+                self.token = ("regex", match.group(0), self.position)
+                self.position = match.end()
+                return
+            match = _TOKEN.match(text, self.position)
+            if match is None:
+                raise ShellSyntaxError(f"알 수 없는 문자 {text[self.position]!r}", self.position)
+            start = self.position
+            self.position = match.end()
+            if match.lastgroup != "space":
+                self.token = (match.lastgroup, match.group(0), start)
+                return
+
+    def _expect(self, value: str, expect_value: bool = False) -> None:
+        kind, text, position = self.token
+        if text != value or kind not in ("punct", "name"):
+            raise ShellSyntaxError(f"'{value}'가 필요하지만 {text or '입력 끝'!r}을(를) 만났습니다", position)
+        self._advance(expect_value=expect_value)
+
+    def _at(self, value: str) -> bool:
+        return self.token[0] == "punct" and self.token[1] == value
+
+    def value(self, path: str = "") -> Any:
+        kind, text, position = self.token
+        if kind == "punct" and text == "{":
+            return self._object(path)
+        if kind == "punct" and text == "[":
+            return self._array(path)
+        if kind == "string":
+            self._advance()
+            return _unescape(text[1:-1])
+        if kind == "number":
+            self._advance()
+            if re.fullmatch(r"-?\d+", text):
+                return int(text)
+            return float(text)
+        if kind == "regex":
+            self._advance()
+            match = _REGEX_LITERAL.fullmatch(text)
+            regex = {"$regex": match.group(1)}
+            if match.group(2):
+                regex["$options"] = match.group(2)
+            return regex
+        if kind == "name":
+            return self._name_value(text, position)
+        raise ShellSyntaxError(f"값이 필요하지만 {text or '입력 끝'!r}을(를) 만났습니다", position)
+
+    def _name_value(self, name: str, position: int) -> Any:
+        self._advance()
+        if name in _CONSTANTS:
+            return _CONSTANTS[name]
+        if name == "new":
+            name = self.token[1]
+            self._advance()
+        if not self._at("("):
+            raise ShellSyntaxError(f"알 수 없는 식별자 {name!r}", position)
+        args = self.arguments()
+        argument = args[0] if args else None
+        if name in _NUMBER_WRAPPERS:
+            return float(argument) if name in ("NumberDecimal", "Decimal128", "Double") else int(argument)
+        if name in ("ISODate", "Date"):
+            return _parse_date(argument) if args else SHELL_NOW
+        if name == "ObjectId":
+            return argument
+        raise ShellSyntaxError(f"지원하지 않는 생성자 {name!r}", position)
+
+    def _key(self) -> str:
+        kind, text, position = self.token
+        if kind == "string":
+            key = _unescape(text[1:-1])
+        elif kind in ("name", "number"):
+            key = text
+        else:
+            raise ShellSyntaxError(f"키가 필요하지만 {text or '입력 끝'!r}을(를) 만났습니다", position)
+        self._advance()
+        return key
+
+    def _object(self, path: str) -> dict:
+        self._expect("{")
+        result = {}
+        while not self._at("}"):
+            key = self._key()
+            key_path = f"{path}.{key}" if path else key
+            if key in result:
+                # 셸은 마지막 값을 사용하지만 의미 검사를 위해 기록
+                self.duplicate_keys.append(key_path)
+            self._expect(":", expect_value=True)
+            result[key] = self.value(key_path)
+            if not self._at(","):
+                break
+            self._advance()
+        self._expect("}")
+        return result
+
+    def _array(self, path: str) -> list:
+        self._expect("[", expect_value=True)
+        result = []
+        while not self._at("]"):
+            result.append(self.value(f"{path}.{len(result)}" if path else str(len(result))))
+            if not self._at(","):
+                break
+            self._advance(expect_value=True)
+        self._expect("]")
+        return result
+
+    def arguments(self, path: Optional[str] = None) -> List[Any]:
+        self._expect("(", expect_value=True)
+        args = []
+        while not self._at(")"):
+            args.append(self.value(str(len(args)) if path is None else f"{path}.{len(args)}"))
+            if not self._at(","):
+                break
+            self._advance(expect_value=True)
+        self._expect(")")
+        return args
+
+    def _name(self) -> str:
+        kind, text, position = self.token
+        if kind != "name":
+            raise ShellSyntaxError(f"이름이 필요하지만 {text or '입력 끝'!r}을(를) 만났습니다", position)
+        self._advance()
+        return text
+
+    def query(self) -> ShellQuery:
+        if self._name() != "db":
+            raise ShellSyntaxError("쿼리는 'db.'로 시작해야 합니다", 0)
+        self._expect(".")
+
+        # db.getCollection("name") 또는 db.<이름>[.<이름>...].<메서드>(
+        names = [self._name()]
+        if names[0] == "getCollection" and self._at("("):
+            args = self.arguments("getCollection")
+            if not args or not isinstance(args[0], str):
+                raise ShellSyntaxError("getCollection에는 컬렉션 이름이 필요합니다", self.token[2])
+            collection = args[0]
+            self._expect(".")
+            method = self._name()
+        else:
+            while self._at("."):
+                self._advance()
+                names.append(self._name())
+            if len(names) < 2:
+                raise ShellSyntaxError("컬렉션 메서드 호출이 필요합니다", self.token[2])
+            collection, method = ".".join(names[:-1]), names[-1]
+
+        query = ShellQuery(collection=collection, method=method, args=self.arguments())
+        while self._at("."):
+            self._advance()
+            name = self._name()
+            query.chain.append((name, self.arguments(name)))
+
+        if self.token[0] != "end":
+            raise ShellSyntaxError(f"쿼리 뒤에 예상하지 못한 {self.token[1]!r}", self.token[2])
+        query.duplicate_keys = self.duplicate_keys
+        return query
+
+
+def parse_shell_value(text: str) -> Any:
+    """셸 문법 값(객체, 배열, 스칼라) 파싱"""
+    parser = _Parser(text)
+    value = parser.value()
+    if parser.token[0] != "end":
+        raise ShellSyntaxError(f"값 뒤에 예상하지 못한 {parser.token[1]!r}", parser.token[2])
+    return value
+
+
+def parse_shell_query(text: str) -> ShellQuery:
+    """`db.<컬렉션>.<메서드>(...)[.<메서드>(...)]*` 쿼리 파싱"""
+    return _Parser(text.strip().rstrip(";")).query()
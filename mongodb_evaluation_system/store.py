@@ -0,0 +1,351 @@
+"""
+대량 평가 결과 저장소
+
+수백만 건의 EvaluationMetrics를 객체로 보관하지 않고 NumPy 구조화 배열 한 개에 저장합니다.
+- 실행당 1행: run_id, 분석 질의 코드, 타임스탬프, 4개 지표, Pass 여부 (53바이트)
+- 분석 질의는 사전 인코딩하여 코드만 저장
+- 비교 원본 쌍은 별도 컬럼 저장소(실행별 오프셋, 지표 이름 코드, 상태 코드, 값)에 보관
+- 필터링, 분석 질의별 집계는 배열 연산으로 처리하고 pandas 변환은 요청 시에만 수행
+"""
+
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Iterable, Sequence
+
+import numpy as np
+
+from .core import ComparisonRows, EvaluationMetrics, UniversalAnalysisResult
+
+
+METRIC_COLUMNS = ("semantic_error_rate", "execution_success_rate", "empty_result_rate", "accuracy_rate")
+
+RESULTS_DTYPE = np.dtype([
+    ("run_id", np.int64),
+    ("query_id", np.int32),                  # 분석 질의 사전 코드 (-1: 없음)
+    ("timestamp", "datetime64[us]"),         # UTC 기준 (파싱 불가 시 NaT)
+    ("semantic_error_rate", np.float64),
+    ("execution_success_rate", np.float64),
+    ("empty_result_rate", np.float64),
+    ("accuracy_rate", np.float64),
+    ("overall_pass", np.bool_),
+])
+
+_NAT = np.datetime64("NaT", "us")
+
+
+def _to_datetime64(timestamp: Any) -> np.datetime64:
+    if timestamp is None:
+        return _NAT
+    if isinstance(timestamp, np.datetime64):
+        return timestamp.astype("datetime64[us]")
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return _NAT
+    if isinstance(timestamp, (int, float)):
+        timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(timestamp, "us")
+    return _NAT
+
+
+class _Dictionary:
+    """문자열 사전 인코딩"""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def copy(self) -> "_Dictionary":
+        copied = _Dictionary()
+        copied.values = list(self.values)
+        copied.codes = dict(self.codes)
+        return copied
+
+
+class ResultsStore:
+    """
+    EvaluationMetrics 컬럼형 저장소
+
+    Args:
+        capacity: 초기 행 용량 (초과 시 두 배로 증가)
+        keep_comparisons: False이면 비교 원본 쌍을 저장하지 않음 (지표만 보관)
+    """
+
+    def __init__(self, capacity: int = 1024, keep_comparisons: bool = True):
+        self._data = np.zeros(max(capacity, 1), dtype=RESULTS_DTYPE)
+        self._size = 0
+        self._queries = _Dictionary()
+        self.keep_comparisons = keep_comparisons
+
+        # 비교 원본 쌍 컬럼 저장소 - 실행 i의 쌍은 [offsets[i], offsets[i + 1]) 구간
+        self._offsets = array("q", [0])
+        self._has_comparison = array("b")
+        self._keys = _Dictionary()
+        self._key_codes = array("i")
+        self._statuses = array("b")
+        self._llm_values: List[Any] = []
+        self._mongodb_values: List[Any] = []
+
+    # ------------------------------------------------------------------ 추가
+
+    def _reserve(self, n: int) -> None:
+        required = self._size + n
+        if required <= len(self._data):
+            return
+        capacity = len(self._data)
+        while capacity < required:
+            capacity *= 2
+        grown = np.zeros(capacity, dtype=RESULTS_DTYPE)
+        grown[:self._size] = self._data[:self._size]
+        self._data = grown
+
+    def append(self, metrics: EvaluationMetrics,
+               analysis_result: Optional[UniversalAnalysisResult] = None,
+               run_id: Optional[int] = None, timestamp: Any = None) -> int:
+        """
+        평가 결과 하나 추가
+
+        Args:
+            metrics: 평가 결과
+            analysis_result: 분석 질의와 타임스탬프를 가져올 분석 결과 (선택적)
+            run_id: 실행 ID (기본: 저장 순번)
+            timestamp: 타임스탬프 (기본: analysis_result.timestamp)
+
+        Returns:
+            int: 저장된 행 위치
+        """
+        self._reserve(1)
+        index = self._size
+        if timestamp is None and analysis_result is not None:
+            timestamp = analysis_result.timestamp
+        self._data[index] = (
+            index if run_id is None else run_id,
+            -1 if analysis_result is None else self._queries.encode(analysis_result.analysis_query),
+            _to_datetime64(timestamp),
+            metrics.semantic_error_rate,
+            metrics.execution_success_rate,
+            metrics.empty_result_rate,
+            metrics.accuracy_rate,
+            bool(metrics.overall_pass),
+        )
+        self._size += 1
+
+        rows = metrics.comparison_rows if self.keep_comparisons else None
+        self._has_comparison.append(rows is not None)
+        if rows is not None:
+            self._key_codes.extend(self._keys.encode(key) for key in rows.keys)
+            self._statuses.extend(rows.statuses)
+            self._llm_values.extend(rows.llm_values)
+            self._mongodb_values.extend(rows.mongodb_values)
+        self._offsets.append(len(self._key_codes))
+        return index
+
+    def extend(self, metrics: Iterable[EvaluationMetrics],
+               analysis_results: Optional[Iterable[UniversalAnalysisResult]] = None) -> None:
+        """평가 결과 여러 개 추가 (analysis_results는 같은 순서)"""
+        if analysis_results is None:
+            for item in metrics:
+                self.append(item)
+        else:
+            for item, analysis_result in zip(metrics, analysis_results):
+                self.append(item, analysis_result)
+
+    @classmethod
+    def from_batch(cls, metrics_frame, results: Optional[Sequence[UniversalAnalysisResult]] = None,
+                   run_ids: Optional[Sequence[int]] = None) -> "ResultsStore":
+        """evaluate_batch() 결과 DataFrame으로 생성 (비교 원본 쌍 없음)"""
+        n = len(metrics_frame)
+        store = cls(capacity=n, keep_comparisons=False)
+        data = store._data
+        data["run_id"][:n] = np.arange(n) if run_ids is None else np.asarray(run_ids)
+        data["query_id"][:n] = -1
+        data["timestamp"][:n] = _NAT
+        if results is not None:
+            data["query_id"][:n] = [store._queries.encode(result.analysis_query) for result in results]
+            data["timestamp"][:n] = [_to_datetime64(result.timestamp) for result in results]
+        for column in METRIC_COLUMNS:
+            data[column][:n] = metrics_frame[column].to_numpy(dtype=np.float64)
+        data["overall_pass"][:n] = metrics_frame["overall_pass"].to_numpy(dtype=bool)
+        store._size = n
+        store._has_comparison = array("b", bytes(n))
+        store._offsets = array("q", bytes(8 * (n + 1)))
+        return store
+
+    # ------------------------------------------------------------------ 조회
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def records(self) -> np.ndarray:
+        """저장된 행 (구조화 배열 뷰 - 수정하면 저장소에 반영됨)"""
+        return self._data[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        return self._data[name][:self._size]
+
+    @property
+    def queries(self) -> List[str]:
+        """분석 질의 사전 (query_id → 분석 질의)"""
+        return self._queries.values
+
+    def query_of(self, index: int) -> Optional[str]:
+        code = int(self._data["query_id"][index])
+        return None if code < 0 else self._queries.values[code]
+
+    @property
+    def nbytes(self) -> int:
+        """지표 배열과 비교 코드 배열의 바이트 수 (값 객체 참조 제외)"""
+        return (self._data[:self._size].nbytes + self._offsets.itemsize * len(self._offsets)
+                + len(self._has_comparison) + self._key_codes.itemsize * len(self._key_codes)
+                + len(self._statuses))
+
+    def comparison_rows(self, index: int) -> Optional[ComparisonRows]:
+        """행 index의 비교 원본 쌍 복원"""
+        if not self._has_comparison[index]:
+            return None
+        start, end = self._offsets[index], self._offsets[index + 1]
+        rows = ComparisonRows(None)
+        key_names = self._keys.values
+        rows.keys = [key_names[code] for code in self._key_codes[start:end]]
+        rows.llm_values = self._llm_values[start:end]
+        rows.mongodb_values = self._mongodb_values[start:end]
+        rows.statuses = self._statuses[start:end]
+        return rows
+
+    def __getitem__(self, index: int) -> EvaluationMetrics:
+        """행 index를 EvaluationMetrics로 복원"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"저장소 범위를 벗어난 위치입니다: {index}")
+        row = self._data[index]
+        return EvaluationMetrics(
+            semantic_error_rate=float(row["semantic_error_rate"]),
+            execution_success_rate=float(row["execution_success_rate"]),
+            empty_result_rate=float(row["empty_result_rate"]),
+            accuracy_rate=float(row["accuracy_rate"]),
+            overall_pass=bool(row["overall_pass"]),
+            comparison_rows=self.comparison_rows(index),
+        )
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+
+    # ------------------------------------------------------------------ 필터링 / 집계
+
+    def mask(self, overall_pass: Optional[bool] = None, query: Optional[str] = None,
+             since: Any = None, until: Any = None) -> np.ndarray:
+        """조건 마스크 (지정한 조건의 AND, since 이상 until 미만)"""
+        selected = np.ones(self._size, dtype=bool)
+        if overall_pass is not None:
+            selected &= self.column("overall_pass") == overall_pass
+        if query is not None:
+            code = self._queries.codes.get(query)
+            if code is None:
+                selected[:] = False
+            else:
+                selected &= self.column("query_id") == code
+        if since is not None:
+            selected &= self.column("timestamp") >= _to_datetime64(since)
+        if until is not None:
+            selected &= self.column("timestamp") < _to_datetime64(until)
+        return selected
+
+    def select(self, mask: np.ndarray) -> "ResultsStore":
+        """마스크 또는 위치 배열로 선택한 행의 새 저장소"""
+        mask = np.asarray(mask)
+        positions = np.flatnonzero(mask) if mask.dtype == bool else mask.astype(np.int64)
+        subset = ResultsStore(capacity=len(positions), keep_comparisons=self.keep_comparisons)
+        subset._queries = self._queries.copy()
+        subset._keys = self._keys.copy()
+        subset._data[:len(positions)] = self._data[positions]
+        subset._size = len(positions)
+
+        # 선택한 행의 비교 쌍 구간을 이어 붙인 위치 배열
+        offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        starts, ends = offsets[positions], offsets[positions + 1]
+        lengths = ends - starts
+        pair_positions = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        pair_positions += np.arange(len(pair_positions))
+
+        subset._has_comparison = array("b", np.frombuffer(self._has_comparison, dtype=np.int8)[positions].tobytes())
+        subset._offsets = array("q", np.concatenate(([0], np.cumsum(lengths))).astype(np.int64).tobytes())
+        subset._key_codes = array("i", np.frombuffer(self._key_codes, dtype=np.int32)[pair_positions].tobytes())
+        subset._statuses = array("b", np.frombuffer(self._statuses, dtype=np.int8)[pair_positions].tobytes())
+        subset._llm_values = [self._llm_values[i] for i in pair_positions.tolist()]
+        subset._mongodb_values = [self._mongodb_values[i] for i in pair_positions.tolist()]
+        return subset
+
+    def failing(self) -> "ResultsStore":
+        """Fail 판정 실행만 선택"""
+        return self.select(~self.column("overall_pass"))
+
+    def group_by_query(self) -> Dict[str, np.ndarray]:
+        """
+        분석 질의별 집계
+
+        Returns:
+            Dict: 컬럼 이름 → 배열 (query, runs, failed, 4개 지표 평균) - 분석 질의 없는 행은 제외
+        """
+        codes = self.column("query_id")
+        known = codes >= 0
+        codes = codes[known]
+        n_groups = len(self._queries)
+        runs = np.bincount(codes, minlength=n_groups)
+        passed = self.column("overall_pass")[known]
+        groups = {
+            "query": np.array(self._queries.values, dtype=object),
+            "runs": runs,
+            "failed": np.bincount(codes, weights=~passed, minlength=n_groups).astype(np.int64),
+        }
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for column in METRIC_COLUMNS:
+                groups[column] = np.bincount(codes, weights=self.column(column)[known], minlength=n_groups) / runs
+        present = runs > 0
+        return {name: values[present] for name, values in groups.items()}
+
+    # ------------------------------------------------------------------ pandas 변환
+
+    def to_dataframe(self):
+        """실행당 1행 DataFrame (analysis_query는 범주형)"""
+        import pandas as pd
+
+        records = self.records
+        frame = pd.DataFrame({name: records[name] for name in RESULTS_DTYPE.names if name != "query_id"})
+        frame.insert(1, "analysis_query", pd.Categorical.from_codes(
+            records["query_id"], categories=pd.Index(self._queries.values, dtype=object)))
+        return frame
+
+    def comparison_frame(self):
+        """비교 원본 쌍 DataFrame (쌍당 1행: row, key, status, llm_value, mongodb_value)"""
+        import pandas as pd
+
+        # 버퍼 뷰를 남기면 이후 append()에서 array 크기를 바꿀 수 없으므로 복사
+        offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        row_index = np.repeat(np.arange(self._size), np.diff(offsets))
+        key_codes = np.frombuffer(self._key_codes, dtype=np.int32).copy()
+        return pd.DataFrame({
+            "row": row_index,
+            "key": pd.Categorical.from_codes(key_codes, categories=pd.Index(self._keys.values, dtype=object)),
+            "status": np.frombuffer(self._statuses, dtype=np.int8).copy(),
+            "llm_value": pd.Series(self._llm_values, dtype=object),
+            "mongodb_value": pd.Series(self._mongodb_values, dtype=object),
+        })
@@ -0,0 +1,160 @@
+"""
+스트리밍 JSONL 평가 파이프라인
+
+JSONL 파일(또는 stdin)에서 분석 결과를 한 줄씩 읽어 제너레이터로 평가하고,
+지표를 JSONL 또는 CSV 싱크에 한 줄씩 기록합니다. 입력 크기와 관계없이
+메모리 사용량이 일정하게 유지됩니다.
+
+입력 레코드 형식 (한 줄에 JSON 객체 하나):
+    {"analysis_query": "...", "mongodb_queries": [...], "calculation_results": {...},
+     "execution_logs": [...], "direct_mongodb_results": {...}, "timestamp": "...",
+     "ground_truth": {...}}
+"""
+
+import csv
+import json
+from typing import Dict, Iterable, Iterator, Any, Optional, TextIO, Tuple, TYPE_CHECKING
+
+from .core import UniversalAnalysisResult, UniversalMongoDBEvaluator
+
+if TYPE_CHECKING:
+    from .executor import AggregationExecutor
+    from .report import ReportWriter
+
+
+METRIC_FIELDS = [
+    "index",
+    "timestamp",
+    "semantic_error_rate",
+    "execution_success_rate",
+    "empty_result_rate",
+    "accuracy_rate",
+    "overall_pass",
+    "error",
+]
+
+
+class RecordError(ValueError):
+    """입력 레코드 파싱 실패"""
+
+
+def parse_record(line: str) -> Tuple[UniversalAnalysisResult, Optional[Dict[str, Any]]]:
+    """JSONL 한 줄을 (분석 결과, 정답 데이터)로 변환"""
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise RecordError(f"JSON 파싱 실패: {e}") from e
+    if not isinstance(payload, dict):
+        raise RecordError("레코드는 JSON 객체여야 합니다")
+    if "analysis_query" not in payload:
+        raise RecordError("analysis_query 필드가 없습니다")
+
+    analysis_result = UniversalAnalysisResult(
+        analysis_query=payload["analysis_query"],
+        mongodb_queries=payload.get("mongodb_queries") or [],
+        calculation_results=payload.get("calculation_results") or {},
+        execution_logs=payload.get("execution_logs") or [],
+        direct_mongodb_results=payload.get("direct_mongodb_results"),
+        timestamp=payload.get("timestamp"),
+    )
+    return analysis_result, payload.get("ground_truth")
+
+
+def read_records(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """비어 있지 않은 줄을 (0부터 시작하는 레코드 번호, 줄)로 하나씩 반환"""
+    index = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        yield index, line
+        index += 1
+
+
+def evaluate_stream(evaluator: UniversalMongoDBEvaluator,
+                    lines: Iterable[Tuple[int, str]],
+                    executor: Optional["AggregationExecutor"] = None,
+                    report: Optional["ReportWriter"] = None) -> Iterator[Dict[str, Any]]:
+    """
+    레코드를 하나씩 평가하여 지표 행을 반환하는 제너레이터
+
+    파싱 또는 평가에 실패한 레코드는 error 컬럼이 채워진 행으로 반환되며
+    이후 레코드 처리는 계속됩니다. executor가 주어지면 각 레코드의 쿼리를 스냅샷에
+    실행하여 direct_mongodb_results를 채운 뒤 평가합니다. report가 주어지면 평가된
+    레코드마다 리포트 섹션을 기록합니다.
+    """
+    for index, line in lines:
+        row = dict.fromkeys(METRIC_FIELDS)
+        row["index"] = index
+        try:
+            analysis_result, ground_truth = parse_record(line)
+            row["timestamp"] = analysis_result.timestamp
+            if executor is not None:
+                analysis_result = executor.attach(analysis_result)
+            metrics = evaluator.evaluate(analysis_result, ground_truth)
+            if report is not None:
+                report.write_run(metrics, analysis_result, index=index)
+        except Exception as e:
+            row["error"] = f"{type(e).__name__}: {e}"
+            yield row
+            continue
+
+        row["semantic_error_rate"] = metrics.semantic_error_rate
+        row["execution_success_rate"] = metrics.execution_success_rate
+        row["empty_result_rate"] = metrics.empty_result_rate
+        row["accuracy_rate"] = metrics.accuracy_rate
+        row["overall_pass"] = bool(metrics.overall_pass)
+        yield row
+
+
+class JsonlMetricsWriter:
+    """지표 행을 JSONL로 한 줄씩 기록"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+class CsvMetricsWriter:
+    """지표 행을 CSV로 한 줄씩 기록"""
+
+    def __init__(self, stream: TextIO):
+        self._writer = csv.DictWriter(stream, fieldnames=METRIC_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._writer.writerow(row)
+
+
+WRITERS = {
+    "jsonl": JsonlMetricsWriter,
+    "csv": CsvMetricsWriter,
+}
+
+
+def run_pipeline(evaluator: UniversalMongoDBEvaluator, source: TextIO, sink: TextIO,
+                 output_format: str = "jsonl",
+                 executor: Optional["AggregationExecutor"] = None,
+                 report: Optional["ReportWriter"] = None) -> Dict[str, int]:
+    """
+    입력 스트림을 평가하여 싱크에 기록
+
+    Returns:
+        Dict: 처리 건수 요약 (records, passed, failed, errors)
+    """
+    if output_format not in WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+    writer = WRITERS[output_format](sink)
+
+    summary = {"records": 0, "passed": 0, "failed": 0, "errors": 0}
+    for row in evaluate_stream(evaluator, read_records(source), executor, report):
+        writer.write(row)
+        summary["records"] += 1
+        if row["error"] is not None:
+            summary["errors"] += 1
+        elif row["overall_pass"]:
+            summary["passed"] += 1
+        else:
+            summary["failed"] += 1
+    return summary
@@ -0,0 +1,278 @@
+"""
+임계값 스윕 / what-if 분석
+
+저장된 지표 값(evaluate_batch() 결과, ResultsStore, EvaluationHistory.range())만으로
+임계값 조합 격자의 통과율을 재평가 없이 계산합니다.
+
+각 실행을 지표별로 "몇 번째 임계값부터 통과하는지" 격자 위치로 변환한 뒤, 위치 조합의
+히스토그램을 축마다 누적합하면 모든 조합의 통과 건수가 한 번에 나옵니다.
+비용은 O(실행 수 + 조합 수)이므로 100만 건 × 20⁴ 조합도 수 초 안에 끝납니다.
+
+    sweep = sweep_thresholds(metrics_df, {"accuracy": np.linspace(0.5, 1.0, 20),
+                                          "empty_result": np.linspace(0.0, 0.5, 20)})
+    sweep.pass_rate_at(accuracy=0.9, empty_result=0.2)
+    sweep.sensitivity()          # 지표별 임계값-통과율 곡선 (나머지는 기준 임계값 고정)
+    sweep.to_dataframe()         # 조합당 1행: 임계값, 통과율, 제약 지표
+
+통과율은 4개 핵심 지표와 higher_is_better로 지정한 추가 컬럼(사용자 정의 지표 등)으로 계산하며
+지연 시간 SLO는 포함하지 않습니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .core import DEFAULT_THRESHOLDS
+
+
+# 임계값 키 → (지표 컬럼, 높을수록 좋은지 여부)
+_CORE_METRICS = {
+    "semantic_error": ("semantic_error_rate", False),
+    "execution_success": ("execution_success_rate", True),
+    "empty_result": ("empty_result_rate", False),
+    "accuracy": ("accuracy_rate", True),
+}
+
+# 누적합 배열 크기 상한 (조합 수 기준, int64 8바이트/칸)
+MAX_GRID_CELLS = 50_000_000
+
+
+def _column(data: Any, name: str) -> np.ndarray:
+    """지표 컬럼을 float64 배열로 추출 (DataFrame, 구조화 배열, ResultsStore, 딕셔너리)"""
+    if hasattr(data, "records") and not isinstance(data, (pd.DataFrame, np.ndarray)):
+        data = data.records   # ResultsStore
+    try:
+        values = data[name]
+    except (KeyError, ValueError, IndexError) as e:
+        raise KeyError(f"지표 컬럼이 없습니다: {name}") from e
+    return np.asarray(values, dtype=np.float64)
+
+
+@dataclass
+class ThresholdSweep:
+    """
+    임계값 격자 스윕 결과
+
+    축 순서는 metrics, 각 축의 임계값은 오름차순(grids)입니다.
+    """
+    metrics: Tuple[str, ...]                  # 임계값 키 (축 순서)
+    grids: Dict[str, np.ndarray]              # 축별 임계값 (오름차순)
+    higher_is_better: Dict[str, bool]         # 축별 판정 방향 (True: 값 ≥ 임계값 통과)
+    n_runs: int                               # 실행 수
+    pass_counts: np.ndarray                   # 조합별 통과 실행 수 (격자 모양)
+    sole_failures: Dict[str, np.ndarray]      # 조합별 해당 지표 하나만 미달인 실행 수
+    base: Dict[str, float]                    # 기준 임계값 (sensitivity 기본값, 격자 위의 값)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.pass_counts.shape
+
+    @property
+    def pass_rate(self) -> np.ndarray:
+        """조합별 통과율 (실행이 없으면 NaN)"""
+        if self.n_runs == 0:
+            return np.full(self.shape, np.nan)
+        return self.pass_counts / self.n_runs
+
+    def _index(self, metric: str, value: float) -> int:
+        grid = self.grids[metric]
+        index = int(np.argmin(np.abs(grid - value)))
+        if not np.isclose(grid[index], value, rtol=0.0, atol=1e-12):
+            raise KeyError(f"{metric} 임계값 {value}는 격자에 없습니다 (격자: {grid.tolist()})")
+        return index
+
+    def _position(self, thresholds: Mapping[str, float]) -> Tuple[int, ...]:
+        unknown = set(thresholds) - set(self.metrics)
+        if unknown:
+            raise KeyError(f"스윕하지 않은 지표입니다: {sorted(unknown)}")
+        return tuple(self._index(metric, thresholds.get(metric, self.base[metric]))
+                     for metric in self.metrics)
+
+    def pass_rate_at(self, **thresholds: float) -> float:
+        """격자 위 한 조합의 통과율 (지정하지 않은 지표는 기준 임계값)"""
+        return float(self.pass_rate[self._position(thresholds)])
+
+    def binding_constraint(self) -> np.ndarray:
+        """
+        조합별 제약 지표 이름 - 그 지표 하나만 미달인 실행이 가장 많은 지표
+        (해당 임계값만 완화했을 때 통과율이 가장 크게 오를 수 있는 지표, 없으면 빈 문자열)
+        """
+        if not self.metrics:
+            return np.empty(self.shape, dtype=object)
+        stacked = np.stack([self.sole_failures[metric] for metric in self.metrics])
+        names = np.asarray(self.metrics + ("",), dtype=object)
+        binding = np.argmax(stacked, axis=0)
+        binding[stacked.max(axis=0) == 0] = len(self.metrics)
+        return names[binding]
+
+    def sensitivity(self, **base: float) -> pd.DataFrame:
+        """
+        지표별 임계값-통과율 곡선 (나머지 지표는 기준 임계값 고정)
+
+        Returns:
+            pd.DataFrame: metric, threshold, pass_rate, sole_failure_rate (기준 대비 단일 미달 비율)
+        """
+        position = self._position(base)
+        frames = []
+        rate = self.pass_rate
+        for axis, metric in enumerate(self.metrics):
+            index = list(position)
+            index[axis] = slice(None)
+            index = tuple(index)
+            frames.append(pd.DataFrame({
+                "metric": metric,
+                "threshold": self.grids[metric],
+                "pass_rate": rate[index],
+                "sole_failure_rate": self.sole_failures[metric][index] / max(self.n_runs, 1),
+            }))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+            columns=["metric", "threshold", "pass_rate", "sole_failure_rate"])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """조합당 1행: 지표별 임계값, pass_count, pass_rate, binding_constraint"""
+        mesh = np.meshgrid(*(self.grids[metric] for metric in self.metrics), indexing="ij")
+        data = {metric: axis.ravel() for metric, axis in zip(self.metrics, mesh)}
+        data["pass_count"] = self.pass_counts.ravel()
+        data["pass_rate"] = self.pass_rate.ravel()
+        data["binding_constraint"] = self.binding_constraint().ravel()
+        return pd.DataFrame(data)
+
+    def best(self, min_pass_rate: float) -> Dict[str, float]:
+        """
+        통과율이 min_pass_rate 이상인 조합 중 가장 엄격한 조합
+
+        엄격함은 축별 격자 위치(엄격할수록 큰 값)의 합으로 비교합니다. 없으면 빈 딕셔너리.
+        """
+        strictness = np.zeros(self.shape, dtype=np.int64)
+        for axis, metric in enumerate(self.metrics):
+            size = len(self.grids[metric])
+            order = np.arange(size) if self.higher_is_better[metric] else np.arange(size)[::-1]
+            shape = [1] * len(self.metrics)
+            shape[axis] = size
+            strictness = strictness + order.reshape(shape)
+        candidates = self.pass_rate >= min_pass_rate
+        if not candidates.any():
+            return {}
+        strictness = np.where(candidates, strictness, -1)
+        position = np.unravel_index(int(np.argmax(strictness)), self.shape)
+        return {metric: float(self.grids[metric][index]) for metric, index in zip(self.metrics, position)}
+
+
+def sweep_thresholds(data: Any, grid: Mapping[str, Sequence[float]],
+                     base_thresholds: Optional[Mapping[str, float]] = None,
+                     higher_is_better: Optional[Mapping[str, bool]] = None) -> ThresholdSweep:
+    """
+    임계값 조합 격자의 통과율 계산 (재평가 없음)
+
+    Args:
+        data: 지표 값 - evaluate_batch() DataFrame, ResultsStore, RESULTS_DTYPE 구조화 배열
+            (EvaluationHistory.range()), 또는 {컬럼: 배열} 딕셔너리
+        grid: {임계값 키: 후보 임계값들}. 격자에 없는 핵심 지표는 base_thresholds 값 하나로 고정
+        base_thresholds: 고정 임계값 / sensitivity 기준 (기본: DEFAULT_THRESHOLDS).
+            격자 축의 기준은 격자에서 가장 가까운 값
+        higher_is_better: 핵심 지표 외 컬럼(사용자 정의 지표 등)의 판정 방향. 키 이름이 곧 컬럼 이름이며,
+            격자에 없어도 base_thresholds에 임계값이 있고 data에 컬럼이 있으면 그 값으로 고정
+
+    Returns:
+        ThresholdSweep
+    """
+    base_thresholds = dict(DEFAULT_THRESHOLDS if base_thresholds is None else base_thresholds)
+    higher_is_better = dict(higher_is_better or {})
+
+    axes: List[Tuple[str, str, bool, np.ndarray]] = []
+    for metric, (column, higher) in _CORE_METRICS.items():
+        if metric in grid:
+            values = grid[metric]
+        elif metric in base_thresholds:
+            values = [base_thresholds[metric]]
+        else:
+            continue
+        axes.append((metric, column, higher, values))
+    for metric, values in grid.items():
+        if metric in _CORE_METRICS:
+            continue
+        if metric not in higher_is_better:
+            raise ValueError(f"핵심 지표가 아닌 '{metric}'은 higher_is_better에 판정 방향을 지정해야 합니다")
+        axes.append((metric, metric, bool(higher_is_better[metric]), values))
+    for metric, higher in higher_is_better.items():
+        # 격자에 없는 추가 지표는 기준 임계값이 있고 데이터에 컬럼이 있을 때만 고정 축으로 포함
+        if metric in grid or metric in _CORE_METRICS or base_thresholds.get(metric) is None:
+            continue
+        try:
+            _column(data, metric)
+        except KeyError:
+            continue
+        axes.append((metric, metric, bool(higher), [base_thresholds[metric]]))
+
+    grids = {}
+    for metric, _, _, values in axes:
+        values = np.unique(np.asarray(values, dtype=np.float64))
+        if values.size == 0 or np.isnan(values).any():
+            raise ValueError(f"{metric} 임계값 격자가 비어 있거나 NaN을 포함합니다")
+        grids[metric] = values
+    # 각 축에 "어떤 임계값에서도 미달" 칸 하나를 추가한 누적합 배열
+    cells = int(np.prod([grids[metric].size + 1 for metric, _, _, _ in axes], dtype=np.float64))
+    if cells > MAX_GRID_CELLS:
+        raise ValueError(f"임계값 조합이 너무 많습니다: {cells} 칸 (최대 {MAX_GRID_CELLS})")
+
+    # 실행별 축 위치 r: 축을 엄격 → 관대 순으로 놓았을 때 위치 r 이상에서 통과
+    positions = []
+    n_runs = None
+    for metric, column, higher, _ in axes:
+        values = _column(data, column)
+        if n_runs is None:
+            n_runs = values.size
+        elif values.size != n_runs:
+            raise ValueError(f"{column} 컬럼 길이({values.size})가 다른 컬럼({n_runs})과 다릅니다")
+        thresholds = grids[metric]
+        size = thresholds.size
+        if higher:
+            # 값 ≥ 임계값 통과: 임계값 내림차순 축에서 위치 size - (임계값 ≤ 값인 개수)부터 통과
+            position = size - np.searchsorted(thresholds, values, side="right")
+        else:
+            # 값 ≤ 임계값 통과: 임계값 오름차순 축에서 위치 (임계값 < 값인 개수)부터 통과
+            position = np.searchsorted(thresholds, values, side="left")
+        position[np.isnan(values)] = size   # NaN은 항상 미달 (evaluate()의 비교와 동일)
+        positions.append(position)
+    n_runs = 0 if n_runs is None else n_runs
+
+    shape = tuple(grids[metric].size + 1 for metric, _, _, _ in axes)
+    if positions:
+        codes = np.ravel_multi_index(positions, shape)
+        cumulative = np.bincount(codes, minlength=cells).reshape(shape)
+    else:
+        cumulative = np.full(shape, n_runs, dtype=np.int64)
+    for axis in range(len(axes)):
+        np.cumsum(cumulative, axis=axis, out=cumulative)
+
+    # 엄격 → 관대 축을 사용자에게 보여줄 임계값 오름차순으로 되돌림
+    def to_ascending(array: np.ndarray) -> np.ndarray:
+        index = tuple(slice(None, -1)
+                      if not higher else slice(-2, None, -1)
+                      for _, _, higher, _ in axes)
+        return array[index]
+
+    pass_counts = to_ascending(cumulative)
+    sole_failures = {}
+    for axis, (metric, _, _, _) in enumerate(axes):
+        # 해당 축만 "항상 통과"(마지막 칸)로 고정한 누적값 - 나머지 지표는 모두 통과한 실행 수
+        others = np.take(cumulative, [-1], axis=axis)
+        sole_failures[metric] = to_ascending(np.broadcast_to(others, shape)) - pass_counts
+
+    base = {}
+    for metric, _, _, _ in axes:
+        values = grids[metric]
+        reference = base_thresholds.get(metric, values[len(values) // 2])
+        base[metric] = float(values[int(np.argmin(np.abs(values - reference)))])
+
+    return ThresholdSweep(
+        metrics=tuple(metric for metric, _, _, _ in axes),
+        grids=grids,
+        higher_is_better={metric: higher for metric, _, higher, _ in axes},
+        n_runs=int(n_runs),
+        pass_counts=pass_counts,
+        sole_failures=sole_failures,
+        base=base,
+    )
@@ -0,0 +1,146 @@
+"""비동기 평가 API (aio) 테스트"""
+
+import asyncio
+import threading
+
+import pytest
+
+from mongodb_evaluation_system import quick_evaluate
+from mongodb_evaluation_system.aio import EvaluationExecutor, EvaluationQueueFull, aquick_evaluate
+from mongodb_evaluation_system.plugins import MetricRegistry, key_coverage_metric
+
+ARGS = ("월별 평균 주문 금액",
+        ["db.orders.aggregate([{$group: {_id: '$month', avg: {$avg: '$amount'}}}])"],
+        {"average_amount": 1500.5, "order_count": 120, "top_month": "2024-03"},
+        [{"status": "success", "execution_time": 0.12}, {"status": "error", "error": "timeout"}],
+        {"average_amount": 1500.5, "order_count": 121, "missing": 3})
+
+
+def _metric_values(metrics):
+    return (metrics.semantic_error_rate, metrics.execution_success_rate, metrics.empty_result_rate,
+            metrics.accuracy_rate, metrics.overall_pass, metrics.custom_metrics)
+
+
+def test_aquick_evaluate_matches_quick_evaluate():
+    async def main():
+        async with EvaluationExecutor(max_workers=2) as executor:
+            return await asyncio.gather(
+                aquick_evaluate(*ARGS, executor=executor),
+                aquick_evaluate(*ARGS, metric_plugins=MetricRegistry([key_coverage_metric(0.9)]),
+                                executor=executor))
+
+    plain, with_plugins = asyncio.run(main())
+    expected = quick_evaluate(*ARGS)
+    assert _metric_values(plain) == _metric_values(expected)
+    assert plain.comparison_table.equals(expected.comparison_table)
+
+    expected = quick_evaluate(*ARGS, metric_plugins=MetricRegistry([key_coverage_metric(0.9)]))
+    assert _metric_values(with_plugins) == _metric_values(expected)
+    assert with_plugins.custom_metrics == {"key_coverage": pytest.approx(2 / 3)}
+
+
+class _Gate:
+    """release될 때까지 실행 스레드를 붙잡는 작업"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, value=None):
+        self.started.set()
+        assert self.release.wait(10)
+        return value
+
+
+async def _wait_for(event: threading.Event) -> None:
+    assert await asyncio.get_running_loop().run_in_executor(None, event.wait, 10)
+
+
+def test_full_queue_raises_immediately_with_zero_queue_timeout():
+    async def main():
+        gate = _Gate()
+        executor = EvaluationExecutor(max_workers=1, max_pending=1, queue_timeout=0)
+        running = asyncio.ensure_future(executor.run(gate, "first"))
+        await _wait_for(gate.started)
+        with pytest.raises(EvaluationQueueFull):
+            await executor.run(gate, "second")
+        gate.release.set()
+        assert await running == "first"
+        # 슬롯이 반환되면 다시 받음
+        assert await executor.run(gate, "third") == "third"
+        assert executor.pending == 0
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_queue_timeout_then_waiter_gets_released_slot():
+    async def main():
+        gate = _Gate()
+        executor = EvaluationExecutor(max_workers=1, max_pending=1, queue_timeout=0.05)
+        running = asyncio.ensure_future(executor.run(gate, "first"))
+        await _wait_for(gate.started)
+        with pytest.raises(EvaluationQueueFull):
+            await executor.run(gate, "late")
+        assert executor.waiting == 0
+
+        executor.queue_timeout = None
+        waiting = asyncio.ensure_future(executor.run(gate, "second"))
+        await asyncio.sleep(0.05)
+        assert executor.waiting == 1
+        gate.release.set()
+        assert await asyncio.gather(running, waiting) == ["first", "second"]
+        assert executor.pending == 0
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_timeout_raises_and_slot_is_freed_when_work_finishes():
+    async def main():
+        gate = _Gate()
+        executor = EvaluationExecutor(max_workers=1, max_pending=1)
+        with pytest.raises(TimeoutError):
+            await executor.run(gate, timeout=0.05)
+        # 실행 중이던 작업은 끝날 때까지 슬롯 점유
+        assert executor.pending == 1
+        gate.release.set()
+        for _ in range(100):
+            if executor.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.pending == 0
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_cancelled_calls_release_their_slots():
+    async def main():
+        gate = _Gate()
+        executor = EvaluationExecutor(max_workers=1, max_pending=2)
+        running = asyncio.ensure_future(executor.run(gate, "running"))
+        await _wait_for(gate.started)
+        # 실행기 대기 중 (시작 전) 작업과 슬롯 대기 중 호출
+        queued = asyncio.ensure_future(executor.run(gate, "queued"))
+        waiting = asyncio.ensure_future(executor.run(gate, "waiting"))
+        await asyncio.sleep(0.05)
+        assert (executor.pending, executor.waiting) == (2, 1)
+
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        # 시작 전 작업은 실행기에서 제거되어 슬롯 반환, 대기 중 호출이 그 슬롯을 받음
+        assert executor.waiting == 0
+        waiting_cancelled = asyncio.ensure_future(executor.run(gate, "extra"))
+        await asyncio.sleep(0.05)
+        waiting_cancelled.cancel()
+        await asyncio.sleep(0.01)
+        assert executor.waiting == 0
+
+        gate.release.set()
+        assert await running == "running"
+        assert await waiting == "waiting"
+        assert executor.pending == 0
+        executor.shutdown()
+
+    asyncio.run(main())
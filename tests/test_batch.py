@@ -0,0 +1,92 @@
+"""일괄 평가 (evaluate_batch) 테스트 - 실행별 결과는 evaluate()와 같아야 함"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+
+
+def _assert_matches_evaluate(evaluator, results, ground_truths=None):
+    frame = evaluator.evaluate_batch(results, ground_truths)
+    ground_truths = ground_truths or [None] * len(results)
+    for run, (analysis_result, ground_truth) in enumerate(zip(results, ground_truths)):
+        metrics = evaluator.evaluate(analysis_result, ground_truth)
+        for column in frame.columns:
+            expected = (getattr(metrics, column) if hasattr(metrics, column)
+                        else metrics.custom_metrics[column])
+            actual = frame[column].iloc[run]
+            assert actual == pytest.approx(expected, nan_ok=True), (run, column)
+
+
+def test_int_beyond_float_range_is_not_empty():
+    analysis_result = UniversalAnalysisResult(
+        analysis_query="주문 합계", mongodb_queries=["db.orders.find({})"],
+        calculation_results={"total": 10 ** 400, "avg": 1.0, "missing": float("nan")},
+        execution_logs=[])
+    evaluator = UniversalMongoDBEvaluator()
+    assert evaluator.evaluate_batch([analysis_result])["empty_result_rate"].iloc[0] == pytest.approx(1 / 3)
+    _assert_matches_evaluate(evaluator, [analysis_result])
+
+
+def _result(calculation_results, queries=("db.orders.aggregate([{$group: {_id: null, n: {$sum: 1}}}])",),
+            logs=({"status": "success", "execution_time": 0.2},), direct=None,
+            analysis_query="주문 수와 평균 금액"):
+    return UniversalAnalysisResult(analysis_query=analysis_query, mongodb_queries=list(queries),
+                                   calculation_results=calculation_results, execution_logs=list(logs),
+                                   direct_mongodb_results=direct)
+
+
+# (분석 결과, 정답 데이터)
+RECORDS = {
+    "nan_inf": (_result({"avg": float("nan"), "max": float("inf"), "n": 3}), None),
+    "strings": (_result({"top": "Seoul ", "status": "ERROR: timeout", "blank": " "},
+                        direct={"top": "seoul", "status": "ok"}), None),
+    "nested": (_result({"by_month": [{"_id": m, "n": m * 2} for m in range(20)], "tags": {"a": [1, 2]}},
+                       direct={"by_month": [{"_id": m, "n": m * 2} for m in range(20)],
+                               "tags": {"a": [1, 3]}}), None),
+    "large_ints": (_result({"total": 10 ** 400, "id": 2 ** 60 + 1}, direct={"total": 1.5, "id": 2 ** 60}),
+                   None),
+    "ground_truth": (_result({"n": 10, "avg": 2.5}), {"n": 10, "avg": 2.0}),
+    "direct_over_ground_truth": (_result({"n": 10}, direct={"n": 10}), {"n": 11}),
+    "direct_without_overlap": (_result({"n": 10}, direct={"other": 1}), None),
+    "ground_truth_without_overlap": (_result({"n": 10}), {"other": 1}),
+    "consistency_penalties": (_result({"count": -3, "huge": 2e7, "success_rate": 140, "neg_rate": -1},
+                                      queries=("db.orders.count()",)), None),
+    "rate_query": (_result({"ratio": 150}, analysis_query="전환 비율"), None),
+    "no_logs_or_queries": (_result({"n": 1}, queries=(), logs=()), None),
+    "empty_results": (_result({}), None),
+    "failed_logs": (_result({"n": 1}, logs=({"status": "error", "error": "boom"},
+                                            {"tool": "find", "execution_time": 3.0})), None),
+    "logical_error_pattern": (_result({"n": 1}, queries=("db.c.find({a: {$gt: 999999999}})",
+                                                         "db.c.aggregate([{$match: {}}])")), None),
+}
+
+
+def _plugin_registry():
+    from mongodb_evaluation_system.plugins import MetricRegistry, execution_time_metric, key_coverage_metric
+
+    registry = MetricRegistry([key_coverage_metric(0.9), execution_time_metric(1.0, gate=False)])
+    registry.register("empty_count", _empty_count, inputs=("profile",), threshold=0, higher_is_better=False)
+    return registry
+
+
+def _empty_count(inputs):
+    return inputs.profile.n_empty
+
+
+EVALUATORS = {
+    "default": lambda: UniversalMongoDBEvaluator(),
+    "plugins": lambda: UniversalMongoDBEvaluator(metric_plugins=_plugin_registry()),
+    "latency_slo": lambda: UniversalMongoDBEvaluator(latency_slo={"p95": 1.0}),
+}
+
+
+@pytest.mark.parametrize("name", RECORDS)
+def test_each_record_matches_evaluate(name):
+    analysis_result, ground_truth = RECORDS[name]
+    _assert_matches_evaluate(EVALUATORS["plugins"](), [analysis_result], [ground_truth])
+
+
+@pytest.mark.parametrize("evaluator_name", EVALUATORS)
+def test_mixed_batch_matches_evaluate(evaluator_name):
+    results, ground_truths = zip(*RECORDS.values())
+    _assert_matches_evaluate(EVALUATORS[evaluator_name](), list(results), list(ground_truths))
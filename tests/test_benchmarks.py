@@ -0,0 +1,56 @@
+"""합성 코퍼스 생성기와 핫 패스 벤치마크 테스트"""
+
+import pytest
+
+from benchmarks import hot_paths
+from benchmarks.synthetic import CorpusConfig, make_corpus
+from mongodb_evaluation_system import UniversalMongoDBEvaluator
+
+TINY = CorpusConfig(records=12, queries=4, keys=8, list_size=5, logs=6, mismatch_ratio=0.0, seed=3)
+
+
+def _key(result):
+    return (result.mongodb_queries, result.calculation_results, result.execution_logs,
+            result.direct_mongodb_results)
+
+
+def test_corpus_is_reproducible_and_shaped_by_config():
+    corpus = make_corpus(TINY)
+
+    assert [_key(result) for result in corpus] == [_key(result) for result in make_corpus(TINY)]
+    other = make_corpus(CorpusConfig(**{**TINY.to_dict(), "seed": 4}))
+    assert [_key(result) for result in corpus] != [_key(result) for result in other]
+
+    assert len(corpus) == 12
+    for result in corpus:
+        assert len(result.mongodb_queries) == 4
+        assert len(result.execution_logs) == 6
+        assert len(result.calculation_results) == 8 + 1
+        assert len(result.calculation_results["group_results"]) == 5
+        assert result.direct_mongodb_results == result.calculation_results
+
+
+@pytest.mark.parametrize("mismatch_ratio, accuracy", [(0.0, 1.0), (1.0, 0.0)])
+def test_mismatch_ratio_drives_accuracy(mismatch_ratio, accuracy):
+    config = CorpusConfig(**{**TINY.to_dict(), "mismatch_ratio": mismatch_ratio})
+    evaluator = UniversalMongoDBEvaluator()
+    assert all(evaluator.evaluate(result).accuracy_rate == accuracy for result in make_corpus(config))
+
+
+def test_run_and_compare(monkeypatch):
+    monkeypatch.setitem(hot_paths.SIZES, "tiny", TINY)
+    report = hot_paths.run(["tiny"], targets=("evaluate", "values_match"), warmup=2, measure_memory=False,
+                           seed=TINY.seed)
+
+    rows = {row["target"]: row for row in report["results"]}
+    assert rows["evaluate"]["calls"] == 12
+    assert rows["values_match"]["calls"] == 12 * 9
+    assert rows["evaluate"]["config"] == TINY.to_dict()
+    assert rows["evaluate"]["peak_memory_kb"] is None
+    assert report["meta"]["evaluator_version"]
+
+    changes = hot_paths.compare(report, report)
+    assert [change["target"] for change in changes] == ["evaluate", "values_match"]
+    assert all(change["p50_ratio"] in (1.0, None) and change["memory_ratio"] is None for change in changes)
+    with pytest.raises(ValueError):
+        hot_paths._calls("unknown", UniversalMongoDBEvaluator(), [], [])
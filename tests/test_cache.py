@@ -0,0 +1,44 @@
+"""평가 캐시 (canonical_json / EvaluationCache) 테스트"""
+
+import os
+import stat
+
+from mongodb_evaluation_system.cache import EvaluationCache, canonical_json
+
+
+def test_canonical_json_keeps_key_and_container_types():
+    assert canonical_json({1: 5}) != canonical_json({"1": 5})
+    assert canonical_json((1, 2)) != canonical_json([1, 2])
+    assert canonical_json({"a": (1, 2)}) != canonical_json({"a": [1, 2]})
+    assert canonical_json(1) != canonical_json(1.0) != canonical_json(True)
+    # 태그 키와 같은 문자열 키도 구분
+    assert canonical_json({"\x00tuple": [1, 2]}) != canonical_json((1, 2))
+
+
+def test_canonical_json_sorts_mixed_key_types():
+    value = {1: "a", "b": 2, (1, 2): 3, None: 4}
+    reordered = dict(reversed(list(value.items())))
+    assert canonical_json(value) == canonical_json(reordered)
+    assert canonical_json({3, 1, "x"}) == canonical_json({"x", 1, 3})
+
+
+def test_disk_tier_is_capped(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = EvaluationCache(max_entries=5, path=path, max_disk_entries=20)
+    for index in range(50):
+        cache.put(f"key-{index}", {"value": index})
+    count = cache._connection.execute("SELECT COUNT(*) FROM evaluation_cache").fetchone()[0]
+    assert count <= 20
+    cache.close()
+
+    # 최근 항목은 재시작 후에도 디스크에서 읽힘
+    cache = EvaluationCache(max_entries=5, path=path, max_disk_entries=20)
+    assert cache.get("key-49") == {"value": 49}
+    assert cache.get("key-0") is None
+    cache.close()
+
+
+def test_new_disk_file_is_owner_only(tmp_path):
+    path = str(tmp_path / "cache.db")
+    EvaluationCache(path=path).close()
+    assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
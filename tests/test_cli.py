@@ -0,0 +1,79 @@
+"""스트리밍 JSONL 파이프라인과 명령행 (cli.main) 테스트"""
+
+import csv
+import json
+
+import pytest
+
+from mongodb_evaluation_system import quick_evaluate
+from mongodb_evaluation_system.cli import main
+
+GOOD = {
+    "analysis_query": "주문 수",
+    "mongodb_queries": ["db.orders.countDocuments({})"],
+    "calculation_results": {"order_count": 120},
+    "execution_logs": [{"status": "success", "execution_time": 0.1}],
+    "direct_mongodb_results": {"order_count": 120},
+    "timestamp": "2024-05-01T00:00:00",
+}
+
+LINES = [
+    json.dumps(GOOD, ensure_ascii=False),
+    "{not json",
+    "",                                              # 빈 줄은 레코드로 세지 않음
+    "[1, 2]",
+    json.dumps({"mongodb_queries": []}),
+    json.dumps(dict(GOOD, calculation_results={"order_count": 90}), ensure_ascii=False),
+]
+
+
+@pytest.fixture
+def runs(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    return path
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_malformed_lines_become_error_rows(runs, tmp_path, capsys):
+    output = tmp_path / "metrics.jsonl"
+    assert main(["evaluate", str(runs), "-o", str(output)]) == 0
+
+    rows = _read_jsonl(output)
+    assert [row["index"] for row in rows] == [0, 1, 2, 3, 4]
+    errors = [row["error"] for row in rows]
+    assert errors[0] is None and errors[4] is None
+    assert errors[1].startswith("RecordError: JSON 파싱 실패")
+    assert errors[2] == "RecordError: 레코드는 JSON 객체여야 합니다"
+    assert errors[3] == "RecordError: analysis_query 필드가 없습니다"
+    assert rows[1]["overall_pass"] is None
+
+    expected = quick_evaluate(GOOD["analysis_query"], GOOD["mongodb_queries"], GOOD["calculation_results"],
+                              GOOD["execution_logs"], GOOD["direct_mongodb_results"])
+    assert rows[0]["accuracy_rate"] == expected.accuracy_rate
+    assert rows[0]["overall_pass"] is bool(expected.overall_pass)
+    assert rows[0]["timestamp"] == GOOD["timestamp"]
+    assert rows[4]["accuracy_rate"] == 0.0
+    assert "5건 (PASS 1, FAIL 1, 오류 3)" in capsys.readouterr().err
+
+
+def test_fail_on_error_sets_exit_code(runs, tmp_path):
+    output = tmp_path / "metrics.jsonl"
+    assert main(["evaluate", str(runs), "-o", str(output), "--fail-on-error"]) == 1
+
+    clean = tmp_path / "clean.jsonl"
+    clean.write_text(LINES[0] + "\n", encoding="utf-8")
+    assert main(["evaluate", str(clean), "-o", str(output), "--fail-on-error"]) == 0
+
+
+def test_csv_output(runs, tmp_path):
+    output = tmp_path / "metrics.csv"
+    assert main(["evaluate", str(runs), "-o", str(output), "--format", "csv"]) == 0
+    with open(output, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 5
+    assert rows[0]["overall_pass"] == "True"
+    assert rows[1]["error"].startswith("RecordError")
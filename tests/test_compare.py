@@ -0,0 +1,68 @@
+"""허용 오차 기반 구조 비교 (compare_values) 테스트"""
+
+import pytest
+
+from mongodb_evaluation_system import quick_evaluate
+from mongodb_evaluation_system.compare import _VECTORIZE_MIN_LENGTH, compare_values
+from mongodb_evaluation_system.grouped import compare_grouped
+
+
+def test_nested_strings_are_case_sensitive():
+    assert compare_values(["Seoul"], ["Seoul"]).match
+    assert not compare_values(["Seoul"], ["seoul"]).match
+    assert not compare_values({"city": "Seoul "}, {"city": "Seoul"}).match
+
+
+@pytest.mark.parametrize("length", [3, _VECTORIZE_MIN_LENGTH, 100])
+def test_large_integers_compare_the_same_for_any_length(length):
+    # 2**53 + 1은 float64에서 2**53으로 반올림됨
+    base = 2 ** 53
+    calculated = [base + 1] * length
+    expected = [base] * length
+    result = compare_values(calculated, expected, abs_tol=0.5)
+    assert not result.match
+    assert result.n_different == length
+    assert result.mismatch_path == "$[0]"
+
+
+def test_large_integer_document_columns():
+    base = 2 ** 60
+    calculated = [{"id": base + i, "n": i} for i in range(_VECTORIZE_MIN_LENGTH)]
+    expected = [{"id": base + i, "n": i} for i in range(_VECTORIZE_MIN_LENGTH)]
+    assert compare_values(calculated, expected).match
+
+    expected[5] = {"id": base + 6, "n": 5}
+    result = compare_values(calculated, expected)
+    assert result.n_different == 1
+    assert result.mismatch_path == "$[5].id"
+
+
+def test_large_integer_group_fields():
+    base = 2 ** 53
+    result = compare_grouped([{"_id": "a", "total": base + 1}, {"_id": "b", "total": None}],
+                             [{"_id": "a", "total": base}, {"_id": "b", "total": None}])
+    assert list(result.mismatches["group"]) == ["a"]
+
+
+@pytest.mark.parametrize("calculated, expected", [
+    ([10 ** 400], [1.5]),
+    ({"x": 10 ** 400}, {"x": 1.5}),
+    ([1.5], [-10 ** 400]),
+])
+def test_int_beyond_float_range_is_infinitely_different(calculated, expected):
+    result = compare_values(calculated, expected)
+    assert not result.match
+    assert result.n_different == 1
+    assert result.max_abs_diff == float("inf")
+    assert compare_values(calculated, calculated).match
+
+
+@pytest.mark.parametrize("calculated, expected", [
+    ({"a": [10 ** 400]}, {"a": [1.5]}),
+    ({"a": {"x": 10 ** 400}}, {"a": {"x": 1.5}}),
+    ({"x": 10 ** 400}, {"x": 1.5}),
+])
+def test_evaluate_does_not_overflow(calculated, expected):
+    metrics = quick_evaluate("주문 합계", ["db.orders.find({})"], calculated, [], expected)
+    assert metrics.accuracy_rate == 0.0
+    assert metrics.comparison_rows.mismatched_keys == list(calculated)
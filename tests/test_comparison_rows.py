@@ -0,0 +1,82 @@
+"""ComparisonRows 와 comparison_mode 테스트
+
+기대 테이블은 ComparisonRows 도입 전 _create_comparison_table 이 만든 값입니다.
+"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.core import (COMPARISON_LLM_MISSING, COMPARISON_MATCH,
+                                            COMPARISON_MISMATCH, COMPARISON_NA)
+
+COLUMNS = ["지표", "LLM 계산 결과", "MongoDB 직접 실행", "일치 여부", "차이"]
+
+CALCULATED = {"revenue": 1500.0, "orders": 120, "avg": 12.345, "city": "Seoul", "label": "a",
+              "zero": 2, "none": None, "months": [1, 2, 3], "flag": True, "only_llm": 7}
+DIRECT = {"revenue": 1500.004, "orders": 121, "avg": 12.3, "city": " seoul", "label": "b",
+          "zero": 0, "none": None, "months": [1, 2, 3], "flag": True, "only_db": {"a": 1}}
+
+BASELINE_ROWS = [
+    ["revenue", "1500", "1500.00", "✅ 일치", "0"],
+    ["orders", "120", "121", "❌ 불일치", "1.00 (0.8%)"],
+    ["avg", "12.35", "12.30", "❌ 불일치", "0.04 (0.4%)"],
+    ["city", "Seoul", " seoul", "✅ 일치", "0"],
+    ["label", "a", "b", "❌ 불일치", "타입 불일치"],
+    ["zero", "2", "0", "❌ 불일치", "2.00"],
+    ["none", "N/A", "N/A", "✅ 일치", "0"],
+    ["months", "list(3)", "list(3)", "✅ 일치", "0"],
+    ["flag", "True", "True", "✅ 일치", "0"],
+    ["only_llm", "7", "N/A", "N/A", ""],
+    ["only_db", "N/A", "dict(1)", "⚠️ LLM 누락", "N/A"],
+]
+
+
+def _result():
+    return UniversalAnalysisResult(analysis_query="월별 매출", mongodb_queries=["db.s.find({})"],
+                                   calculation_results=dict(CALCULATED), execution_logs=[],
+                                   direct_mongodb_results=dict(DIRECT))
+
+
+def test_to_dataframe_reproduces_baseline_table():
+    rows = UniversalMongoDBEvaluator().evaluate(_result()).comparison_rows
+    table = rows.to_dataframe()
+
+    assert list(table.columns) == COLUMNS
+    assert table.values.tolist() == BASELINE_ROWS
+    assert rows.keys == [row[0] for row in BASELINE_ROWS]
+    match, mismatch = COMPARISON_MATCH, COMPARISON_MISMATCH
+    assert list(rows.statuses) == [match, mismatch, mismatch, match, mismatch, mismatch,
+                                   match, match, match, COMPARISON_NA, COMPARISON_LLM_MISSING]
+    assert rows.matched_keys == ["revenue", "city", "none", "months", "flag"]
+    assert rows.mismatched_keys == ["orders", "avg", "label", "zero"]
+
+
+def test_lazy_mode_builds_table_on_first_access():
+    metrics = UniversalMongoDBEvaluator().evaluate(_result())
+    assert metrics._comparison_table is None
+
+    table = metrics.comparison_table
+    assert table.values.tolist() == BASELINE_ROWS
+    assert metrics.comparison_table is table
+
+
+def test_eager_mode_builds_table_during_evaluate():
+    metrics = UniversalMongoDBEvaluator(comparison_mode="eager").evaluate(_result())
+    assert metrics._comparison_table is not None
+    assert metrics._comparison_table.values.tolist() == BASELINE_ROWS
+
+
+def test_none_mode_skips_rows_and_table():
+    lazy = UniversalMongoDBEvaluator().evaluate(_result())
+    metrics = UniversalMongoDBEvaluator(comparison_mode="none").evaluate(_result())
+
+    assert metrics.comparison_rows is None
+    assert metrics.comparison_table is None
+    # 비교 행을 모으지 않아도 지표는 그대로
+    assert metrics.accuracy_rate == lazy.accuracy_rate
+    assert metrics.overall_pass == lazy.overall_pass
+
+
+def test_unknown_comparison_mode_is_rejected():
+    with pytest.raises(ValueError):
+        UniversalMongoDBEvaluator(comparison_mode="sometimes")
@@ -0,0 +1,121 @@
+"""UniversalMongoDBEvaluator 핵심 지표 회귀 테스트
+
+기대값은 단일 순회 프로파일(_profile_results) 도입 전 지표별 계산으로 얻은 값입니다.
+"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+
+
+def _result(analysis_query, queries, calculation_results, logs=(), direct=None):
+    return UniversalAnalysisResult(analysis_query=analysis_query, mongodb_queries=list(queries),
+                                   calculation_results=calculation_results, execution_logs=list(logs),
+                                   direct_mongodb_results=direct)
+
+
+def _na_rows(*pairs):
+    # 직접 실행 결과가 없는 키의 행
+    return [[key, value, "N/A", "N/A", ""] for key, value in pairs]
+
+
+# (분석 결과, 정답 데이터,
+#  (의미 오류율, 실행 성공률, 무응답률, 정답 일치율, 전체 통과), 비교 테이블 행)
+CASES = {
+    # 일관성 점수: 음수 값은 결과에 "count"가 언급될 때만 -0.2
+    "count_penalty": (
+        _result("사용자 수", ["db.users.find({})"], {"total": -5, "items_count": 3},
+                logs=[{"status": "success"}]), None,
+        (0.0, 1.0, 0.0, 0.8, False),
+        _na_rows(("total", "-5"), ("items_count", "3")),
+    ),
+    "no_count_mention": (
+        _result("매출 합계", ["db.sales.find({})"], {"total": -5, "avg": 2.5}), None,
+        (0.0, 1.0, 0.0, 1.0, True),
+        _na_rows(("total", "-5"), ("avg", "2.50")),
+    ),
+    "count_mentioned_in_value": (
+        _result("요약", ["db.c.find({})"], {"note": "count of users", "delta": -1}), None,
+        (0.0, 1.0, 0.0, 0.8, False),
+        _na_rows(("note", "count of users"), ("delta", "-1")),
+    ),
+    # 천만 초과 -0.1, 0-100 범위를 벗어난 비율형 키 -0.3
+    "huge_and_rate_key": (
+        _result("전환 요약", ["db.c.find({})"], {"big": 2e7, "conversion_rate": 150, "small_ratio": 0.5}),
+        None,
+        (0.0, 1.0, 0.0, 0.6000000000000001, False),
+        _na_rows(("big", "20000000"), ("conversion_rate", "150"), ("small_ratio", "0.50")),
+    ),
+    "score_floor": (
+        _result("요약", ["db.c.find({})"], {"count": -3, "huge": 2e7, "success_rate": 140, "neg_rate": -1}),
+        None,
+        (0.0, 1.0, 0.0, 0.0, False),
+        _na_rows(("count", "-3"), ("huge", "20000000"), ("success_rate", "140"), ("neg_rate", "-1")),
+    ),
+    "ground_truth": (
+        _result("주문 통계", ["db.orders.find({})"], {"n": 10, "avg": 2.5, "city": "Seoul", "extra": 1}),
+        {"n": 10, "avg": 2.0, "city": " seoul"},
+        (0.0, 1.0, 0.0, 0.6666666666666666, False),
+        _na_rows(("n", "10"), ("avg", "2.50"), ("city", "Seoul"), ("extra", "1")),
+    ),
+    # 직접 실행 결과가 있으면 정답 데이터보다 우선
+    "direct_over_ground_truth": (
+        _result("주문 통계", ["db.orders.find({})"], {"n": 10, "avg": 2.5, "label": "x", "max": 5},
+                direct={"n": 10, "avg": 2.504, "max": 6, "missing": 7.25}),
+        {"n": 11, "avg": 0},
+        (0.0, 1.0, 0.0, 0.6666666666666666, False),
+        [["n", "10", "10", "✅ 일치", "0"],
+         ["avg", "2.50", "2.50", "✅ 일치", "0"],
+         ["label", "x", "N/A", "N/A", ""],
+         ["max", "5", "6", "❌ 불일치", "1.00 (16.7%)"],
+         ["missing", "N/A", "7.25", "⚠️ LLM 누락", "N/A"]],
+    ),
+    # 겹치는 키가 없으면 직접 실행 비교는 0.0
+    "direct_without_overlap": (
+        _result("주문 통계", ["db.orders.find({})"], {"n": 10}, direct={"other": 1.5}), None,
+        (0.0, 1.0, 0.0, 0.0, False),
+        [["n", "10", "N/A", "N/A", ""], ["other", "N/A", "1.50", "⚠️ LLM 누락", "N/A"]],
+    ),
+    # 빈 직접 실행 결과는 없는 것으로 보고 정답 데이터 사용
+    "empty_direct_uses_ground_truth": (
+        _result("주문 통계", ["db.orders.find({})"], {"n": 10, "m": 3}, direct={}), {"n": 9},
+        (0.0, 1.0, 0.0, 0.0, False),
+        _na_rows(("n", "10"), ("m", "3")),
+    ),
+    "count_query_negative_result": (
+        _result("주문 수", ["db.orders.count()", "db.orders.find({})"],
+                {"n": -1, "empty": "", "err": "Error: timeout", "none": None},
+                logs=[{"status": "success"}, {"status": "error", "error": "boom"}, {"error": None}]),
+        None,
+        (0.5, 0.6666666666666666, 0.75, 1.0, False),
+        _na_rows(("n", "-1"), ("empty", ""), ("err", "Error: timeout"), ("none", "N/A")),
+    ),
+    "rate_query_over_100": (
+        _result("전환 비율", ["db.c.find({})", "db.c.find({a: 1})"],
+                {"ratio": 150.0, "missing_avg": float("nan"), "list": []},
+                logs=[{"status": "failed", "error": "x"}]),
+        None,
+        (1.0, 0.0, 0.6666666666666666, 0.7, False),
+        _na_rows(("ratio", "150"), ("missing_avg", "nan"), ("list", "list(0)")),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_core_metrics_match_baseline(name):
+    analysis_result, ground_truth, rates, rows = CASES[name]
+    metrics = UniversalMongoDBEvaluator().evaluate(analysis_result, ground_truth)
+
+    assert (metrics.semantic_error_rate, metrics.execution_success_rate, metrics.empty_result_rate,
+            metrics.accuracy_rate, metrics.overall_pass) == rates
+    table = metrics.comparison_table
+    assert list(table.columns) == ["지표", "LLM 계산 결과", "MongoDB 직접 실행", "일치 여부", "차이"]
+    assert table.values.tolist() == rows
+
+
+def test_mentions_count_is_computed_only_for_negative_values():
+    evaluator = UniversalMongoDBEvaluator()
+    profile = evaluator._profile_results(_result("요약", [], {"count": 3}))
+    assert profile.mentions_count is None
+    profile = evaluator._profile_results(_result("요약", [], {"count": -3}))
+    assert profile.mentions_count is True
@@ -0,0 +1,100 @@
+"""상대 차이 분포 드리프트 감지 테스트"""
+
+import numpy as np
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.drift import DriftMonitor, DriftWindow, compare_windows, relative_error
+
+
+def _window(name, samples):
+    window = DriftWindow(name=name)
+    for key, values in samples.items():
+        window.add(key, values)
+    return window
+
+
+def _exact_ks(a, b):
+    grid = np.sort(np.concatenate([a, b]))
+    return np.abs(np.searchsorted(np.sort(a), grid, side="right") / len(a)
+                  - np.searchsorted(np.sort(b), grid, side="right") / len(b)).max()
+
+
+def test_identical_vs_shifted_distributions():
+    rng = np.random.default_rng(11)
+    reference_stable, current_stable = rng.normal(0.01, 0.02, 2000), rng.normal(0.01, 0.02, 2000)
+    reference_shifted, current_shifted = rng.normal(0.01, 0.02, 2000), rng.normal(0.05, 0.02, 2000)
+    reference = _window("before", {"stable": reference_stable, "shifted": reference_shifted})
+    current = _window("after", {"stable": current_stable, "shifted": current_shifted})
+
+    report = compare_windows(reference, current)
+    stable, shifted = report.to_dict()["stable"], report.to_dict()["shifted"]
+
+    assert report.keys == ["stable", "shifted"]
+    assert report.drifted_keys() == ["shifted"]
+    assert not stable["drift"] and shifted["drift"]
+    assert stable["psi"] < 0.1 and shifted["psi"] > 0.2
+    assert stable["ks_pvalue"] > 0.05 and shifted["ks_pvalue"] < 1e-6
+    # 히스토그램 근사 KS 통계량은 원본 표본으로 계산한 값과 가까움
+    assert stable["ks_statistic"] == pytest.approx(_exact_ks(reference_stable, current_stable), abs=0.03)
+    assert shifted["ks_statistic"] == pytest.approx(_exact_ks(reference_shifted, current_shifted), abs=0.03)
+    assert shifted["mean_current"] == pytest.approx(current_shifted.mean())
+    assert shifted["wasserstein"] == pytest.approx(0.04, abs=0.005)
+
+
+def test_identical_windows_have_zero_statistics():
+    values = np.random.default_rng(5).normal(0.0, 0.1, 500)
+    report = compare_windows(_window("a", {"k": values}), _window("b", {"k": values}))
+
+    assert report.ks_statistic[0] == 0.0
+    assert report.psi[0] == pytest.approx(0.0)
+    assert report.ks_pvalue[0] == 1.0
+    assert not report.drift[0]
+
+
+def test_small_or_missing_samples_are_not_judged():
+    reference = _window("a", {"few": [0.0] * 10, "only_reference": [0.0] * 50})
+    current = _window("b", {"few": [1.0] * 10, "only_current": [1.0] * 50})
+    report = compare_windows(reference, current)
+
+    assert report.keys == ["few", "only_reference", "only_current"]
+    assert not report.drift.any()
+    assert np.isnan(report.psi[1:]).all()
+    assert compare_windows(reference, current, min_samples=5).drifted_keys() == ["few"]
+
+
+def test_merge_equals_single_window():
+    rng = np.random.default_rng(2)
+    values = rng.normal(0.0, 0.05, 300)
+    whole = _window("whole", {"k": values})
+    merged = _window("a", {"k": values[:100]}).merge(_window("b", {"k": values[100:]}))
+    assert np.array_equal(merged.counts, whole.counts)
+
+
+def _analysis_result(llm_value):
+    return UniversalAnalysisResult(analysis_query="평균 세션 시간", mongodb_queries=["db.s.find({})"],
+                                   calculation_results={"avg_session_time": llm_value, "label": "x"},
+                                   execution_logs=[], direct_mongodb_results={"avg_session_time": 100.0,
+                                                                               "label": "x"})
+
+
+def test_monitor_flags_slow_drift_from_evaluations():
+    evaluator = UniversalMongoDBEvaluator()
+    rng = np.random.default_rng(8)
+    reports = []
+    monitor = DriftMonitor(window_runs=200, on_report=reports.append)
+    for bias in (0.0, 0.0, 0.03):
+        for value in rng.normal(100.0 * (1 + bias), 1.0, 200):
+            monitor.observe(evaluator.evaluate(_analysis_result(float(value))))
+
+    assert monitor.windows == 3
+    assert [report.drifted_keys() for report in reports] == [[], ["avg_session_time"]]
+    assert reports[1].keys == ["avg_session_time"]   # 문자열 키는 표본 없음
+
+
+def test_relative_error():
+    assert relative_error(110, 100) == pytest.approx(0.1)
+    assert relative_error(90, -100) == pytest.approx(1.9)
+    assert relative_error(1, 0) is None
+    assert relative_error(True, 1) is None
+    assert relative_error("a", 1) is None
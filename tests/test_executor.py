@@ -0,0 +1,41 @@
+"""인메모리 집계 파이프라인 실행기 (AggregationExecutor) 테스트"""
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.executor import AggregationExecutor
+
+SESSIONS = [
+    {"user_id": "a", "duration": 10},
+    {"user_id": "b"},
+    {"user_id": "b", "duration": None},
+    {"duration": 30},
+]
+
+
+def test_accumulators_over_missing_values_return_null():
+    executor = AggregationExecutor({"sessions": SESSIONS})
+    documents = executor.run(
+        "db.sessions.aggregate([{$group: {_id: '$user_id', avg: {$avg: '$duration'}, "
+        "max: {$max: '$duration'}, total: {$sum: '$duration'}}}])"
+    )
+    by_id = {document["_id"]: document for document in documents}
+    assert by_id["b"] == {"_id": "b", "avg": None, "max": None, "total": 0}
+    # 그룹 키가 없는 문서는 _id null 그룹
+    assert by_id[None]["avg"] == 30
+
+
+def test_attach_keeps_execution_logs_separate():
+    executor = AggregationExecutor({"sessions": SESSIONS})
+    analysis_result = UniversalAnalysisResult(
+        analysis_query="세션 수",
+        mongodb_queries=["db.sessions.aggregate([{$group: {_id: null, sessions: {$sum: 1}}}])",
+                         "db.missing.aggregate([{$unknownStage: {}}])"],
+        calculation_results={"sessions": 4},
+        execution_logs=[{"status": "success", "query_index": 0, "execution_time": 0.2}],
+    )
+
+    attached = executor.attach(analysis_result)
+
+    assert attached.direct_mongodb_results == {"sessions": 4}
+    assert attached.execution_logs == analysis_result.execution_logs
+    metrics = UniversalMongoDBEvaluator().evaluate(attached)
+    assert metrics.execution_success_rate == 1.0
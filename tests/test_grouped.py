@@ -0,0 +1,57 @@
+"""그룹 키 기반 결과 비교 (compare_grouped) 테스트"""
+
+from mongodb_evaluation_system.compare import compare_values
+from mongodb_evaluation_system.grouped import compare_grouped
+
+
+def _session_groups(avg_time, users):
+    # example_with_mcp_integration()의 $group + $addToSet 쿼리 출력 형태
+    return [
+        {"_id": None, "overall_avg_time": avg_time, "total_users": users},
+        {"_id": "mobile", "overall_avg_time": 12.0, "total_users": ["u1", "u5"]},
+    ]
+
+
+def test_add_to_set_list_fields_are_compared_per_element():
+    calculated = _session_groups(25.4, ["u1", "u2", "u3"])
+    expected = _session_groups(24.8, ["u1", "u2", "u4"])
+
+    result = compare_grouped(calculated, expected)
+
+    assert result.n_joined == 2
+    assert result.n_compared == 4
+    assert sorted(zip(result.mismatches["group"], result.mismatches["field"])) == [
+        (None, "overall_avg_time"), (None, "total_users")]
+    assert result.field_stats["total_users"]["n_different"] == 1
+    assert abs(result.max_abs_diff - 0.6) < 1e-9
+
+
+def test_add_to_set_equal_length_lists_match():
+    # 같은 길이의 리스트 값이 2차원 배열로 바뀌어 인덱스가 어긋나지 않아야 함
+    groups = _session_groups(24.8, ["u1", "u2"])
+    assert compare_grouped(groups, [dict(group) for group in groups]).match
+    assert compare_values(groups, groups, group_key="_id").match
+
+
+def test_ragged_numeric_list_fields():
+    calculated = [{"_id": "a", "scores": [1, 2, 3]}, {"_id": "b", "scores": [4]}]
+    expected = [{"_id": "b", "scores": [4]}, {"_id": "a", "scores": [1, 2, 4]}]
+
+    result = compare_grouped(calculated, expected)
+
+    assert list(result.mismatches["group"]) == ["a"]
+    assert list(result.mismatches["field"]) == ["scores"]
+
+
+def test_boolean_group_keys_are_distinct_from_numbers():
+    # MongoDB $group: 1과 1.0은 같은 그룹, true는 다른 그룹
+    calculated = [{"_id": 1, "count": 3}, {"_id": True, "count": 5}]
+    expected = [{"_id": True, "count": 5}, {"_id": 1.0, "count": 3}]
+    result = compare_grouped(calculated, expected)
+    assert result.match
+    assert result.n_joined == 2
+
+    result = compare_grouped([{"_id": True, "count": 5}], [{"_id": 1, "count": 5}])
+    assert result.missing_groups == [1]
+    assert result.extra_groups == [True]
+    assert result.duplicate_groups == []
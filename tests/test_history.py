@@ -0,0 +1,34 @@
+"""추가 전용 평가 이력 (EvaluationHistory) 테스트"""
+
+import pytest
+
+from mongodb_evaluation_system import quick_evaluate
+from mongodb_evaluation_system.history import EvaluationHistory
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = EvaluationHistory(str(tmp_path / "history"))
+    metrics = quick_evaluate("평균 주문 금액", ["db.orders.find({})"], {"average_amount": 1500.5})
+    for day in (1, 2, 3):
+        history.append(metrics, timestamp=f"2024-03-0{day}T00:00:00Z", analysis_query="평균 주문 금액")
+    yield history
+    history.close()
+
+
+def test_range_selects_half_open_interval(history):
+    assert len(history.range()) == 3
+    assert len(history.range("2024-03-02", "2024-03-03")) == 1
+    assert len(history.range(start="2024-03-02T00:00:00Z")) == 2
+
+
+@pytest.mark.parametrize("bounds", [
+    {"start": "not-a-date"},
+    {"end": "2024-13-45"},
+    {"start": ["2024-03-01"]},
+])
+def test_range_rejects_unparseable_bounds(history, bounds):
+    with pytest.raises(ValueError):
+        history.range(**bounds)
+    with pytest.raises(ValueError):
+        history.to_store(**bounds)
@@ -0,0 +1,38 @@
+"""패키지 import 비용 테스트 (지연 로드 회귀 검사)"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# benchmarks.import_time과 같은 예산 (import + 첫 quick_evaluate()가 아닌 import만 측정하므로 여유 있음)
+IMPORT_BUDGET_MS = 150.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import mongodb_evaluation_system
+elapsed = time.perf_counter() - start
+print(json.dumps({"import_ms": elapsed * 1e3,
+                  "loaded": [name for name in ("pandas", "numpy") if name in sys.modules]}))
+"""
+
+
+def _probe():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    output = subprocess.run([sys.executable, "-c", _PROBE], check=True, capture_output=True,
+                            text=True, cwd=ROOT, env=env).stdout
+    return json.loads(output)
+
+
+def test_import_does_not_load_pandas_or_numpy():
+    assert _probe()["loaded"] == []
+
+
+def test_import_time_budget():
+    # 새 인터프리터 3회 중앙값 (첫 실행의 디스크 캐시 영향 완화)
+    import_ms = statistics.median(_probe()["import_ms"] for _ in range(3))
+    assert import_ms < IMPORT_BUDGET_MS
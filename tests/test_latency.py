@@ -0,0 +1,86 @@
+"""지연 시간 스케치와 SLO 테스트"""
+
+import math
+import random
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.latency import LatencySketch, LatencyStats, normalize_slo, slo_violations
+
+
+def _samples(n=5000, seed=3):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(-2.0, 1.5) for _ in range(n)]
+
+
+def _exact_quantile(ordered, q):
+    # 최근접 순위 방식
+    return ordered[max(math.ceil(q * len(ordered)), 1) - 1]
+
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_quantiles_are_within_relative_accuracy(relative_accuracy):
+    values = _samples()
+    ordered = sorted(values)
+    sketch = LatencySketch(relative_accuracy)
+    for value in values:
+        sketch.add(value)
+
+    for q in (0.0, 0.1, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0):
+        exact = _exact_quantile(ordered, q)
+        assert abs(sketch.quantile(q) - exact) <= relative_accuracy * exact * (1 + 1e-9)
+    assert sketch.count == len(values)
+    assert sketch.max == ordered[-1]
+
+
+def test_merge_matches_single_sketch_and_serializes():
+    values = _samples(2000)
+    whole = LatencySketch()
+    parts = [LatencySketch(), LatencySketch()]
+    for i, value in enumerate(values):
+        whole.add(value)
+        parts[i % 2].add(value)
+
+    merged = parts[0].copy().merge(parts[1])
+    assert merged.quantiles() == whole.quantiles()
+    assert LatencySketch.from_dict(merged.to_dict()).quantiles() == whole.quantiles()
+    with pytest.raises(ValueError):
+        whole.merge(LatencySketch(0.05))
+    with pytest.raises(ValueError):
+        whole.add(-1.0)
+
+
+def _logs(times, tool):
+    return [{"status": "success", "tool": tool, "execution_time": t, "query_index": i % 2}
+            for i, t in enumerate(times)]
+
+
+def test_slo_violations_per_tool():
+    stats = LatencyStats.from_logs(_logs([0.1] * 19 + [2.0], "fast") + _logs([0.9] * 20, "slow")
+                                   + [{"tool": "fast", "execution_time": "n/a"}])
+    assert stats.count == 40
+    assert sorted(stats.by_query) == [0, 1]
+
+    slo = normalize_slo({"p95": 1.0})
+    assert slo_violations(stats, slo) == []
+
+    slo = normalize_slo({"fast": {"p99": 1.0}, "*": {"p50": 0.5}})
+    violations = slo_violations(stats, slo)
+    assert [(item["tool"], item["quantile"], item["limit"]) for item in violations] == [
+        ("fast", "p99", 1.0), ("slow", "p50", 0.5)]
+    assert violations[0]["value"] == pytest.approx(2.0, rel=0.01)
+    with pytest.raises(ValueError):
+        normalize_slo({"fast": 1.0, "slow": {"p95": 1}})
+
+
+def test_latency_slo_gates_overall_pass():
+    analysis_result = UniversalAnalysisResult(
+        analysis_query="주문 수", mongodb_queries=["db.o.find({})"], calculation_results={"n": 3},
+        execution_logs=_logs([0.2, 0.3, 1.5], "mongodb_direct"))
+
+    assert UniversalMongoDBEvaluator().evaluate(analysis_result).overall_pass
+    assert UniversalMongoDBEvaluator(latency_slo={"p99": 2.0}).evaluate(analysis_result).overall_pass
+    metrics = UniversalMongoDBEvaluator(latency_slo={"p99": 1.0}).evaluate(analysis_result)
+    assert not metrics.overall_pass
+    assert metrics.latency.tool_quantile("mongodb_direct", 0.99) == pytest.approx(1.5, rel=0.01)
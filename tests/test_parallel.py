@@ -0,0 +1,52 @@
+"""프로세스 풀 병렬 평가 (evaluate_many) 테스트"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.parallel import EvaluationFailure
+
+
+def _record(index: int) -> UniversalAnalysisResult:
+    return UniversalAnalysisResult(
+        analysis_query=f"주문 통계 {index}",
+        mongodb_queries=["db.orders.count()"] if index % 3 == 0 else ["db.orders.find({})"],
+        calculation_results={"order_count": index - 5, "avg": 10.0 + index, "label": f"r{index}"},
+        execution_logs=[{"status": "success"}, {"status": "error", "error": "x"}] if index % 4 == 0 else [],
+        direct_mongodb_results={"order_count": index - 5, "avg": 10.0} if index % 2 == 0 else None,
+    )
+
+
+def _metric_values(metrics):
+    return (metrics.semantic_error_rate, metrics.execution_success_rate, metrics.empty_result_rate,
+            metrics.accuracy_rate, metrics.overall_pass, metrics.comparison_rows.keys,
+            metrics.comparison_rows.llm_values,
+            list(metrics.comparison_rows.statuses))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, 3), (3, 1)])
+def test_results_keep_input_order_and_match_evaluate(workers, chunk_size):
+    evaluator = UniversalMongoDBEvaluator()
+    records = [_record(index) for index in range(20)]
+    ground_truths = [{"avg": 10.0 + index} if index % 5 == 1 else None for index in range(20)]
+
+    results = evaluator.evaluate_many(records, ground_truths, workers=workers, chunk_size=chunk_size)
+
+    assert len(results) == len(records)
+    for record, ground_truth, metrics in zip(records, ground_truths, results):
+        assert _metric_values(metrics) == _metric_values(evaluator.evaluate(record, ground_truth))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_record_is_reported_without_aborting(workers):
+    records = [_record(index) for index in range(6)]
+    records[2] = UniversalAnalysisResult(analysis_query="깨진 레코드", mongodb_queries=[],
+                                         calculation_results=None, execution_logs=[])
+
+    results = UniversalMongoDBEvaluator().evaluate_many(records, workers=workers, chunk_size=2)
+
+    failure = results[2]
+    assert isinstance(failure, EvaluationFailure)
+    assert failure.index == 2
+    assert failure.error_type == "TypeError"
+    assert "Traceback" in failure.traceback
+    assert not any(isinstance(result, EvaluationFailure) for index, result in enumerate(results) if index != 2)
@@ -0,0 +1,88 @@
+"""사용자 정의 지표 플러그인 판정 테스트"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.core import DEFAULT_THRESHOLDS
+from mongodb_evaluation_system.plugins import (MetricRegistry, MetricInputs, execution_time_metric,
+                                               key_coverage_metric)
+
+
+def _analysis_result():
+    # 핵심 지표는 모두 통과, 키 커버리지 2/3, 실행 시간 합계 1.5초
+    return UniversalAnalysisResult(
+        analysis_query="주문 통계", mongodb_queries=["db.o.find({})"],
+        calculation_results={"n": 10, "avg": 2.5},
+        execution_logs=[{"status": "success", "execution_time": 1.0},
+                        {"status": "success", "execution_time": 0.5}],
+        direct_mongodb_results={"n": 10, "avg": 2.5, "max": 9})
+
+
+def _evaluate(*plugins, **thresholds):
+    evaluator = UniversalMongoDBEvaluator(thresholds=dict(DEFAULT_THRESHOLDS, **thresholds),
+                                          metric_plugins=MetricRegistry(plugins))
+    return evaluator, evaluator.evaluate(_analysis_result())
+
+
+def test_plugin_values_and_gating():
+    _, metrics = _evaluate()
+    assert metrics.overall_pass and metrics.custom_metrics is None
+
+    _, metrics = _evaluate(key_coverage_metric(0.9), execution_time_metric(budget=2.0))
+    assert metrics.custom_metrics == pytest.approx({"key_coverage": 2 / 3, "execution_time": 1.5})
+    assert not metrics.overall_pass
+
+    # gate=False 지표는 값만 기록하고 판정에는 넣지 않음
+    _, metrics = _evaluate(key_coverage_metric(0.9, gate=False), execution_time_metric(budget=2.0))
+    assert metrics.overall_pass
+
+    _, metrics = _evaluate(execution_time_metric(budget=1.0))
+    assert not metrics.overall_pass
+
+
+def test_evaluator_thresholds_override_plugin_threshold():
+    evaluator, metrics = _evaluate(key_coverage_metric(0.9), key_coverage=0.5)
+    assert metrics.overall_pass
+    assert "| key_coverage | 0.6667 | ≥0.5 | ✅ |" in evaluator.generate_comprehensive_report(
+        metrics, _analysis_result())
+
+    _, metrics = _evaluate(execution_time_metric(budget=2.0), execution_time=1.0)
+    assert not metrics.overall_pass
+
+    # 임계값이 없으면 판정하지 않음
+    _, metrics = _evaluate(execution_time_metric())
+    assert metrics.overall_pass
+
+
+def test_batch_matches_evaluate():
+    evaluator, metrics = _evaluate(key_coverage_metric(0.9), execution_time_metric(budget=2.0),
+                                   key_coverage=0.5)
+    frame = evaluator.evaluate_batch([_analysis_result()])
+    row = frame.iloc[0]
+    assert row["key_coverage"] == pytest.approx(metrics.custom_metrics["key_coverage"])
+    assert row["execution_time"] == pytest.approx(metrics.custom_metrics["execution_time"])
+    assert bool(row["overall_pass"]) == metrics.overall_pass
+
+
+def _seen_inputs(inputs: MetricInputs) -> float:
+    assert inputs.analysis_query == "주문 통계"
+    assert inputs.calculation_results is None and inputs.execution_logs is None
+    return 1.0
+
+
+def test_only_declared_inputs_are_filled():
+    registry = MetricRegistry()
+    registry.register("seen", _seen_inputs, inputs=("analysis_query",))
+    evaluator = UniversalMongoDBEvaluator(metric_plugins=registry)
+    assert evaluator.evaluate(_analysis_result()).custom_metrics == {"seen": 1.0}
+
+
+def test_registry_rejects_invalid_plugins():
+    registry = MetricRegistry([key_coverage_metric()])
+    with pytest.raises(ValueError):
+        registry.add(key_coverage_metric())
+    with pytest.raises(ValueError):
+        registry.register("accuracy", _seen_inputs)
+    with pytest.raises(ValueError):
+        registry.register("bad_input", _seen_inputs, inputs=("results",))
+    assert [plugin.name for plugin in registry] == ["key_coverage"]
@@ -0,0 +1,63 @@
+"""단계별 시간 측정 테스트"""
+
+import json
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.profiling import Profiler, PrometheusSink, SpanFileSink
+
+EVALUATE_STAGES = ["result_profile", "semantic_error", "execution_success"]
+
+
+def _analysis_result():
+    return UniversalAnalysisResult(analysis_query="주문 수", mongodb_queries=["db.o.find({})", "db.o.count()"],
+                                   calculation_results={"n": 10, "avg": 2.5},
+                                   execution_logs=[{"status": "success"}],
+                                   direct_mongodb_results={"n": 10, "avg": 3.0})
+
+
+def test_stage_timings_are_attached_without_changing_metrics():
+    plain = UniversalMongoDBEvaluator().evaluate(_analysis_result())
+    assert plain.stage_timings is None
+
+    spans = []
+    evaluator = UniversalMongoDBEvaluator(profiler=Profiler([spans.append]), comparison_mode="eager")
+    metrics = evaluator.evaluate(_analysis_result())
+
+    assert (metrics.accuracy_rate, metrics.overall_pass) == (plain.accuracy_rate, plain.overall_pass)
+    assert set(EVALUATE_STAGES + ["comparison_table"]) <= set(metrics.stage_timings)
+    assert all(timing.wall_seconds >= 0 and timing.cpu_seconds >= 0
+               for timing in metrics.stage_timings.values())
+    [span] = spans
+    assert span.name == "evaluate"
+    assert span.attributes == {"queries": 2}
+    assert span.wall_seconds >= sum(timing.wall_seconds for timing in span.stages)
+
+
+def test_detached_profiler_only_feeds_sinks():
+    sink = PrometheusSink()
+    evaluator = UniversalMongoDBEvaluator(profiler=Profiler([sink], attach=False))
+    for _ in range(3):
+        metrics = evaluator.evaluate(_analysis_result())
+    evaluator.generate_comprehensive_report(metrics, _analysis_result())
+
+    assert metrics.stage_timings is None
+    text = sink.exposition()
+    assert "# TYPE mongodb_evaluation_stage_seconds summary" in text
+    assert 'mongodb_evaluation_stage_seconds_count{span="evaluate",stage="total",clock="wall"} 3' in text
+    assert 'mongodb_evaluation_stage_seconds_count{span="evaluate",stage="semantic_error",clock="cpu"} 3' in text
+    assert 'span="comprehensive_report",stage="format"' in text
+
+
+def test_span_file_sink_writes_parent_and_stage_spans(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    profiler = Profiler([SpanFileSink(str(path))])
+    UniversalMongoDBEvaluator(profiler=profiler).evaluate(_analysis_result())
+    profiler.close()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    root, stages = records[0], records[1:]
+    assert root["name"] == "evaluate" and root["parentSpanId"] == ""
+    assert [record["name"] for record in stages][:3] == [f"evaluate.{stage}" for stage in EVALUATE_STAGES]
+    assert all(record["traceId"] == root["traceId"] and record["parentSpanId"] == root["spanId"]
+               for record in stages)
+    assert all(record["startTimeUnixNano"] <= record["endTimeUnixNano"] for record in records)
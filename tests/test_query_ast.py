@@ -0,0 +1,57 @@
+"""쿼리 AST 파싱 (parse_query)과 AST 규칙 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from mongodb_evaluation_system.executor import AggregationExecutor
+from mongodb_evaluation_system.query_ast import parse_query
+from mongodb_evaluation_system.rules import check_self_comparison
+from mongodb_evaluation_system.shell import SHELL_NOW, parse_shell_query, resolve_now
+
+
+@pytest.mark.parametrize("query, flagged", [
+    # 쿼리 필터의 "$a"는 문자열 리터럴
+    ("db.c.find({a: '$a'})", False),
+    ("db.c.find({a: {$eq: '$a'}})", False),
+    ("db.c.find({$expr: {$eq: ['$a', '$a']}})", True),
+    ("db.c.find({$or: [{b: 1}, {$expr: {$lt: ['$b', '$b']}}]})", True),
+    ("db.c.aggregate([{$project: {same: {$ne: ['$a', '$a']}}}])", True),
+    ("db.c.find({$where: 'this.a == this.a'})", True),
+    ("db.c.find({$expr: {$eq: ['$a', '$b']}})", False),
+])
+def test_self_comparison_only_in_expression_contexts(query, flagged):
+    assert (check_self_comparison(parse_query(query)) is not None) == flagged
+
+
+@pytest.mark.parametrize("query", [{}, ["db.c.find()"], None])
+def test_non_string_query_returns_error_ast(query):
+    ast = parse_query(query)
+    assert ast.error is not None
+    assert not ast.stages
+
+
+def test_deeply_nested_query_returns_error_ast():
+    depth = 5000
+    ast = parse_query("db.c.find(" + "{a: " * depth + "1" + "}" * depth + ")")
+    assert ast.error is not None
+
+
+@pytest.mark.parametrize("constructor", ["Date()", "new Date()", "ISODate()"])
+def test_date_without_arguments_is_resolved_at_execution(constructor):
+    query = f"db.events.find({{at: {{$lt: {constructor}}}}})"
+    # 캐시된 AST에는 시각 대신 표식이 남음
+    assert parse_query(query).stages[0].spec == {"at": {"$lt": SHELL_NOW}}
+    assert parse_query(query).stages[0].spec == {"at": {"$lt": SHELL_NOW}}
+
+    before = datetime.now()
+    resolved = resolve_now(parse_shell_query(query))
+    assert before <= resolved.args[0]["at"]["$lt"] <= datetime.now()
+
+    executor = AggregationExecutor({"events": [{"at": datetime(2000, 1, 1)}, {"at": datetime(2999, 1, 1)}]})
+    assert len(executor.run(query)) == 1
+
+
+def test_resolve_now_keeps_values_without_marker():
+    shell_query = parse_shell_query("db.c.find({at: ISODate('2024-01-01T00:00:00Z')})")
+    assert resolve_now(shell_query) is shell_query
@@ -0,0 +1,78 @@
+"""ReportWriter 출력 테스트"""
+
+import io
+import math
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.report import ReportWriter, relative_difference
+
+
+def _runs():
+    return [
+        UniversalAnalysisResult(analysis_query="매출 <요약>", mongodb_queries=["db.x.find({})"],
+                                calculation_results={"a": 1, "b": 10, "c": 100, "d": 5},
+                                execution_logs=[{"status": "success", "execution_time": 0.5}],
+                                direct_mongodb_results={"a": 1, "b": 11, "c": 150, "d": 0}),
+        UniversalAnalysisResult(analysis_query="주문 수", mongodb_queries=["db.y.find({})"],
+                                calculation_results={"n": 3}, execution_logs=[],
+                                direct_mongodb_results={"n": 3}),
+    ]
+
+
+def _report(output_format="markdown", **kwargs):
+    evaluator = UniversalMongoDBEvaluator()
+    stream = io.StringIO()
+    with ReportWriter(stream, evaluator, output_format=output_format, top_k=2, **kwargs) as report:
+        for analysis_result in _runs():
+            report.write_run(evaluator.evaluate(analysis_result), analysis_result)
+    return stream.getvalue(), report
+
+
+def test_markdown_report_keeps_top_k_mismatches():
+    text, report = _report()
+
+    assert text.startswith("# MongoDB 분석 일괄 평가 결과\n")
+    assert "## 실행 0: ❌ FAIL" in text
+    assert "## 실행 1: ✅ PASS" in text
+    assert "비교 4개 지표: 일치 1, 불일치 3, LLM 누락 0, N/A 0 (상대 차이 상위 2개 불일치만 표시)" in text
+    # 상대 차이 순: d (0 대비 차이) > c (33%) > b (9%)
+    assert "| d | 5 | 0 | 5.00 | ∞ |\n| c | 100 | 150 | 50.00 (33.3%) | 33.3% |\n\n" in text
+    assert "| b |" not in text
+
+    summary = text[text.index("## 코퍼스 요약"):]
+    assert "실행 2건, PASS 1건, FAIL 1건 (통과율 50.0%)" in summary
+    assert "| 정답 일치율 | 62.50% | ≥90.00% | 1 |" in summary
+    assert "비교 지표: 일치 2, 불일치 3, LLM 누락 0, N/A 0" in summary
+    assert "| 0 | d | 5 | 0 | 5.00 | ∞ |" in summary
+    assert "| 전체 | 1 | 0.500s | 0.500s | 0.500s | 0.500s |" in summary
+    assert (report.runs, report.passed) == (2, 1)
+
+
+def test_summary_only_html_report_is_escaped():
+    text, _ = _report("html", include_runs=False, title="매출 & <주문>")
+
+    assert text.startswith("<!DOCTYPE html>")
+    assert text.endswith("</body>\n</html>\n")
+    assert "<title>매출 &amp; &lt;주문&gt;</title>" in text
+    assert "실행 0" not in text
+    assert "<h2>코퍼스 요약</h2>" in text
+    assert "<td>d</td><td>5</td><td>0</td><td>5.00</td><td>∞</td>" in text
+
+
+def test_closed_report_rejects_runs():
+    _, report = _report()
+    analysis_result = _runs()[1]
+    with pytest.raises(ValueError):
+        report.write_run(UniversalMongoDBEvaluator().evaluate(analysis_result), analysis_result)
+    with pytest.raises(ValueError):
+        ReportWriter(io.StringIO(), output_format="pdf")
+
+
+def test_relative_difference():
+    assert relative_difference(100, 150) == pytest.approx(1 / 3)
+    assert relative_difference(5, 0) == math.inf
+    assert relative_difference(0, 0) == 0.0
+    assert relative_difference("a", 1) == math.inf
+    assert relative_difference([1, 2, 3, 4], [1, 2, 3, 5]) == pytest.approx(0.25)
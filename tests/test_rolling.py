@@ -0,0 +1,70 @@
+"""RollingMetrics 윈도우 테스트"""
+
+import random
+
+import pytest
+
+from mongodb_evaluation_system.rolling import RollingMetrics
+
+
+def _runs(n, seed=7):
+    rng = random.Random(seed)
+    return [(rng.random() * 0.3, rng.random(), rng.random() * 0.5, rng.random(), rng.random() < 0.5)
+            for _ in range(n)]
+
+
+def test_count_window_matches_mean_of_last_runs():
+    runs = _runs(57)
+    rolling = RollingMetrics(window_runs=(10,), window_seconds=())
+    for i, run in enumerate(runs):
+        rolling.update_values(*run, timestamp=float(i))
+
+        recent = runs[max(0, i - 9):i + 1]
+        snapshot = rolling.snapshot(now=float(i))["last_10_runs"]
+        assert snapshot.count == len(recent)
+        assert snapshot.accuracy_rate == pytest.approx(sum(r[3] for r in recent) / len(recent))
+        assert snapshot.pass_rate == pytest.approx(sum(r[4] for r in recent) / len(recent))
+
+    total = rolling.snapshot(now=56.0)["total"]
+    assert total.count == 57
+    assert total.semantic_error_rate == pytest.approx(sum(r[0] for r in runs) / 57)
+
+
+def test_time_window_drops_expired_buckets_and_late_runs():
+    rolling = RollingMetrics(window_runs=(), window_seconds=(60,), buckets=6)
+    rolling.update_values(0.0, 1.0, 0.0, 0.2, False, timestamp=5)
+    rolling.update_values(0.0, 1.0, 0.0, 0.8, True, timestamp=65)
+    rolling.update_values(0.0, 1.0, 0.0, 1.0, True, timestamp=95)
+
+    snapshot = rolling.snapshot(now=100)["last_60s"]
+    assert snapshot.count == 2
+    assert snapshot.accuracy_rate == pytest.approx(0.9)
+    assert (snapshot.start, snapshot.end) == (50, 110)
+
+    # 윈도우보다 오래된 실행은 집계하지 않음
+    rolling.update_values(0.0, 1.0, 0.0, 0.0, False, timestamp=10)
+    assert rolling.late_runs == 1
+    assert rolling.snapshot(now=100)["last_60s"].count == 2
+    assert rolling.snapshot(now=100)["total"].count == 4
+
+
+def test_tumbling_runs_close_and_notify():
+    closed = []
+    rolling = RollingMetrics(window_runs=(), window_seconds=(), tumbling_runs=(3,),
+                             on_window_closed=closed.append)
+    for accuracy in (0.3, 0.6, 0.9, 1.0):
+        rolling.update_values(0.0, 1.0, 0.0, accuracy, accuracy >= 0.7, timestamp=0)
+
+    assert [snapshot.count for snapshot in closed] == [3]
+    assert closed[0].accuracy_rate == pytest.approx(0.6)
+    assert closed[0].pass_rate == pytest.approx(1 / 3)
+    assert closed[0].overall_pass is False
+    assert rolling.closed_windows("every_3_runs") == closed
+    assert rolling.snapshot(now=0)["every_3_runs"].count == 1
+
+
+def test_invalid_window_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        RollingMetrics(window_runs=(0,))
+    with pytest.raises(ValueError):
+        RollingMetrics(window_seconds=(0,))
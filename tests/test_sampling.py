@@ -0,0 +1,69 @@
+"""표본 기반 정답 일치율 추정 (AccuracySampling) 테스트"""
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.sampling import AccuracySampling
+
+
+def _result(calculation_results, direct_results):
+    return UniversalAnalysisResult(analysis_query="그룹별 합계", mongodb_queries=[],
+                                   calculation_results=calculation_results, execution_logs=[],
+                                   direct_mongodb_results=direct_results)
+
+
+def _keyed(n_keys, wrong_every):
+    # 키 n_keys개 중 wrong_every번째마다 불일치
+    calculated = {f"k{i}": float(i) for i in range(n_keys)}
+    expected = {f"k{i}": float(i) + (1.0 if i % wrong_every == 0 else 0.0) for i in range(n_keys)}
+    return _result(calculated, expected)
+
+
+def test_same_seed_gives_same_estimate():
+    analysis_result = _keyed(5000, wrong_every=10)
+    sampling = AccuracySampling(seed=7, max_samples=1000)
+    first = UniversalMongoDBEvaluator(accuracy_sampling=sampling).evaluate(analysis_result)
+    second = UniversalMongoDBEvaluator(accuracy_sampling=sampling).evaluate(analysis_result)
+    assert first.accuracy_estimate == second.accuracy_estimate
+    assert first.comparison_rows.keys == second.comparison_rows.keys
+
+    other = UniversalMongoDBEvaluator(accuracy_sampling=AccuracySampling(seed=8, max_samples=1000))
+    assert other.evaluate(analysis_result).comparison_rows.keys != first.comparison_rows.keys
+
+
+def test_early_stop_when_interval_clears_threshold():
+    evaluator = UniversalMongoDBEvaluator(accuracy_sampling=AccuracySampling())
+
+    passing = evaluator.evaluate(_keyed(10000, wrong_every=1000)).accuracy_estimate
+    assert passing.decided is True
+    assert passing.sampled < passing.population
+    assert passing.lower >= 0.9
+
+    failing = evaluator.evaluate(_keyed(10000, wrong_every=2)).accuracy_estimate
+    assert failing.decided is False
+    assert failing.sampled < failing.population
+    assert failing.upper < 0.9
+    # 표본으로 비교한 키만 비교 원본 쌍에 포함
+    assert len(evaluator.evaluate(_keyed(10000, wrong_every=2)).comparison_rows) == failing.sampled
+
+
+def test_small_population_uses_exact_comparison():
+    analysis_result = _keyed(500, wrong_every=4)
+    sampled = UniversalMongoDBEvaluator(accuracy_sampling=AccuracySampling(min_population=2000))
+    metrics = sampled.evaluate(analysis_result)
+    assert metrics.accuracy_estimate is None
+    assert metrics.accuracy_rate == UniversalMongoDBEvaluator().evaluate(analysis_result).accuracy_rate == 0.75
+    assert len(metrics.comparison_rows) == 500
+
+
+def test_element_sampled_list_key_has_comparison_row():
+    evaluator = UniversalMongoDBEvaluator(accuracy_sampling=AccuracySampling())
+    metrics = evaluator.evaluate(_result({"big": list(range(3000)), "a": 1},
+                                         {"big": list(range(3000)), "a": 1}))
+    assert metrics.accuracy_estimate is not None
+    assert metrics.comparison_rows.matched_keys == ["big", "a"]
+
+    expected = list(range(3000))
+    expected[::3] = [-1] * 1000
+    metrics = evaluator.evaluate(_result({"big": list(range(3000)), "a": 1}, {"big": expected, "a": 1}))
+    assert metrics.comparison_rows.keys == ["big", "a"]
+    assert metrics.comparison_rows.mismatched_keys == ["big"]
+    assert metrics.comparison_table["차이"].iloc[0].startswith("1000/3000")
@@ -0,0 +1,191 @@
+"""로컬 평가 서버 (EvaluationServer / EvaluationClient) 테스트"""
+
+import http.client
+import os
+import socket
+import threading
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, quick_evaluate
+from mongodb_evaluation_system.server import (EvaluationClient, EvaluationServer, EvaluationServerError,
+                                              MicroBatcher)
+
+
+def _record(index: int = 0) -> UniversalAnalysisResult:
+    return UniversalAnalysisResult(
+        analysis_query="월별 평균 주문 금액과 주문 수를 계산해주세요",
+        mongodb_queries=["db.orders.aggregate([{$group: {_id: '$month', avg: {$avg: '$amount'}}}])"],
+        calculation_results={"average_amount": 1500.5 + index, "order_count": 120, "top_month": "2024-03"},
+        execution_logs=[{"tool": "aggregate", "success": True, "execution_time": 0.12},
+                        {"tool": "find", "success": index % 2 == 0, "execution_time": 0.05}],
+        direct_mongodb_results={"average_amount": 1500.5, "order_count": 121, "top_month": "2024-03"},
+    )
+
+
+def _metric_values(metrics):
+    return (metrics.semantic_error_rate, metrics.execution_success_rate, metrics.empty_result_rate,
+            metrics.accuracy_rate, metrics.overall_pass)
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server(request, tmp_path):
+    batcher = MicroBatcher(max_batch_size=16, max_wait=0.05)
+    if request.param == "unix":
+        server = EvaluationServer(batcher, unix_path=str(tmp_path / "evaluation.sock"))
+    else:
+        server = EvaluationServer(batcher, port=0)
+    with server:
+        yield server
+
+
+def test_results_match_quick_evaluate(server):
+    client = EvaluationClient(server.address)
+    try:
+        for index in range(3):
+            record = _record(index)
+            metrics = client.evaluate(record)
+            expected = quick_evaluate(record.analysis_query, record.mongodb_queries,
+                                      record.calculation_results, record.execution_logs,
+                                      record.direct_mongodb_results)
+            assert _metric_values(metrics) == _metric_values(expected)
+            assert metrics.comparison_rows.keys == expected.comparison_rows.keys
+            assert metrics.comparison_rows.statuses == expected.comparison_rows.statuses
+    finally:
+        client.close()
+
+
+def test_concurrent_requests_are_batched(server):
+    client = EvaluationClient(server.address)
+    start = threading.Barrier(12)
+    results = [None] * 12
+
+    def call(index):
+        start.wait()
+        results[index] = client.evaluate(_record(index))
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    client.close()
+
+    assert all(result is not None for result in results)
+    stats = server.batcher.stats()
+    assert stats["evaluated"] == 12
+    assert stats["mean_batch_size"] > 1
+
+
+class _BlockingEvaluator:
+    """첫 evaluate() 호출을 release까지 붙잡는 평가기"""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def evaluate(self, analysis_result, ground_truth=None):
+        self.entered.set()
+        self.release.wait(30)
+        return quick_evaluate(analysis_result.analysis_query, analysis_result.mongodb_queries,
+                              analysis_result.calculation_results)
+
+
+def test_full_queue_returns_503():
+    evaluator = _BlockingEvaluator()
+    batcher = MicroBatcher(evaluator, max_batch_size=1, max_wait=0, max_queue=1)
+    with EvaluationServer(batcher, port=0) as server:
+        client = EvaluationClient(server.address)
+        background = [threading.Thread(target=client.evaluate, args=(_record(),)) for _ in range(2)]
+        try:
+            # 첫 요청은 평가 중, 두 번째 요청은 대기열을 채움
+            background[0].start()
+            assert evaluator.entered.wait(10)
+            background[1].start()
+            for _ in range(1000):
+                if batcher.stats()["queue_depth"] == 1:
+                    break
+                threading.Event().wait(0.01)
+            assert batcher.stats()["queue_depth"] == 1
+
+            with pytest.raises(EvaluationServerError) as error:
+                client.evaluate(_record())
+            assert error.value.status == 503
+            assert batcher.stats()["rejected"] == 1
+        finally:
+            evaluator.release.set()
+            for thread in background:
+                thread.join(30)
+            client.close()
+
+
+def test_request_timeout_returns_504():
+    evaluator = _BlockingEvaluator()
+    batcher = MicroBatcher(evaluator, max_batch_size=1, max_wait=0)
+    with EvaluationServer(batcher, port=0, request_timeout=0.1) as server:
+        client = EvaluationClient(server.address)
+        try:
+            with pytest.raises(EvaluationServerError) as error:
+                client.evaluate(_record())
+            assert error.value.status == 504
+        finally:
+            evaluator.release.set()
+            client.close()
+
+
+def _post(server, body: bytes, headers=None):
+    host, port = server.address[len("http://"):].split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=10)
+    try:
+        connection.putrequest("POST", "/evaluate")
+        for name, value in (headers or {"Content-Length": str(len(body))}).items():
+            connection.putheader(name, value)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("body, headers", [
+    (b"{not json", None),
+    (b"[1, 2, 3]", None),
+    (b'{"mongodb_queries": []}', None),
+    ('{"analysis_query": "평균"}'.encode("euc-kr"), None),
+    (b"{}", {"Content-Length": "abc"}),
+    (b"{}", {"Content-Length": "-5"}),
+])
+def test_bad_record_returns_400(body, headers):
+    with EvaluationServer(port=0) as server:
+        status, _ = _post(server, body, headers)
+        assert status == 400
+        # 잘못된 요청 뒤에도 서버는 계속 응답
+        client = EvaluationClient(server.address)
+        assert client.health()
+        client.close()
+
+
+def test_unix_socket_path_keeps_regular_file(tmp_path):
+    path = tmp_path / "not-a-socket"
+    path.write_text("data")
+    with pytest.raises(FileExistsError):
+        EvaluationServer(unix_path=str(path))
+    assert path.read_text() == "data"
+
+
+def test_unix_socket_is_removed_on_close(tmp_path):
+    path = str(tmp_path / "evaluation.sock")
+    with EvaluationServer(unix_path=path):
+        assert os.path.exists(path)
+    assert not os.path.exists(path)
+
+
+def test_stale_unix_socket_is_replaced(tmp_path):
+    path = str(tmp_path / "evaluation.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()   # 소켓 파일만 남음
+    with EvaluationServer(unix_path=path) as server:
+        client = EvaluationClient(server.address)
+        assert client.health()
+        client.close()
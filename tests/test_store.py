@@ -0,0 +1,88 @@
+"""ResultsStore 저장/복원 테스트"""
+
+import pytest
+
+from mongodb_evaluation_system import UniversalAnalysisResult, UniversalMongoDBEvaluator
+from mongodb_evaluation_system.store import ResultsStore
+
+FIELDS = ("semantic_error_rate", "execution_success_rate", "empty_result_rate", "accuracy_rate", "overall_pass")
+
+
+def _runs():
+    return [
+        UniversalAnalysisResult(analysis_query="매출", mongodb_queries=["db.s.find({})"],
+                                calculation_results={"total": 100, "avg": 2.5}, execution_logs=[],
+                                direct_mongodb_results={"total": 100, "avg": 3.0},
+                                timestamp="2024-01-01T00:00:00"),
+        UniversalAnalysisResult(analysis_query="주문", mongodb_queries=["db.o.count()"],
+                                calculation_results={"n": -1, "city": "Seoul"},
+                                execution_logs=[{"status": "error", "error": "boom"}],
+                                timestamp="2024-01-02T00:00:00"),
+        UniversalAnalysisResult(analysis_query="매출", mongodb_queries=["db.s.find({})"],
+                                calculation_results={"total": 100, "months": [1, 2]}, execution_logs=[],
+                                direct_mongodb_results={"total": 100, "months": [1, 2], "extra": {"a": 1}},
+                                timestamp="2024-01-03T00:00:00"),
+    ]
+
+
+def _store():
+    evaluator = UniversalMongoDBEvaluator()
+    results = _runs()
+    metrics = [evaluator.evaluate(result) for result in results]
+    store = ResultsStore(capacity=1)   # 용량 증가 경로 포함
+    store.extend(metrics, results)
+    return store, metrics
+
+
+def _same(restored, original):
+    assert tuple(getattr(restored, name) for name in FIELDS) == tuple(getattr(original, name) for name in FIELDS)
+    assert restored.comparison_table.values.tolist() == original.comparison_table.values.tolist()
+
+
+def test_round_trip_restores_metrics_and_comparisons():
+    store, metrics = _store()
+
+    assert len(store) == 3
+    for restored, original in zip(store, metrics):
+        _same(restored, original)
+    _same(store[-1], metrics[2])
+    assert [store.query_of(i) for i in range(3)] == ["매출", "주문", "매출"]
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_select_keeps_matching_comparison_pairs():
+    store, metrics = _store()
+
+    failing = store.failing()
+    assert [bool(flag) for flag in store.column("overall_pass")] == [m.overall_pass for m in metrics]
+    expected = [m for m in metrics if not m.overall_pass]
+    assert len(failing) == len(expected)
+    for restored, original in zip(failing, expected):
+        _same(restored, original)
+
+    late = store.select(store.mask(query="매출", since="2024-01-02"))
+    assert len(late) == 1
+    _same(late[0], metrics[2])
+
+
+def test_group_by_query():
+    store, metrics = _store()
+    groups = store.group_by_query()
+
+    assert list(groups["query"]) == ["매출", "주문"]
+    assert list(groups["runs"]) == [2, 1]
+    assert list(groups["failed"]) == [sum(not m.overall_pass for m in (metrics[0], metrics[2])),
+                                      int(not metrics[1].overall_pass)]
+    assert groups["accuracy_rate"][0] == pytest.approx((metrics[0].accuracy_rate + metrics[2].accuracy_rate) / 2)
+
+
+def test_without_comparisons_keeps_only_metrics():
+    evaluator = UniversalMongoDBEvaluator()
+    results = _runs()
+    store = ResultsStore(keep_comparisons=False)
+    store.extend(evaluator.evaluate(result) for result in results)
+
+    assert store[0].comparison_rows is None
+    assert store[0].accuracy_rate == evaluator.evaluate(results[0]).accuracy_rate
+    assert store.query_of(0) is None
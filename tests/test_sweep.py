@@ -0,0 +1,76 @@
+"""임계값 스윕 (sweep_thresholds) 테스트"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from mongodb_evaluation_system.sweep import sweep_thresholds
+
+GRID = {
+    "semantic_error": [0.0, 0.1, 0.3],
+    "execution_success": [0.5, 0.8, 1.0],
+    "empty_result": [0.0, 0.2, 0.5],
+    "accuracy": [0.6, 0.9, 0.95, 1.0],
+    "key_coverage": [0.5, 0.9],
+}
+
+
+def _random_metrics(n_runs=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    data = {
+        "semantic_error_rate": rng.choice([0.0, 0.1, 0.2, 0.5], n_runs),
+        "execution_success_rate": rng.choice([0.5, 0.75, 0.8, 1.0], n_runs),
+        "empty_result_rate": rng.random(n_runs) * 0.6,
+        "accuracy_rate": rng.random(n_runs),
+        "key_coverage": rng.random(n_runs),
+    }
+    for column in data:
+        # 지표마다 일부 실행은 NaN (항상 미달)
+        data[column][rng.random(n_runs) < 0.02] = np.nan
+    return data
+
+
+def test_pass_rate_matches_brute_force():
+    data = _random_metrics()
+    sweep = sweep_thresholds(data, GRID, higher_is_better={"key_coverage": True})
+
+    for combination in itertools.product(*GRID.values()):
+        thresholds = dict(zip(GRID, combination))
+        # NaN과의 비교는 False라 미달
+        passed = ((data["semantic_error_rate"] <= thresholds["semantic_error"])
+                  & (data["execution_success_rate"] >= thresholds["execution_success"])
+                  & (data["empty_result_rate"] <= thresholds["empty_result"])
+                  & (data["accuracy_rate"] >= thresholds["accuracy"])
+                  & (data["key_coverage"] >= thresholds["key_coverage"]))
+        assert sweep.pass_rate_at(**thresholds) == pytest.approx(passed.mean()), thresholds
+
+
+def _hand_built():
+    return sweep_thresholds({
+        "semantic_error_rate": [0.0, 0.0, 0.0, 0.0],
+        "execution_success_rate": [1.0, 1.0, 1.0, 1.0],
+        "empty_result_rate": [0.0, 0.0, 0.3, 0.0],
+        "accuracy_rate": [1.0, 0.85, 0.95, 0.5],
+    }, {"accuracy": [0.8, 0.9], "empty_result": [0.2, 0.4]})
+
+
+def test_binding_constraint_on_hand_built_case():
+    sweep = _hand_built()
+    assert sweep.pass_rate_at(accuracy=0.9, empty_result=0.2) == 0.25
+    assert sweep.pass_rate_at(accuracy=0.8, empty_result=0.4) == 0.75
+
+    frame = sweep.to_dataframe().set_index(["accuracy", "empty_result"])
+    # accuracy 0.9 / empty_result 0.2: accuracy 단독 미달 2건, empty_result 단독 미달 1건
+    assert frame.loc[(0.9, 0.2), "binding_constraint"] == "accuracy"
+    assert frame.loc[(0.8, 0.4), "binding_constraint"] == "accuracy"
+    assert frame.loc[(0.9, 0.4), "pass_count"] == 2
+
+
+def test_best_picks_strictest_combination():
+    sweep = _hand_built()
+    assert sweep.best(0.6) == {"semantic_error": 0.1, "execution_success": 0.8,
+                               "empty_result": 0.4, "accuracy": 0.8}
+    assert sweep.best(0.25)["accuracy"] == 0.9
+    assert sweep.best(0.25)["empty_result"] == 0.2
+    assert sweep.best(0.9) == {}